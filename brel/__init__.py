@@ -2,9 +2,12 @@ from brel.qnames.qname import QName
 
 from .brel_context import Context
 from .brel_fact import Fact
+from .brel_fact_query import FactQuery
+from .brel_fact_matrix import FactMatrix
 
 from .brel_component import Component
 
 from .brel_filing import Filing
+from .brel_filing_batch import FilingResult
 
 # from brel.utils import *
@@ -31,7 +31,7 @@ Read more about Aspects and Characteristics in
 ====================
 """
 
-from typing import Dict, List, Optional, cast
+from typing import Dict, Hashable, List, Optional, Tuple, cast
 
 from brel.characteristics import (
     Aspect,
@@ -41,6 +41,7 @@ from brel.characteristics import (
     PeriodCharacteristic,
     UnitCharacteristic,
 )
+from brel.reportelements.i_report_element import IReportElement
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -52,16 +53,26 @@ class Context:
     The only required aspect is the concept.
     All aspects can only be present once.
     Dimensions are custom aspects, so they can be present multiple times as long as they represent different dimensions.
+    Two contexts are equal if they have the same characteristics. Contexts are hashable, so they can be used as dict keys.
     """
 
-    def __init__(self, context_id: str) -> None:
+    __slots__ = ("__id", "__base", "__characteristics", "__aspects", "__key")
+
+    def __init__(self, context_id: str, base: Optional["Context"] = None) -> None:
+        """
+        :param context_id: The id of the context.
+        :param base: An optional context whose characteristics are shared by this context.
+        The base context is not copied, so it must not be modified once other contexts are layered on top of it.
+        """
         self.__id: str = context_id
+        self.__base: Optional[Context] = base
 
-        # aspects are the axis, characteristics are the values per axis
-        self.__aspects: list[Aspect] = []
+        # aspects are the axis, characteristics are the values per axis.
+        # only the characteristics of this layer are stored, the rest is looked up in the base context.
         self.__characteristics: dict[Aspect, ICharacteristic] = {}
-
-        self.__aspects.sort(key=lambda aspect: aspect.get_name())
+        # sorted aspects and the equality key are computed on first use and reset when a characteristic is added
+        self.__aspects: Optional[Tuple[Aspect, ...]] = None
+        self.__key: Optional[Tuple[Tuple[str, Hashable], ...]] = None
 
     # First class citizens
     def get_aspects(self) -> list[Aspect]:
@@ -69,6 +80,20 @@ class Context:
         Get all aspects of the context.
         :returns list[Aspect]: The aspects of the context.
         """
+        return list(self.__get_sorted_aspects())
+
+    def __get_sorted_aspects(self) -> Tuple[Aspect, ...]:
+        if self.__aspects is None:
+            aspects = list(self.__characteristics.keys())
+            if self.__base is not None:
+                aspects.extend(
+                    aspect
+                    for aspect in self.__base.__get_sorted_aspects()
+                    if aspect not in self.__characteristics
+                )
+            aspects.sort(key=lambda aspect: aspect.get_name())
+            self.__aspects = tuple(aspects)
+
         return self.__aspects
 
     def get_characteristic(self, aspect: Aspect) -> ICharacteristic | None:
@@ -77,7 +102,10 @@ class Context:
         :param aspect: The aspect to get the value of.
         :returns Aspect|None: The value of the aspect. None if the aspect is not present in the context.
         """
-        return next((c for a, c in self.__characteristics.items() if a == aspect), None)
+        characteristic = self.__characteristics.get(aspect)
+        if characteristic is None and self.__base is not None:
+            return self.__base.get_characteristic(aspect)
+        return characteristic
 
     # Second class citizens
     def has_characteristic(self, aspect: Aspect) -> bool:
@@ -86,7 +114,7 @@ class Context:
         :param aspect: The aspect to check for.
         :returns bool: True if the context has the aspect, False otherwise.
         """
-        return any(aspect == context_aspect for context_aspect in self.__aspects)
+        return self.get_characteristic(aspect) is not None
 
     def get_characteristic_as_str(
         self,
@@ -153,7 +181,7 @@ class Context:
         Check if the context has (user-defined) dimensions.
         :returns bool: True if the context has dimensions, False otherwise.
         """
-        return any(not aspect.is_core() for aspect in self.__aspects)
+        return any(not aspect.is_core() for aspect in self.__get_sorted_aspects())
 
     # Internal methods
     def _add_characteristic(self, characteristic: ICharacteristic) -> None:
@@ -164,14 +192,10 @@ class Context:
         """
         aspect = characteristic.get_aspect()
 
-        if aspect not in self.__aspects:
-            self.__aspects.append(aspect)
-
+        if not self.has_characteristic(aspect):
             self.__characteristics[aspect] = characteristic
-
-            self.__aspects.sort(key=lambda aspect: aspect.get_name())
-        else:
-            pass
+            self.__aspects = None
+            self.__key = None
 
     def _get_id(self) -> str:
         """
@@ -184,7 +208,7 @@ class Context:
 
     def __str__(self) -> str:
         output = ""
-        for aspect in self.__aspects:
+        for aspect in self.__get_sorted_aspects():
             output += f"{str(self.get_characteristic_as_str(aspect))} "
         return output
 
@@ -192,8 +216,38 @@ class Context:
         if not isinstance(__value, Context):
             return False
 
-        # TODO: dont use the _id, compare the aspects instead
-        return self._get_id() == __value._get_id()
+        return self.__get_key() == __value.__get_key()
+
+    def __hash__(self) -> int:
+        return hash(self.__get_key())
+
+    def _get_key_without_concept(self) -> Tuple[Tuple[str, Hashable], ...]:
+        """
+        Get a hashable key of all characteristics except the concept.
+        Facts with the same key only differ in their concept, which is what calculations compare.
+        This method is for advanced users only.
+        :returns: The key as a tuple of aspect name and value pairs.
+        """
+        concept_name = Aspect.CONCEPT.get_name()
+        return tuple(entry for entry in self.__get_key() if entry[0] != concept_name)
+
+    def __get_key(self) -> Tuple[Tuple[str, Hashable], ...]:
+        """
+        The characteristics are not hashable, so the key uses the name of report element values and the string of all other values.
+        """
+        if self.__key is None:
+            key: List[Tuple[str, Hashable]] = []
+            for aspect in self.__get_sorted_aspects():
+                value = cast(
+                    ICharacteristic, self.get_characteristic(aspect)
+                ).get_value()
+                if isinstance(value, IReportElement):
+                    key.append((aspect.get_name(), value.get_name()))
+                else:
+                    key.append((aspect.get_name(), str(value)))
+            self.__key = tuple(key)
+
+        return self.__key
 
     def convert_to_df_row(
         self,
@@ -210,13 +264,13 @@ class Context:
         if not languages or not translation_service:
             return {
                 aspect.get_name(): self.get_characteristic_as_str(aspect)
-                for aspect in self.__aspects
+                for aspect in self.__get_sorted_aspects()
             }
 
         dict_to_return: Dict[str, str] = {}
-        for aspect in self.__aspects:
+        for aspect in self.__get_sorted_aspects():
             key = translation_service.get_from_labels(
-                aspect.get_labels(), languages, aspect.get_name()
+                aspect.get_label_index(), languages, aspect.get_name()
             )
             value = self.get_characteristic_as_str(
                 aspect, languages, translation_service
@@ -0,0 +1,306 @@
+"""
+This module contains the FactMatrix class.
+
+A FactMatrix is a columnar, numeric view of the facts of a filing.
+Every row is a numeric fact. The values and decimals are stored as float64 arrays.
+The concept, period, entity, unit and dimension columns are dictionary-encoded:
+they are int32 arrays of codes that index into a list of distinct values.
+A code of -1 means that the fact has no characteristic for the column.
+
+Example usage:
+
+```
+import numpy as np
+from brel import Filing
+
+filing = Filing.open("my_folder/")
+matrix = filing.get_numeric_fact_matrix()
+
+# sum of all us-gaap:Assets facts per period
+concept_code = matrix.get_concepts().index(filing.get_concept("us-gaap:Assets").get_name())
+mask = matrix.get_concept_codes() == concept_code
+sums = np.bincount(
+    matrix.get_period_codes()[mask],
+    weights=matrix.get_values()[mask],
+    minlength=len(matrix.get_periods()),
+)
+```
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, List
+
+import numpy as np
+import numpy.typing as npt
+
+from brel.brel_fact import Fact
+from brel.characteristics import (
+    ExplicitDimensionCharacteristic,
+    PeriodCharacteristic,
+    TypedDimensionCharacteristic,
+)
+from brel.qnames.qname import QName
+
+
+class _Encoder[T]:
+    """
+    Dictionary-encodes values of one column.
+    """
+
+    def __init__(self) -> None:
+        self.codes: Dict[Hashable, int] = {}
+        self.values: List[T] = []
+
+    def encode(self, key: Hashable, value: T) -> int:
+        code = self.codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self.codes[key] = code
+            self.values.append(value)
+        return code
+
+
+class FactMatrix:
+    """
+    Columnar view of the numeric facts of a filing.
+    All arrays have one entry per fact and are aligned with `get_facts()`.
+    Nil facts and facts whose concept is not numeric are left out.
+    """
+
+    def __init__(
+        self,
+        facts: List[Fact],
+        values: npt.NDArray[np.float64],
+        decimals: npt.NDArray[np.float64],
+        concept_codes: npt.NDArray[np.int32],
+        concepts: List[QName],
+        period_codes: npt.NDArray[np.int32],
+        periods: List[PeriodCharacteristic],
+        entity_codes: npt.NDArray[np.int32],
+        entities: List[str],
+        unit_codes: npt.NDArray[np.int32],
+        units: List[str],
+        member_codes: Dict[QName, npt.NDArray[np.int32]],
+        members: Dict[QName, List[QName | str]],
+    ) -> None:
+        self.__facts = facts
+        self.__values = values
+        self.__decimals = decimals
+        self.__concept_codes = concept_codes
+        self.__concepts = concepts
+        self.__period_codes = period_codes
+        self.__periods = periods
+        self.__entity_codes = entity_codes
+        self.__entities = entities
+        self.__unit_codes = unit_codes
+        self.__units = units
+        self.__member_codes = member_codes
+        self.__members = members
+
+    @classmethod
+    def from_facts(cls, facts: Iterable[Fact]) -> "FactMatrix":
+        """
+        Build the matrix from the numeric facts in the given facts.
+        :param facts: The facts to build the matrix from. Non-numeric and nil facts are skipped.
+        :returns FactMatrix: The matrix of the numeric facts.
+        """
+        numeric_facts: List[Fact] = []
+        values: List[float] = []
+        decimals: List[float] = []
+        concept_codes: List[int] = []
+        period_codes: List[int] = []
+        entity_codes: List[int] = []
+        unit_codes: List[int] = []
+        # dimension -> (row, member code) pairs. Most facts have no dimensions, so the columns are filled afterwards.
+        member_entries: Dict[QName, List[tuple[int, int]]] = {}
+
+        concept_encoder: _Encoder[QName] = _Encoder()
+        period_encoder: _Encoder[PeriodCharacteristic] = _Encoder()
+        entity_encoder: _Encoder[str] = _Encoder()
+        unit_encoder: _Encoder[str] = _Encoder()
+        member_encoders: Dict[QName, _Encoder[QName | str]] = {}
+
+        for fact in facts:
+            concept = fact.get_concept()
+            if not concept.is_numeric():
+                continue
+
+            try:
+                value = float(fact)
+            except ValueError:
+                # nil facts have an empty value
+                continue
+
+            row = len(numeric_facts)
+            numeric_facts.append(fact)
+            values.append(value)
+
+            fact_decimals = fact.get_decimals()
+            decimals.append(math.nan if fact_decimals is None else fact_decimals)
+
+            concept_name = concept.get_name()
+            concept_codes.append(concept_encoder.encode(concept_name, concept_name))
+
+            period = fact.get_period()
+            period_codes.append(
+                -1 if period is None else period_encoder.encode(str(period), period)
+            )
+
+            entity = fact.get_entity()
+            entity_codes.append(
+                -1
+                if entity is None
+                else entity_encoder.encode(entity.get_value(), entity.get_value())
+            )
+
+            unit = fact.get_unit()
+            unit_codes.append(
+                -1
+                if unit is None
+                else unit_encoder.encode(unit.get_value(), unit.get_value())
+            )
+
+            for aspect in fact.get_aspects():
+                if aspect.is_core():
+                    continue
+
+                characteristic = fact.get_characteristic(aspect)
+                if isinstance(characteristic, ExplicitDimensionCharacteristic):
+                    member: QName | str = characteristic.get_member().get_name()
+                elif isinstance(characteristic, TypedDimensionCharacteristic):
+                    member = characteristic.get_value()
+                else:
+                    continue
+
+                dimension = characteristic.get_dimension().get_name()
+                member_encoder = member_encoders.setdefault(dimension, _Encoder())
+                member_entries.setdefault(dimension, []).append(
+                    (row, member_encoder.encode(member, member))
+                )
+
+        member_codes: Dict[QName, npt.NDArray[np.int32]] = {}
+        for dimension, entries in member_entries.items():
+            column = np.full(len(numeric_facts), -1, dtype=np.int32)
+            rows, codes = zip(*entries)
+            column[list(rows)] = codes
+            member_codes[dimension] = column
+
+        return cls(
+            numeric_facts,
+            np.array(values, dtype=np.float64),
+            np.array(decimals, dtype=np.float64),
+            np.array(concept_codes, dtype=np.int32),
+            concept_encoder.values,
+            np.array(period_codes, dtype=np.int32),
+            period_encoder.values,
+            np.array(entity_codes, dtype=np.int32),
+            entity_encoder.values,
+            np.array(unit_codes, dtype=np.int32),
+            unit_encoder.values,
+            member_codes,
+            {
+                dimension: encoder.values
+                for dimension, encoder in member_encoders.items()
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.__facts)
+
+    def get_facts(self) -> List[Fact]:
+        """
+        :returns list[Fact]: The facts of the rows of the matrix.
+        """
+        return self.__facts
+
+    def get_values(self) -> npt.NDArray[np.float64]:
+        """
+        :returns np.ndarray: The values of the facts as float64.
+        """
+        return self.__values
+
+    def get_decimals(self) -> npt.NDArray[np.float64]:
+        """
+        :returns np.ndarray: The decimals of the facts as float64. NaN if a fact has no decimals, inf if the decimals are INF.
+        """
+        return self.__decimals
+
+    def get_concept_codes(self) -> npt.NDArray[np.int32]:
+        """
+        :returns np.ndarray: The concept code of each fact. The codes index into `get_concepts()`.
+        """
+        return self.__concept_codes
+
+    def get_concepts(self) -> List[QName]:
+        """
+        :returns list[QName]: The names of the distinct concepts.
+        """
+        return self.__concepts
+
+    def get_period_codes(self) -> npt.NDArray[np.int32]:
+        """
+        :returns np.ndarray: The period code of each fact. The codes index into `get_periods()`.
+        """
+        return self.__period_codes
+
+    def get_periods(self) -> List[PeriodCharacteristic]:
+        """
+        :returns list[PeriodCharacteristic]: The distinct periods.
+        """
+        return self.__periods
+
+    def get_entity_codes(self) -> npt.NDArray[np.int32]:
+        """
+        :returns np.ndarray: The entity code of each fact. The codes index into `get_entities()`.
+        """
+        return self.__entity_codes
+
+    def get_entities(self) -> List[str]:
+        """
+        :returns list[str]: The distinct entities in clark notation.
+        """
+        return self.__entities
+
+    def get_unit_codes(self) -> npt.NDArray[np.int32]:
+        """
+        :returns np.ndarray: The unit code of each fact. The codes index into `get_units()`.
+        """
+        return self.__unit_codes
+
+    def get_units(self) -> List[str]:
+        """
+        :returns list[str]: The names of the distinct units.
+        """
+        return self.__units
+
+    def get_dimensions(self) -> List[QName]:
+        """
+        :returns list[QName]: The names of all dimensions used by at least one numeric fact.
+        """
+        return list(self.__member_codes.keys())
+
+    def get_member_codes(self, dimension: QName) -> npt.NDArray[np.int32]:
+        """
+        :param dimension: The name of the dimension.
+        :returns np.ndarray: The member code of each fact for the dimension. The codes index into `get_members(dimension)`.
+        -1 if a fact has no member for the dimension.
+        """
+        member_codes = self.__member_codes.get(dimension)
+        if member_codes is None:
+            return np.full(len(self.__facts), -1, dtype=np.int32)
+        return member_codes
+
+    def get_members(self, dimension: QName) -> List[QName | str]:
+        """
+        :param dimension: The name of the dimension.
+        :returns list[QName|str]: The distinct members of the dimension. Typed dimension values are strings.
+        """
+        return self.__members.get(dimension, [])
@@ -0,0 +1,279 @@
+"""
+This module contains the FactQuery class.
+
+A FactQuery filters the facts of a filing by several aspects at once.
+Queries are created with `Filing.query()` and refined by chaining the filter methods.
+All filters have to match for a fact to be returned.
+
+Example usage:
+
+```
+from datetime import date
+from brel import Filing
+
+filing = Filing.open("my_folder/")
+
+facts = (
+    filing.query()
+    .concept("us-gaap:Assets")
+    .period_between(date(2023, 1, 1), date(2023, 12, 31))
+    .dimension("us-gaap:StatementBusinessSegmentsAxis", "us-gaap:CorporateMember")
+    .to_list()
+)
+```
+
+Filters on the concept, period, entity, unit, dimensions and the core facts are answered by the indexes of the fact repository.
+The query only iterates over the smallest of these indexes and looks up the fact ids in the others, without copying them.
+The remaining filters are evaluated lazily while iterating over the candidates.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import datetime
+from typing import Callable, Iterator, List, Optional
+
+from brel.brel_fact import Fact
+from brel.characteristics import (
+    EntityCharacteristic,
+    PeriodCharacteristic,
+    UnitCharacteristic,
+)
+from brel.contexts.filing_context import FilingContext
+from brel.data.fact.fact_repository import (
+    CORE_INDEX_KEY,
+    FactIndexKey,
+    concept_index_key,
+    dimension_index_key,
+    entity_index_key,
+    period_index_key,
+    unit_index_key,
+)
+from brel.parsers.utils.iterable_utils import exactly_one
+from brel.qnames.qname import QName
+from brel.qnames.qname_search_params import QNameSearchParams
+from brel.reportelements import Concept, Dimension, IReportElement, Member
+
+
+class FactQuery:
+    """
+    Composable query over the facts of a filing.
+    Every filter method returns the query itself, so filters can be chained.
+    The query is only executed when it is iterated over.
+    """
+
+    def __init__(self, context: FilingContext) -> None:
+        self.__context = context
+        self.__index_keys: List[FactIndexKey] = []
+        self.__predicates: List[Callable[[Fact], bool]] = []
+
+    def concept(self, concept: Concept | QName | str) -> "FactQuery":
+        """
+        Only match facts that report against the given concept.
+        :param concept: The concept or its name. Names can be a QName or a string in the format "prefix:localname".
+        :returns FactQuery: The query itself.
+        :raises ValueError: if the concept is not found in the filing.
+        """
+        concept_qname = self.__resolve_name(concept, Concept)
+        self.__index_keys.append(concept_index_key(concept_qname))
+        return self
+
+    def period(self, period: PeriodCharacteristic) -> "FactQuery":
+        """
+        Only match facts with exactly the given period.
+        :param period: The period of the facts.
+        :returns FactQuery: The query itself.
+        """
+        self.__index_keys.append(period_index_key(period))
+        return self
+
+    def period_between(
+        self,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+    ) -> "FactQuery":
+        """
+        Only match facts whose period lies within the given range.
+        Instant periods match if the instant is in the range.
+        Duration periods match if both the start and the end date are in the range.
+        :param start: The first date of the range. If None, the range is open to the past.
+        :param end: The last date of the range. If None, the range is open to the future.
+        :returns FactQuery: The query itself.
+        """
+
+        def in_range(date: datetime.date) -> bool:
+            return (start is None or start <= date) and (end is None or date <= end)
+
+        def predicate(fact: Fact) -> bool:
+            period = fact.get_period()
+            if period is None:
+                return False
+            if period.is_instant():
+                return in_range(period.get_instant_period())
+            return in_range(period.get_start_period()) and in_range(
+                period.get_end_period()
+            )
+
+        self.__predicates.append(predicate)
+        return self
+
+    def instant(self) -> "FactQuery":
+        """
+        Only match facts with an instant period.
+        :returns FactQuery: The query itself.
+        """
+        self.__predicates.append(
+            lambda fact: (period := fact.get_period()) is not None
+            and period.is_instant()
+        )
+        return self
+
+    def duration(self) -> "FactQuery":
+        """
+        Only match facts with a duration period.
+        :returns FactQuery: The query itself.
+        """
+        self.__predicates.append(
+            lambda fact: (period := fact.get_period()) is not None
+            and not period.is_instant()
+        )
+        return self
+
+    def entity(self, entity: EntityCharacteristic | str) -> "FactQuery":
+        """
+        Only match facts of the given entity.
+        :param entity: The entity or its value in clark notation. For example "{http://www.sec.gov/CIK}0000320193".
+        :returns FactQuery: The query itself.
+        :raises ValueError: if the entity string is not in clark notation.
+        """
+        if isinstance(entity, str):
+            if not entity.startswith("{") or "}" not in entity:
+                raise ValueError(
+                    f"Entity {entity} is not in the format '{{scheme}}identifier'"
+                )
+            scheme, entity_id = entity[1:].split("}", 1)
+            entity = EntityCharacteristic(entity_id, scheme)
+
+        self.__index_keys.append(entity_index_key(entity))
+        return self
+
+    def unit(self, unit: UnitCharacteristic | str) -> "FactQuery":
+        """
+        Only match facts with the given unit.
+        :param unit: The unit or its name. For example "USD".
+        :returns FactQuery: The query itself.
+        """
+        if isinstance(unit, str):
+            unit = UnitCharacteristic(unit, [], [])
+
+        self.__index_keys.append(unit_index_key(unit))
+        return self
+
+    def dimension(
+        self,
+        dimension: Dimension | QName | str,
+        member: Optional[Member | QName | str] = None,
+    ) -> "FactQuery":
+        """
+        Only match facts that have a characteristic for the given explicit dimension.
+        :param dimension: The dimension or its name.
+        :param member: If set, the facts also need to have this member for the dimension.
+        :returns FactQuery: The query itself.
+        :raises ValueError: if the dimension or the member is not found in the filing.
+        """
+        dimension_qname = self.__resolve_name(dimension, Dimension)
+        member_qname = None if member is None else self.__resolve_name(member, Member)
+        self.__index_keys.append(dimension_index_key(dimension_qname, member_qname))
+        return self
+
+    def typed_dimension(
+        self, dimension: Dimension | QName | str, value: str
+    ) -> "FactQuery":
+        """
+        Only match facts that have the given value for the typed dimension.
+        :param dimension: The dimension or its name.
+        :param value: The value of the typed dimension as a string.
+        :returns FactQuery: The query itself.
+        :raises ValueError: if the dimension is not found in the filing.
+        """
+        dimension_qname = self.__resolve_name(dimension, Dimension)
+        self.__index_keys.append(dimension_index_key(dimension_qname, value))
+        return self
+
+    def core_only(self) -> "FactQuery":
+        """
+        Only match facts without (user-defined) dimensions.
+        :returns FactQuery: The query itself.
+        """
+        self.__index_keys.append(CORE_INDEX_KEY)
+        return self
+
+    def where(self, predicate: Callable[[Fact], bool]) -> "FactQuery":
+        """
+        Only match facts for which the predicate returns True.
+        :param predicate: A function that takes a fact and returns a bool.
+        :returns FactQuery: The query itself.
+        """
+        self.__predicates.append(predicate)
+        return self
+
+    def __iter__(self) -> Iterator[Fact]:
+        fact_repository = self.__context.get_fact_repository()
+        if self.__index_keys:
+            # the indexes are not copied. only the smallest one is iterated, the others are only probed by fact id
+            indexes = sorted(
+                (fact_repository.get_index(key) for key in self.__index_keys), key=len
+            )
+            smallest_index, other_indexes = indexes[0], indexes[1:]
+            candidates = [
+                fact
+                for fact_id, fact in smallest_index.items()
+                if all(fact_id in index for index in other_indexes)
+            ]
+        else:
+            candidates = fact_repository.get_all()
+
+        for fact in candidates:
+            if all(predicate(fact) for predicate in self.__predicates):
+                yield fact
+
+    def to_list(self) -> List[Fact]:
+        """
+        Execute the query.
+        :returns list[Fact]: All facts that match the query.
+        """
+        return list(self)
+
+    def first(self) -> Optional[Fact]:
+        """
+        Execute the query and return the first match.
+        :returns Fact|None: The first fact that matches the query. None if no fact matches.
+        """
+        return next(iter(self), None)
+
+    def count(self) -> int:
+        """
+        Execute the query and count the matches.
+        :returns int: The number of facts that match the query.
+        """
+        return sum(1 for _ in self)
+
+    def __resolve_name[
+        T: IReportElement
+    ](self, element: T | QName | str, report_element_type: type[T]) -> QName:
+        if isinstance(element, QName):
+            return element
+        if isinstance(element, str):
+            search_params = QNameSearchParams.from_string(element)
+            element = exactly_one(
+                self.__context.get_report_element_service().get_fuzzy_typed(
+                    search_params, report_element_type
+                ),
+                f"{report_element_type.__name__} with name {element} not found in filing",
+            )
+        return element.get_name()
@@ -0,0 +1,330 @@
+"""
+This module builds fact tables as pandas DataFrames column by column.
+
+Instead of converting every fact to a dict, the columns are filled directly.
+Aspect names and characteristic values are translated once per distinct aspect and characteristic, not once per fact.
+The aspect columns use the category dtype.
+The value column is numeric if all facts report against numeric concepts and none of them is nil.
+
+The resulting tables have the same rows and columns as the tables built from `Fact.convert_to_dict`.
+
+The module also builds fact tables as Arrow tables and as Spark DataFrames.
+The Arrow table is built from the same columns with an explicit schema.
+Spark DataFrames are created from the Arrow table, so the rows are transferred to Spark in Arrow batches
+instead of being pickled one by one, and Spark does not have to infer the schema.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyspark
+from pyspark import sql
+from pyspark.sql.types import DoubleType, StringType, StructField, StructType
+
+from brel.brel_fact import Fact
+from brel.characteristics import Aspect, ICharacteristic
+from brel.services.translation.translation_service import TranslationService
+
+type _Columns = Dict[str, List[Optional[str]]]
+
+ARROW_ENABLED_KEY = "spark.sql.execution.arrow.pyspark.enabled"
+
+
+def create_fact_table_df(
+    facts: List[Fact],
+    language_passes: List[List[str]],
+    translation_service: TranslationService,
+    skip_failed_passes: bool,
+) -> pd.DataFrame:
+    """
+    Create a fact table with one row per fact and language pass.
+    :param facts: the facts of the table
+    :param language_passes: the languages of every pass over the facts. Each pass adds one row per fact.
+    :param translation_service: the translation service for aspect names, values and literals
+    :param skip_failed_passes: if True, a pass that cannot be translated discards all rows built so far.
+    If False, the translation error is raised.
+    :returns pd.DataFrame: the fact table
+    """
+    columns, aspect_keys, numeric_keys = __build_table(
+        facts, language_passes, translation_service, skip_failed_passes
+    )
+
+    data: Dict[str, pd.Series | List[Optional[str]]] = {}
+    for key, column in columns.items():
+        if key in aspect_keys:
+            data[key] = pd.Series(column, dtype="category")
+        else:
+            data[key] = column
+
+    df = pd.DataFrame(data)
+
+    for value_key in numeric_keys:
+        df[value_key] = pd.to_numeric(df[value_key], errors="coerce")
+
+    return df
+
+
+def create_fact_table_arrow_table(
+    facts: List[Fact],
+    language_passes: List[List[str]],
+    translation_service: TranslationService,
+    skip_failed_passes: bool,
+) -> pa.Table:
+    """
+    Create a fact table as an Arrow table with the same rows and columns as `create_fact_table_df`.
+    Numeric value columns are doubles, all other columns are nullable strings.
+    :param facts: the facts of the table
+    :param language_passes: the languages of every pass over the facts. Each pass adds one row per fact.
+    :param translation_service: the translation service for aspect names, values and literals
+    :param skip_failed_passes: see `create_fact_table_df`
+    :returns pyarrow.Table: the fact table
+    """
+    columns, _, numeric_keys = __build_table(
+        facts, language_passes, translation_service, skip_failed_passes
+    )
+
+    fields = [
+        pa.field(key, pa.float64() if key in numeric_keys else pa.string())
+        for key in columns
+    ]
+    arrays = [
+        (
+            pa.array([__to_float(value) for value in column], type=pa.float64())
+            if key in numeric_keys
+            else pa.array(column, type=pa.string())
+        )
+        for key, column in columns.items()
+    ]
+
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def create_fact_table_spark_df(
+    spark: sql.SparkSession,
+    facts: List[Fact],
+    language_passes: List[List[str]],
+    translation_service: TranslationService,
+    skip_failed_passes: bool,
+) -> sql.DataFrame:
+    """
+    Create a fact table as a Spark DataFrame with the same rows and columns as `create_fact_table_df`.
+    The table is built as an Arrow table and passed to Spark with an explicit schema.
+    Spark 4 and newer take the Arrow table directly.
+    Older versions only take pandas DataFrames through Arrow, so Arrow is enabled in the session for the duration of the call.
+    :param spark: the Spark session
+    :param facts: the facts of the table
+    :param language_passes: the languages of every pass over the facts. Each pass adds one row per fact.
+    :param translation_service: the translation service for aspect names, values and literals
+    :param skip_failed_passes: see `create_fact_table_df`
+    :returns pyspark.sql.DataFrame: the fact table as a Spark DataFrame
+    """
+    table = create_fact_table_arrow_table(
+        facts, language_passes, translation_service, skip_failed_passes
+    )
+    schema = __create_spark_schema(table.schema)
+
+    if int(pyspark.__version__.split(".")[0]) >= 4:
+        # the stubs of pyspark before 4 do not accept Arrow tables
+        return spark.createDataFrame(table, schema=schema)  # type: ignore
+
+    previous_arrow_enabled = spark.conf.get(ARROW_ENABLED_KEY, None)
+    spark.conf.set(ARROW_ENABLED_KEY, "true")
+    try:
+        return spark.createDataFrame(table.to_pandas(), schema=schema)
+    finally:
+        if previous_arrow_enabled is None:
+            spark.conf.unset(ARROW_ENABLED_KEY)
+        else:
+            spark.conf.set(ARROW_ENABLED_KEY, previous_arrow_enabled)
+
+
+def __build_table(
+    facts: List[Fact],
+    language_passes: List[List[str]],
+    translation_service: TranslationService,
+    skip_failed_passes: bool,
+) -> Tuple[_Columns, set[str], set[str]]:
+    """
+    :returns: the columns of the table, the keys of the aspect columns and the keys of the numeric value columns.
+    """
+    chunks: List[Tuple[_Columns, int]] = []
+
+    for languages in language_passes:
+        try:
+            chunks.append(
+                (__build_columns(facts, languages, translation_service), len(facts))
+            )
+        except (KeyError, ValueError):
+            if not skip_failed_passes:
+                raise
+            chunks = []
+
+    columns = __concat_chunks(chunks)
+    aspect_keys = columns.keys() - __literal_keys(language_passes, translation_service)
+
+    numeric_keys: set[str] = set()
+    if (
+        facts
+        and chunks
+        and all(fact.get_concept().is_numeric() and str(fact) != "" for fact in facts)
+    ):
+        numeric_keys = __value_keys(language_passes, translation_service) & set(
+            columns.keys()
+        )
+
+    return columns, aspect_keys, numeric_keys
+
+
+def __create_spark_schema(arrow_schema: pa.Schema) -> StructType:
+    return StructType(
+        [
+            StructField(
+                field.name,
+                DoubleType() if field.type == pa.float64() else StringType(),
+                nullable=True,
+            )
+            for field in arrow_schema
+        ]
+    )
+
+
+def __to_float(value: Optional[str]) -> Optional[float]:
+    # like pd.to_numeric with errors="coerce", values that are not numbers become null
+    try:
+        return float(value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+
+def __build_columns(
+    facts: List[Fact],
+    languages: List[str],
+    translation_service: TranslationService,
+) -> _Columns:
+    translate = bool(languages)
+    columns: _Columns = {}
+    row_count = len(facts)
+
+    def get_column(key: str) -> List[Optional[str]]:
+        column = columns.get(key)
+        if column is None:
+            column = [None] * row_count
+            columns[key] = column
+        return column
+
+    aspect_keys: Dict[Aspect, str] = {}
+    # characteristics are shared between facts, so their identity is a cheap cache key
+    characteristic_values: Dict[int, str] = {}
+
+    if translate:
+        id_key = translation_service.get("literal:id", languages)
+        value_key = translation_service.get("literal:value", languages)
+        none_literal = translation_service.get("literal:none", languages)
+    else:
+        id_key, value_key, none_literal = "id", "value", ""
+
+    for row, fact in enumerate(facts):
+        context = fact.get_context()
+        for aspect in context.get_aspects():
+            aspect_key = aspect_keys.get(aspect)
+            if aspect_key is None:
+                aspect_key = (
+                    translation_service.get_from_labels(
+                        aspect.get_label_index(), languages, aspect.get_name()
+                    )
+                    if translate
+                    else aspect.get_name()
+                )
+                aspect_keys[aspect] = aspect_key
+
+            characteristic = context.get_characteristic(aspect)
+            get_column(aspect_key)[row] = __get_characteristic_value(
+                characteristic,
+                languages,
+                translation_service,
+                characteristic_values,
+            )
+
+        fact_id = fact.get_id()
+        get_column(id_key)[row] = fact_id if fact_id else none_literal
+        get_column(value_key)[row] = str(fact)
+
+    return columns
+
+
+def __get_characteristic_value(
+    characteristic: Optional[ICharacteristic],
+    languages: List[str],
+    translation_service: TranslationService,
+    cache: Dict[int, str],
+) -> str:
+    if characteristic is None:
+        return ""
+
+    value = cache.get(id(characteristic))
+    if value is None:
+        if languages:
+            value = characteristic.get_localized_value_string(
+                languages, translation_service
+            )
+        else:
+            value = characteristic.get_value().__str__()
+        cache[id(characteristic)] = value
+
+    return value
+
+
+def __concat_chunks(chunks: List[Tuple[_Columns, int]]) -> _Columns:
+    """
+    Concatenate the columns of multiple passes.
+    Columns are ordered by their first appearance. Rows of passes without a column are filled with None.
+    """
+    if len(chunks) == 1:
+        return chunks[0][0]
+
+    keys: Dict[str, None] = {}
+    for columns, _ in chunks:
+        keys.update(dict.fromkeys(columns))
+
+    merged: _Columns = {}
+    for key in keys:
+        merged_column: List[Optional[str]] = []
+        for columns, row_count in chunks:
+            merged_column.extend(columns.get(key) or [None] * row_count)
+        merged[key] = merged_column
+
+    return merged
+
+
+def __literal_keys(
+    language_passes: List[List[str]], translation_service: TranslationService
+) -> set[str]:
+    keys = {"id", "value"}
+    for languages in language_passes:
+        for literal in ("literal:id", "literal:value"):
+            try:
+                keys.add(translation_service.get(literal, languages))
+            except KeyError:
+                continue
+    return keys
+
+
+def __value_keys(
+    language_passes: List[List[str]], translation_service: TranslationService
+) -> set[str]:
+    keys = {"value"}
+    for languages in language_passes:
+        try:
+            keys.add(translation_service.get("literal:value", languages))
+        except KeyError:
+            continue
+    return keys
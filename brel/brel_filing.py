@@ -32,6 +32,8 @@ pprint_facts(assets_facts)
 ```
 
 Note that opening a filing can take **a couple of seconds** depending on the size of the filing.
+If only parts of a filing are needed, open it with `Filing.open(path, lazy=True)`.
+Then the facts, report elements, networks and components are only parsed when they are first accessed.
 
 Once a filing is loaded, it can be queried for its facts, report elements, networks and components.
 
@@ -47,15 +49,21 @@ Once a filing is loaded, it can be queried for its facts, report elements, netwo
 import os
 import pandas as pd
 from pyspark import sql
-from typing import Any, List, Optional, Unpack, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Unpack, cast
 
 from brel import Component, Fact, QName
+from brel.brel_fact_matrix import FactMatrix
+from brel.brel_filing_batch import FilingResult, iter_open_many, open_many
+from brel.brel_fact_table import create_fact_table_df, create_fact_table_spark_df
+from brel.brel_fact_query import FactQuery
 
 from brel.errors.area import Area
 from brel.errors.error_instance import ErrorInstance
 from brel.errors.severity import Severity
-from brel.networks import INetwork
+from brel.networks import CalculationInconsistency, INetwork
+from brel.networks.calculation_network import group_calculation_facts
 from brel.parsers.filing_parser_factory import FilingParserFactory
+from brel.parsers.XML.xml_fact_stream import iter_facts_from_instance
 from brel.parsers.path_loaders.factory import create_path_loader_resolver
 from brel.parsers.utils.iterable_utils import exactly_one
 from brel.qnames.qname_search_params import QNameSearchParams
@@ -69,8 +77,10 @@ from brel.reportelements import (
     Member,
 )
 from brel.contexts.filing_context import FilingContext
+from brel.contexts.parsing_stage import NETWORK_STAGES, ParsingStage
 from brel.config.brel_config import BrelConfig
 from brel.services.translation.output_params import OutputParams
+from brel.services.translation.translation_service import TranslationService
 
 
 class Filing:
@@ -79,7 +89,23 @@ class Filing:
     """
 
     @classmethod
-    def open(cls, path: str) -> "Filing":
+    def open(
+        cls,
+        path: str,
+        lazy: bool = False,
+        taxonomy_packages: Optional[List[str]] = None,
+    ) -> "Filing":
+        """
+        Open a filing from a folder, a zip file, an xml file or a URI.
+        Zip files are read directly and do not have to be extracted.
+        :param path: the path of the filing.
+        :param lazy: if True, only the DTS is loaded when opening the filing.
+        The facts, report elements, each kind of network and the components are parsed the first time they are accessed.
+        For example, `get_all_facts()` only parses the report elements and the facts, but none of the linkbases.
+        :param taxonomy_packages: paths of zipped XBRL taxonomy packages.
+        The taxonomies in the packages are read from the packages instead of being downloaded, as redirected by their META-INF/catalog.xml.
+        :returns Filing: the opened filing.
+        """
         path_loader_resolver = create_path_loader_resolver()
         file_paths: list[str] = []
         try:
@@ -88,13 +114,81 @@ class Filing:
         except ValueError:
             raise ValueError(f"Path {path} is not a valid path")
 
-        parser = FilingParserFactory().create_parser(file_paths)
-        context = parser.parse()
+        parser = FilingParserFactory().create_parser(file_paths, taxonomy_packages)
+        context = parser.parse(lazy=lazy)
         return cls(context)
 
+    @classmethod
+    def open_many[
+        T
+    ](
+        cls,
+        paths: List[str],
+        task: Callable[["Filing"], T],
+        workers: Optional[int] = None,
+        warmup_path: Optional[str] = None,
+    ) -> List[FilingResult[T]]:
+        """
+        Open many filings in parallel on a process pool and run a task on each of them.
+        Filings cannot be sent between processes, so the task runs in the worker process and only its result is returned.
+        :param paths: the paths of the filings.
+        :param task: a function that takes an opened filing and returns a picklable value. It has to be defined at the top level of a module.
+        :param workers: the number of worker processes. Defaults to the number of CPUs.
+        :param warmup_path: a filing that is opened before the pool starts and once in every worker when it starts.
+        Its taxonomy is downloaded and compiled only once, and every worker keeps the compiled taxonomy in memory for its later filings.
+        :returns list[FilingResult]: one result per path in the order of the paths. Filings that failed contain the error instead of a result.
+        """
+        return open_many(
+            cls.open, paths, task, workers=workers, warmup_path=warmup_path
+        )
+
+    @classmethod
+    def iter_open_many[
+        T
+    ](
+        cls,
+        paths: List[str],
+        task: Callable[["Filing"], T],
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+        warmup_path: Optional[str] = None,
+    ) -> Iterator[FilingResult[T]]:
+        """
+        Like `Filing.open_many`, but yields the results one by one.
+        :param ordered: if True, the results are yielded in the order of the paths. Otherwise, as soon as they complete.
+        :param max_pending: the maximum number of filings in flight. No new filings are submitted until the consumer takes results.
+        Defaults to twice the number of workers.
+        :returns Iterator[FilingResult]: one result per path.
+        """
+        return iter_open_many(
+            cls.open,
+            paths,
+            task,
+            workers=workers,
+            ordered=ordered,
+            max_pending=max_pending,
+            warmup_path=warmup_path,
+        )
+
+    @classmethod
+    def iter_facts(cls, path: str) -> Iterator[Fact]:
+        """
+        Stream the facts of a large XBRL instance without opening it as a filing.
+        The instance is read incrementally, so the memory used does not grow with the size of the instance.
+        Only the DTS referenced by the instance is loaded.
+        Networks, components and the errors of the instance are not available this way.
+        :param path: the path of an XBRL instance in the XML syntax.
+        :returns Iterator[Fact]: the facts of the instance, including facts without an id.
+        """
+        return iter_facts_from_instance(path)
+
     def __init__(self, context: FilingContext) -> None:
         self.__context = context
         self.__output_params = OutputParams()
+        self.__numeric_fact_matrix: Optional[FactMatrix] = None
+        # the resolved language preferences per call arguments. Cleared when the output parameters of the filing change.
+        self.__preferred_languages: Dict[tuple, List[str]] = {}
 
     def get_preferred_languages(
         self,
@@ -108,14 +202,42 @@ class Filing:
         elif isinstance(function_languages, str):
             function_languages = [function_languages]
 
-        preferred_filing_languages = self.__output_params.get("languages") or []
-        if isinstance(preferred_filing_languages, str):
-            preferred_filing_languages = [preferred_filing_languages]
-
         library_languages = BrelConfig.get_preferred_library_languages() or []
         if isinstance(library_languages, str):
             library_languages = [library_languages]
 
+        # the library languages can change between calls, so they are part of the key
+        cache_key = (
+            tuple(function_languages),
+            tuple(library_languages),
+            allow_report_language,
+            allow_system_language,
+            allow_default,
+        )
+        if cache_key not in self.__preferred_languages:
+            self.__preferred_languages[cache_key] = self.__resolve_preferred_languages(
+                function_languages,
+                library_languages,
+                allow_report_language,
+                allow_system_language,
+                allow_default,
+            )
+
+        # callers get their own copy, so they cannot change the cached preferences
+        return list(self.__preferred_languages[cache_key])
+
+    def __resolve_preferred_languages(
+        self,
+        function_languages: List[str],
+        library_languages: List[str],
+        allow_report_language: bool,
+        allow_system_language: bool,
+        allow_default: bool,
+    ) -> List[str]:
+        preferred_filing_languages = self.__output_params.get("languages") or []
+        if isinstance(preferred_filing_languages, str):
+            preferred_filing_languages = [preferred_filing_languages]
+
         sys_language = BrelConfig.get_system_language()
         sys_language_list = (
             [sys_language] if sys_language and allow_system_language else []
@@ -147,17 +269,51 @@ class Filing:
 
         return all_languages_deduplicated
 
+    def is_parsed(self, stage: ParsingStage) -> bool:
+        """
+        Check if a part of the filing has been parsed.
+        Filings opened with `lazy=True` parse their parts on first access. Other filings are parsed completely when they are opened.
+        :param stage: the part of the filing, e.g. `ParsingStage.FACTS`.
+        :returns bool: True if the part has been parsed, False otherwise.
+        """
+        return self.__context.is_stage_completed(stage)
+
     # first class citizens
     def get_all_facts(self) -> list[Fact]:
         """
         :return list[Fact]: a list of all [`Fact`](../facts/facts.md) objects in the filing.
         """
+        self.__context.require_stages(ParsingStage.FACTS)
         return self.__context.get_fact_repository().get_all()
 
+    def query(self) -> FactQuery:
+        """
+        Start a query over the facts of the filing.
+        Chain the filter methods of the query to narrow down the facts.
+        For example `filing.query().concept("us-gaap:Assets").instant().to_list()`.
+        :returns FactQuery: A query that matches all facts of the filing.
+        """
+        self.__context.require_stages(ParsingStage.FACTS)
+        return FactQuery(self.__context)
+
+    def get_numeric_fact_matrix(self) -> FactMatrix:
+        """
+        Get all numeric facts of the filing as NumPy arrays.
+        The values are float64 and the concepts, periods, entities, units and dimension members are dictionary-encoded.
+        The matrix is built on the first call and cached afterwards.
+        :returns FactMatrix: the numeric facts of the filing in columnar form.
+        """
+        if self.__numeric_fact_matrix is None:
+            self.__numeric_fact_matrix = FactMatrix.from_facts(self.get_all_facts())
+        return self.__numeric_fact_matrix
+
     def get_all_report_elements(self) -> List[IReportElement]:
         """
         :return list[IReportElement]: a list of all [`IReportElement`](../report-elements/report-elements.md) objects in the filing.
         """
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
+        )
         return self.__context.get_report_element_repository().get_all()
 
     def get_all_components(self) -> list[Component]:
@@ -165,6 +321,9 @@ class Filing:
         :return list[Component]: a list of all [`Component`](../components/components.md) objects in the filing.
         Note: components are sometimes called "roles" in the XBRL specification.
         """
+        self.__context.require_stages(
+            ParsingStage.COMPONENTS, ParsingStage.LABEL_NETWORKS
+        )
         return self.__context.get_component_repository().get_all()
 
     def get_all_physical_networks(self) -> list[INetwork]:
@@ -172,19 +331,40 @@ class Filing:
         Get all [`INetwork`](../components/networks.md) objects in the filing, where network.is_physical() is True.
         :return list[INetwork]: a list of all physical networks in the filing.
         """
+        self.__context.require_stages(*NETWORK_STAGES)
         return [
             network
             for network in self.__context.get_network_repository().get_all()
             if network.is_physical()
         ]
 
+    def get_calculation_inconsistencies(self) -> list[CalculationInconsistency]:
+        """
+        Check the calculation networks of all components against the facts of the filing.
+        The facts are grouped only once for all networks.
+        :returns list[CalculationInconsistency]: all summations that do not add up. Empty iff all calculations are consistent.
+        """
+        fact_groups = group_calculation_facts(self.get_all_facts())
+
+        inconsistencies: list[CalculationInconsistency] = []
+        for component in self.get_all_components():
+            calculation_network = component.get_calculation_network()
+            if calculation_network is not None:
+                inconsistencies.extend(
+                    calculation_network._get_aggregation_inconsistencies(fact_groups)
+                )
+
+        return inconsistencies
+
     def has_any_errors(self) -> bool:
-        return len(self.__context.get_error_repository().get_all()) > 0
+        return len(self.get_all_errors()) > 0
 
     def get_all_errors(self) -> list[ErrorInstance]:
         """
+        Lazily opened filings are parsed completely first, so that all errors are reported.
         :returns list[Exception]: a list of all errors (any severity) that occurred during parsing.
         """
+        self.__context.require_all_stages()
         return self.__context.get_error_repository().get_all()
 
     def get_errors_by_area(self, area: Area) -> list[ErrorInstance]:
@@ -192,15 +372,15 @@ class Filing:
         :param Area area: the area of the errors to return
         :returns list[Exception]: a list of all errors with the specified area that occurred during parsing.
         """
-        all_errors = self.__context.get_error_repository().get_all()
-        area_errors = [error for error in all_errors if error.get_area() == area]
-        return area_errors
+        self.__context.require_all_stages()
+        return self.__context.get_error_repository().get_by_area(area)
 
     def get_errors_by_severity(self, severity: Severity) -> List[ErrorInstance]:
         """
         :param Severity severity: the severity of the errors to return
         :returns list[Exception]: a list of all errors with the specified severity that occurred during parsing.
         """
+        self.__context.require_all_stages()
         return self.__context.get_error_repository().get_by_severity(severity)
 
     def get_errors(self) -> List[ErrorInstance]:
@@ -226,82 +406,63 @@ class Filing:
         """
         :return list[Fact]: a list of all [`Fact`](../facts/facts.md) objects in the filing that have no non-core dimensions.
         """
-        return [fact for fact in self.get_all_facts() if fact.is_core()]
+        self.__context.require_stages(ParsingStage.FACTS)
+        return self.__context.get_fact_repository().get_all_core()
 
     def get_all_concepts(self) -> list[Concept]:
         """
         :returns list[Concept]: a list of all concepts in the filing.
         Note that concepts are defined according to the Open Information Model. They are not the same as abstracts, line items, hypercubes, dimensions, or members.
         """
-        return cast(
-            list[Concept],
-            list(
-                filter(lambda x: isinstance(x, Concept), self.get_all_report_elements())
-            ),
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
         )
+        return self.__context.get_report_element_repository().get_all_typed(Concept)
 
     def get_all_abstracts(self) -> list[Abstract]:
         """
         :returns list[Abstract]: a list of all abstracts in the filing.
         """
-        return cast(
-            list[Abstract],
-            list(
-                filter(
-                    lambda x: isinstance(x, Abstract), self.get_all_report_elements()
-                )
-            ),
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
         )
+        return self.__context.get_report_element_repository().get_all_typed(Abstract)
 
     def get_all_line_items(self) -> list[LineItems]:
         """
         :returns list[LineItems]: a list of all line items in the filing.
         """
-        return cast(
-            list[LineItems],
-            list(
-                filter(
-                    lambda x: isinstance(x, LineItems), self.get_all_report_elements()
-                )
-            ),
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
         )
+        return self.__context.get_report_element_repository().get_all_typed(LineItems)
 
     def get_all_hypercubes(self) -> list[Hypercube]:
         """
         :returns list[Hypercube]: a list of all hypercubes in the filing.
         """
-        return cast(
-            list[Hypercube],
-            list(
-                filter(
-                    lambda x: isinstance(x, Hypercube), self.get_all_report_elements()
-                )
-            ),
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
         )
+        return self.__context.get_report_element_repository().get_all_typed(Hypercube)
 
     def get_all_dimensions(self) -> list[Dimension]:
         """
         :returns list[Dimension]: a list of all dimensions in the filing.
         """
-        return cast(
-            list[Dimension],
-            list(
-                filter(
-                    lambda x: isinstance(x, Dimension), self.get_all_report_elements()
-                )
-            ),
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
         )
+        return self.__context.get_report_element_repository().get_all_typed(Dimension)
 
     def get_all_members(self) -> list[Member]:
         """
         :returns list[Member]: a list of all members in the filing.
         """
-        return cast(
-            list[Member],
-            list(
-                filter(lambda x: isinstance(x, Member), self.get_all_report_elements())
-            ),
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
         )
+        return self.__context.get_report_element_repository().get_all_typed(Member)
 
     def get_report_element_by_name(
         self, element_qname: QName | str
@@ -311,6 +472,9 @@ class Filing:
         :returns IReportElement|None: the report element with the given name. If no report element is found, then None is returned.
         :raises ValueError: if the QName string is not a valid QName or if the prefix is not found.
         """
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
+        )
         if isinstance(element_qname, str):
             search_params = QNameSearchParams.from_string(element_qname)
             return exactly_one(
@@ -328,6 +492,9 @@ class Filing:
         :returns Concept|None: the concept with the given name. If no concept is found, then None is returned.
         :raises ValueError: if the QName string is not a valid QName or if the prefix is not found.
         """
+        self.__context.require_stages(
+            ParsingStage.REPORT_ELEMENTS, ParsingStage.LABEL_NETWORKS
+        )
         if isinstance(concept_qname, str):
             search_params = QNameSearchParams.from_string(concept_qname)
             return exactly_one(
@@ -352,13 +519,8 @@ class Filing:
         Returns all concepts that have at least one fact reporting against them.
         :returns list[Concept]: The list of concepts
         """
-        reported_concepts: list[Concept] = []
-        for fact in self.get_all_facts():
-            concept = fact.get_concept()
-            if concept not in reported_concepts:
-                reported_concepts.append(concept)
-
-        return reported_concepts
+        self.__context.require_stages(ParsingStage.FACTS)
+        return self.__context.get_fact_repository().get_reported_concepts()
 
     def get_facts_by_concept_name(self, concept_name: QName | str) -> List[Fact]:
         """
@@ -367,6 +529,7 @@ class Filing:
         :returns list[Fact]: the list of facts
         :raises ValueError: if the QName string but is not a valid QName or if the prefix is not found.
         """
+        self.__context.require_stages(ParsingStage.FACTS)
         if isinstance(concept_name, str):
             search_params = QNameSearchParams.from_string(concept_name)
             concept = exactly_one(
@@ -380,7 +543,7 @@ class Filing:
                 concept_name, Concept
             )
 
-        return [fact for fact in self.get_all_facts() if fact.get_concept() == concept]
+        return self.__context.get_fact_repository().get_by_concept(concept.get_name())
 
     def get_facts_by_concept(self, concept: Concept) -> List[Fact]:
         """
@@ -388,7 +551,8 @@ class Filing:
         :param concept: the concept to get facts for.
         :returns list[Fact]: the list of facts
         """
-        return self.get_facts_by_concept_name(concept.get_name())
+        self.__context.require_stages(ParsingStage.FACTS)
+        return self.__context.get_fact_repository().get_by_concept(concept.get_name())
 
     def get_all_component_uris(self) -> List[str]:
         """
@@ -416,7 +580,7 @@ class Filing:
         Converts the filing to a pandas DataFrame.
         :return pandas.DataFrame: the filing as a pandas DataFrame.
         """
-        return self.__generate_pandas_df_from_elements(self.get_all_facts(), **kwargs)
+        return self.__generate_fact_table_pandas_df(self.get_all_facts(), **kwargs)
 
     def generate_core_fact_table_pandas_df(
         self, **kwargs: Unpack[OutputParams]
@@ -425,31 +589,28 @@ class Filing:
         Converts the filing to a pandas DataFrame.
         :return pandas.DataFrame: the filing as a pandas DataFrame.
         """
-        return self.__generate_pandas_df_from_elements(
-            self.get_all_core_facts(), **kwargs
-        )
+        return self.__generate_fact_table_pandas_df(self.get_all_core_facts(), **kwargs)
 
-    def generate_fact_table_spark_df(self) -> tuple[sql.DataFrame, sql.SparkSession]:
+    def generate_fact_table_spark_df(
+        self, **kwargs: Unpack[OutputParams]
+    ) -> tuple[sql.DataFrame, sql.SparkSession]:
         """
         Converts the filing to a spark DataFrame.
+        The facts are passed to Spark as an Arrow table with an explicit schema.
+        To load many filings at once, use `brel.utils.load_facts_spark_df` instead.
         :return pyspark.sql.DataFrame: the filing as a spark DataFrame.
         """
-        spark = sql.SparkSession.builder.getOrCreate()
-        df = self.generate_fact_table_pandas_df()
-        # spark.parallelize()
-        return spark.createDataFrame(df), spark
+        return self.__generate_fact_table_spark_df(self.get_all_facts(), **kwargs)
 
     def generate_core_fact_table_spark_df(
-        self,
+        self, **kwargs: Unpack[OutputParams]
     ) -> tuple[sql.DataFrame, sql.SparkSession]:
         """
         Converts the filing to a spark DataFrame.
+        The facts are passed to Spark as an Arrow table with an explicit schema.
         :return pyspark.sql.DataFrame: the filing as a spark DataFrame.
         """
-        spark = sql.SparkSession.builder.getOrCreate()
-        df = self.generate_core_fact_table_pandas_df()
-        # spark.parallelize()
-        return spark.createDataFrame(df), spark
+        return self.__generate_fact_table_spark_df(self.get_all_core_facts(), **kwargs)
 
     def generate_components_as_pandas_df(
         self, **kwargs: Unpack[OutputParams]
@@ -495,11 +656,63 @@ class Filing:
             self.get_all_report_elements(), **kwargs
         )
 
+    def __generate_fact_table_pandas_df(
+        self, facts: List[Fact], **kwargs: Unpack[OutputParams]
+    ) -> pd.DataFrame:
+        (
+            language_passes,
+            translation_service,
+            skip_failed_passes,
+        ) = self.__get_fact_table_passes(**kwargs)
+        return create_fact_table_df(
+            facts, language_passes, translation_service, skip_failed_passes
+        )
+
+    def __generate_fact_table_spark_df(
+        self, facts: List[Fact], **kwargs: Unpack[OutputParams]
+    ) -> tuple[sql.DataFrame, sql.SparkSession]:
+        (
+            language_passes,
+            translation_service,
+            skip_failed_passes,
+        ) = self.__get_fact_table_passes(**kwargs)
+        spark = sql.SparkSession.builder.getOrCreate()
+        df = create_fact_table_spark_df(
+            spark, facts, language_passes, translation_service, skip_failed_passes
+        )
+        return df, spark
+
+    def __get_fact_table_passes(
+        self, **kwargs: Unpack[OutputParams]
+    ) -> tuple[List[List[str]], TranslationService, bool]:
+        """
+        :returns: the languages of every pass over the facts, the translation service and whether failed passes are skipped.
+        """
+        # the aspects and characteristics are translated with the labels of the report elements
+        self.__context.require_stages(ParsingStage.LABEL_NETWORKS)
+        output_params = self.__infer_output_params(**kwargs)
+
+        translation_service = self.__context.get_translation_service()
+        translation_service.set_match_locale(output_params["match_locale"])
+
+        languages = output_params["languages"]
+        languages_list = languages if isinstance(languages, list) else [languages]
+
+        if output_params["allow_mixed"]:
+            return [languages_list], translation_service, False
+        else:
+            return (
+                [[language] for language in languages_list],
+                translation_service,
+                True,
+            )
+
     def __generate_pandas_df_from_elements(
         self,
         elements: List[IReportElement] | List[Component] | List[Fact],
         **kwargs: Unpack[OutputParams],
     ) -> pd.DataFrame:
+        self.__context.require_stages(ParsingStage.LABEL_NETWORKS)
         output_params = self.__infer_output_params(**kwargs)
         data = []
 
@@ -585,6 +798,7 @@ class Filing:
 
     def set_filing_output_params(self, **kwargs: Unpack[OutputParams]) -> None:
         self.__output_params = kwargs
+        self.__preferred_languages = {}
 
     @classmethod
     def set_global_output_params(self, **kwargs: Unpack[OutputParams]) -> None:
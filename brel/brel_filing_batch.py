@@ -0,0 +1,206 @@
+"""
+This module opens many filings in parallel on a process pool.
+
+Filings hold lxml trees and are not picklable, so they cannot be sent back from the worker processes.
+Instead, every worker opens a filing, runs a task on it and sends back the result of the task.
+The task has to be a picklable function, i.e. defined at the top level of a module, and has to return a picklable value.
+
+Example usage:
+
+```
+from brel import Filing
+
+def count_facts(filing: Filing) -> int:
+    return len(filing.get_all_facts())
+
+for result in Filing.iter_open_many(paths, count_facts, workers=8, ordered=False):
+    if result.is_ok():
+        print(result.get_path(), result.get_result())
+    else:
+        print(result.get_path(), "failed:", result.get_error())
+```
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Deque, Iterator, List, Optional, Set
+
+
+class FilingResult[T]:
+    """
+    The outcome of running a task on one filing of a batch.
+    Either the result of the task or the error raised while opening the filing or running the task is set.
+    """
+
+    def __init__(
+        self, path: str, result: Optional[T] = None, error: Optional[Exception] = None
+    ) -> None:
+        self.__path = path
+        self.__result = result
+        self.__error = error
+
+    def get_path(self) -> str:
+        """
+        :returns str: the path of the filing.
+        """
+        return self.__path
+
+    def is_ok(self) -> bool:
+        """
+        :returns bool: True if the filing was opened and the task completed, False otherwise.
+        """
+        return self.__error is None
+
+    def get_result(self) -> T:
+        """
+        :returns T: the value returned by the task.
+        :raises Exception: the error of the filing, if the filing could not be processed.
+        """
+        if self.__error is not None:
+            raise self.__error
+        return self.__result  # type: ignore
+
+    def get_error(self) -> Optional[Exception]:
+        """
+        :returns Exception|None: the error raised while opening the filing or running the task. None if there was no error.
+        """
+        return self.__error
+
+
+def iter_open_many[
+    F, T
+](
+    open_function: Callable[[str], F],
+    paths: List[str],
+    task: Callable[[F], T],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+    warmup_path: Optional[str] = None,
+) -> Iterator[FilingResult[T]]:
+    """
+    Open the filings on a process pool and run the task on each of them.
+    :param open_function: the function that opens a filing from its path. Has to be picklable.
+    :param paths: the paths of the filings.
+    :param task: the function that is run on each opened filing. Has to be picklable and return a picklable value.
+    :param workers: the number of worker processes. Defaults to the number of CPUs.
+    :param ordered: if True, the results are yielded in the order of the paths. Otherwise, they are yielded as they complete.
+    :param max_pending: the maximum number of filings that are submitted but whose results have not been consumed yet.
+    Defaults to twice the number of workers. Keeps the memory bounded if the results are consumed slowly.
+    :param warmup_path: a filing that is opened once in this process before the pool starts and once in every worker when it starts.
+    The first open fills the on-disk file and taxonomy caches, so the workers do not download and compile the same taxonomy concurrently.
+    The open in the workers keeps the compiled taxonomy in their memory for the filings they open later.
+    :returns Iterator[FilingResult[T]]: one result per path.
+    """
+    worker_count = workers or os.cpu_count() or 1
+    pending_limit = max(max_pending or 2 * worker_count, 1)
+
+    if warmup_path is not None:
+        open_function(warmup_path)
+
+    remaining_paths = iter(paths)
+    pending: Deque[Future[FilingResult[T]]] = deque()
+
+    initializer: Optional[Callable[[Callable[[str], F], str], None]] = None
+    initargs: tuple = ()
+    if warmup_path is not None:
+        initializer, initargs = _warm_up_worker, (open_function, warmup_path)
+
+    with ProcessPoolExecutor(
+        max_workers=worker_count, initializer=initializer, initargs=initargs
+    ) as executor:
+
+        def submit_next() -> bool:
+            path = next(remaining_paths, None)
+            if path is None:
+                return False
+            pending.append(executor.submit(_run_task, open_function, task, path))
+            return True
+
+        while len(pending) < pending_limit and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done: Set[Future[FilingResult[T]]] = wait(
+                    pending, return_when=FIRST_COMPLETED
+                ).done
+                future = next(future for future in pending if future in done)
+                pending.remove(future)
+
+            # refill before yielding, so the workers stay busy while the consumer handles the result
+            submit_next()
+            yield future.result()
+
+
+def open_many[
+    F, T
+](
+    open_function: Callable[[str], F],
+    paths: List[str],
+    task: Callable[[F], T],
+    workers: Optional[int] = None,
+    warmup_path: Optional[str] = None,
+) -> List[FilingResult[T]]:
+    """
+    Open the filings on a process pool and run the task on each of them.
+    See `iter_open_many` for the parameters.
+    :returns list[FilingResult[T]]: one result per path, in the order of the paths.
+    """
+    return list(
+        iter_open_many(
+            open_function,
+            paths,
+            task,
+            workers=workers,
+            ordered=True,
+            warmup_path=warmup_path,
+        )
+    )
+
+
+def _run_task[
+    F, T
+](open_function: Callable[[str], F], task: Callable[[F], T], path: str) -> FilingResult[
+    T
+]:
+    """
+    Runs in the worker processes. Errors are caught, so one broken filing does not fail the whole batch.
+    The function is sent to the workers by name, so it has a single leading underscore.
+    """
+    try:
+        return FilingResult(path, result=task(open_function(path)))
+    except Exception as error:
+        return FilingResult(path, error=_make_picklable(error))
+
+
+def _warm_up_worker[F](open_function: Callable[[str], F], warmup_path: str) -> None:
+    """
+    Runs once in every worker process when it starts. The opened filing is dropped, but the compiled taxonomy stays in memory.
+    Errors are ignored, as they are reported by the filings that need the same taxonomy.
+    The function is sent to the workers by name, so it has a single leading underscore.
+    """
+    try:
+        open_function(warmup_path)
+    except Exception:
+        pass
+
+
+def _make_picklable(error: Exception) -> Exception:
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
@@ -17,7 +17,7 @@ Custom aspects are all other aspects that are not core aspects.
 """
 
 from typing import List, Optional
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 
 
 class Aspect:
@@ -47,7 +47,7 @@ class Aspect:
 
     def __init__(self, name: str, labels: list[BrelLabel]) -> None:
         self.__name = name
-        self.__labels = labels
+        self.__label_index = LabelIndex(name, labels)
         self.__is_core = False
 
     # first class citizens
@@ -73,13 +73,19 @@ class Aspect:
         """
         Get the labels of the aspect.
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        Get the labels of the aspect indexed by their language.
+        """
+        return self.__label_index
 
     def has_label_with_language(self, language: str) -> bool:
         """
         Check if the aspect has a label with the given language.
         """
-        return any(label.get_language() == language for label in self.__labels)
+        return any(label.get_language() == language for label in self.get_labels())
 
     def select_main_label(self) -> BrelLabel:
         """
@@ -37,7 +37,7 @@ class ConceptCharacteristic(ICharacteristic):
         self, languages: List[str], translation_service: TranslationService
     ) -> str:
         return translation_service.get_from_labels(
-            self.__concept.get_labels(),
+            self.__concept.get_label_index(),
             languages,
             self.__concept.get_name().get_local_name(),
         )
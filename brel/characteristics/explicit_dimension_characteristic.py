@@ -55,7 +55,7 @@ class ExplicitDimensionCharacteristic(ICharacteristic):
     ) -> str:
         member = self.get_member()
         return translation_service.get_from_labels(
-            member.get_labels(), languages, member.get_name().get_local_name()
+            member.get_label_index(), languages, member.get_name().get_local_name()
         )
 
     def get_dimension(self) -> Dimension:
@@ -7,7 +7,7 @@
 
 ===================="""
 
-from typing import Optional
+from typing import List, Optional
 
 from lxml.etree import parse
 from brel.contexts.filing_context import FilingContext
@@ -42,12 +42,29 @@ def parse_catalog(filepaths: list[str], context: FilingContext) -> None:
         return
 
     filepaths.remove(catalog_filepath)
-    catalog_tree = parse(catalog_filepath)
+    # the catalog may be inside a zip archive
+    with context.get_file_service().get_local_file(catalog_filepath) as catalog_file:
+        catalog_tree = parse(catalog_file)
     parse_catalog_xml(catalog_filepath, catalog_tree, context)
 
 
-def create_filing_context(entrypoint_filepaths: list[str]) -> FilingContext:
+def mount_taxonomy_package(package_path: str, context: FilingContext) -> None:
+    """
+    Mount a zipped taxonomy package, so the taxonomy is read from the package instead of being downloaded.
+    The rewrites of the catalog of the package redirect the remote uris of the taxonomy into the package.
+    :param package_path: The path of the taxonomy package.
+    :param context: The filing context to mount the package into.
+    """
+    package_filepaths = context.get_file_service().mount_archive(package_path)
+    parse_catalog(package_filepaths, context)
+
+
+def create_filing_context(
+    entrypoint_filepaths: list[str], taxonomy_packages: Optional[List[str]] = None
+) -> FilingContext:
     context = FilingContext()
+    for package_path in taxonomy_packages or []:
+        mount_taxonomy_package(package_path, context)
     parse_catalog(entrypoint_filepaths, context)
 
     xml_service = context.get_xml_service()
@@ -8,11 +8,14 @@
 ====================
 """
 
-from typing import Any, Dict, Callable, List
+from typing import Any, Dict, Callable, List, Set, Tuple
+
+from brel.contexts.parsing_stage import ParsingStage
 from brel.data.aspect.aspect_repository import AspectRepository
 from brel.data.context.context_repository import ContextRepository
 from brel.data.factory import (
     create_aspect_repository,
+    create_compiled_taxonomy_repository,
     create_file_repository,
     create_namespace_repository,
     create_report_element_repository,
@@ -27,6 +30,9 @@ from brel.data.factory import (
     create_context_repository,
     create_uri_rewrite_repository,
 )
+from brel.data.compiled_taxonomy.compiled_taxonomy_repository import (
+    CompiledTaxonomyRepository,
+)
 from brel.data.file.file_repository import FileRepository
 from brel.data.namespace.namespace_repository import NamespaceRepository
 from brel.data.report_element.report_element_repository import ReportElementRepository
@@ -51,6 +57,81 @@ from brel.services.xml.xml_service import XMLService
 class FilingContext:
     def __init__(self) -> None:
         self.__cache: Dict[str, Any] = {}
+        self.__stages: Dict[
+            ParsingStage, Tuple[Callable[[], None], List[ParsingStage]]
+        ] = {}
+        self.__completed_stages: Set[ParsingStage] = set()
+        self.__running_stages: Set[ParsingStage] = set()
+        self.__failed_stages: Dict[ParsingStage, Exception] = {}
+
+    def register_stage(
+        self,
+        stage: ParsingStage,
+        loader: Callable[[], None],
+        dependencies: List[ParsingStage],
+    ) -> None:
+        """
+        Register a parsing stage that is run on first use.
+        :param stage: The stage to register.
+        :param loader: The function that runs the stage.
+        :param dependencies: The stages that have to be completed before this stage is run.
+        """
+        self.__stages[stage] = (loader, dependencies)
+
+    def require_stages(self, *stages: ParsingStage) -> None:
+        """
+        Run the given stages and their dependencies if they have not been run yet.
+        Stages that were never registered are considered completed. This is the case for filings that are parsed eagerly.
+        :param stages: The stages whose results are needed.
+        :raises RuntimeError: if one of the stages failed before.
+        A failed stage may have left some of its facts, networks or errors behind, so it is not run again.
+        """
+        for stage in stages:
+            if stage in self.__completed_stages or stage not in self.__stages:
+                continue
+
+            if stage in self.__failed_stages:
+                raise RuntimeError(
+                    f"The {stage.value} of the filing could not be parsed. Open the filing again to retry."
+                ) from self.__failed_stages[stage]
+
+            # a running stage is not run again, so the loader can use the getters of the context freely
+            if stage in self.__running_stages:
+                continue
+
+            loader, dependencies = self.__stages[stage]
+            self.require_stages(*dependencies)
+
+            # the repositories are not rolled back if the loader fails, so the stage is marked as failed instead of being run again
+            self.__running_stages.add(stage)
+            try:
+                loader()
+            except Exception as error:
+                self.__failed_stages[stage] = error
+                raise
+            finally:
+                self.__running_stages.discard(stage)
+            self.__completed_stages.add(stage)
+
+    def require_all_stages(self) -> None:
+        """
+        Run all registered stages that have not been run yet.
+        """
+        self.require_stages(*self.__stages.keys())
+
+    def is_stage_completed(self, stage: ParsingStage) -> bool:
+        """
+        :param stage: The stage to check.
+        :returns bool: True if the stage was run or was never registered, False otherwise.
+        """
+        return stage in self.__completed_stages or stage not in self.__stages
+
+    def is_stage_failed(self, stage: ParsingStage) -> bool:
+        """
+        :param stage: The stage to check.
+        :returns bool: True if the loader of the stage raised an error, False otherwise.
+        """
+        return stage in self.__failed_stages
 
     def __lazy_cache[T](self, key: str, factory_function: Callable[[], T]) -> T:
         if key not in self.__cache:
@@ -114,6 +195,12 @@ class FilingContext:
             ),
         )
 
+    def get_compiled_taxonomy_repository(self) -> CompiledTaxonomyRepository:
+        return self.__lazy_cache(
+            "compiled_taxonomy_repository",
+            lambda: create_compiled_taxonomy_repository(),
+        )
+
     def get_xml_repository(self) -> XMLRepository:
         return self.__lazy_cache("xml_repository", lambda: create_xml_repository())
 
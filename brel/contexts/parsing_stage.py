@@ -0,0 +1,37 @@
+"""
+This module contains the stages a filing is parsed in.
+In lazy mode, every stage is run the first time its result is needed.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from enum import Enum
+
+
+class ParsingStage(Enum):
+    REPORT_ELEMENTS = "report_elements"
+    FACTS = "facts"
+    LABEL_NETWORKS = "label_networks"
+    REFERENCE_NETWORKS = "reference_networks"
+    PRESENTATION_NETWORKS = "presentation_networks"
+    CALCULATION_NETWORKS = "calculation_networks"
+    DEFINITION_NETWORKS = "definition_networks"
+    FOOTNOTE_NETWORKS = "footnote_networks"
+    TABLE_LINKBASES = "table_linkbases"
+    COMPONENTS = "components"
+
+
+NETWORK_STAGES = [
+    ParsingStage.LABEL_NETWORKS,
+    ParsingStage.REFERENCE_NETWORKS,
+    ParsingStage.PRESENTATION_NETWORKS,
+    ParsingStage.CALCULATION_NETWORKS,
+    ParsingStage.DEFINITION_NETWORKS,
+    ParsingStage.FOOTNOTE_NETWORKS,
+]
@@ -0,0 +1,62 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from brel.qnames.qname import QName
+from brel.reportelements.i_report_element import IReportElement
+from brel.resource.i_resource import IResource
+
+# a node of a compiled network: the name of the report element or the resource it points to,
+# followed by its arc role, arc name and order
+type CompiledNode = Tuple[QName | IResource, str, QName, float]
+
+# a compiled extended link: its role, its name, its nodes, the edges between the nodes as (parent index, child index)
+# and the indexes of the roots of each of its networks
+type CompiledLink = Tuple[
+    str, QName, List[CompiledNode], List[Tuple[int, int]], List[List[int]]
+]
+
+
+class CompiledTaxonomyRepository(ABC):
+    """
+    Stores the report elements compiled from taxonomy schemas and the extended links compiled from taxonomy linkbases.
+    Entries are keyed by the URI of the document and the hash of its content,
+    so a changed document never returns stale report elements or links.
+    """
+
+    @abstractmethod
+    def get_report_elements(
+        self, uri: str, content_hash: str
+    ) -> Optional[List[IReportElement]]:
+        pass
+
+    @abstractmethod
+    def add_report_elements(
+        self, uri: str, content_hash: str, report_elements: List[IReportElement]
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_links(
+        self, uri: str, content_hash: str, link_name: str
+    ) -> Optional[List[CompiledLink]]:
+        """
+        :param link_name: The local name of the extended links, e.g. "labelLink".
+        :returns: The compiled links of the document in document order. None if the document was not compiled yet.
+        """
+        pass
+
+    @abstractmethod
+    def add_links(
+        self, uri: str, content_hash: str, link_name: str, links: List[CompiledLink]
+    ) -> None:
+        pass
@@ -0,0 +1,131 @@
+"""
+This module persists compiled taxonomy schemas and linkbases on disk.
+Every document is stored as a single zlib-compressed pickle, so loading it takes one read.
+The decompressed entries are also kept in memory, so later filings opened by the same process do not read them again.
+They are unpickled on every read, so every filing gets its own report elements.
+
+Loading a pickle can run arbitrary code, so everyone who can write to the cache location has to be trusted
+by everyone who reads from it. Locations that are writable by all users are refused on POSIX systems.
+
+=================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+=================
+"""
+
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+import threading
+import zlib
+from typing import Any, Dict, List, Optional
+
+from brel.data.compiled_taxonomy.compiled_taxonomy_repository import (
+    CompiledLink,
+    CompiledTaxonomyRepository,
+)
+from brel.reportelements.i_report_element import IReportElement
+
+# bump this whenever the report element, resource or network classes change, so old entries are not unpickled into new classes
+COMPILED_TAXONOMY_FORMAT_VERSION = 3
+
+# the maximum size of the decompressed entries kept in memory per process
+ENTRY_MEMORY_MAX_SIZE = 256 * 1024**2
+
+
+class PickleCompiledTaxonomyRepository(CompiledTaxonomyRepository):
+    # the decompressed entries by their path, shared by all repositories of the process.
+    # entries are only added while they fit, so the taxonomies that were opened first stay in memory.
+    __entry_memory: Dict[str, bytes] = {}
+    __entry_memory_size = 0
+    __entry_memory_lock = threading.Lock()
+
+    def __init__(self, cache_location: str) -> None:
+        """
+        :param cache_location: The directory of the cache. Only users that are trusted by all readers may write to it.
+        :raises PermissionError: If the directory is writable by all users.
+        """
+        self.__cache_location = cache_location
+        os.makedirs(cache_location, exist_ok=True)
+
+        if os.name == "posix" and os.stat(cache_location).st_mode & stat.S_IWOTH:
+            raise PermissionError(
+                f"The compiled taxonomy cache {cache_location} is writable by all users. "
+                "Anyone who can write to it could run code in every process that reads from it."
+            )
+
+    def get_report_elements(
+        self, uri: str, content_hash: str
+    ) -> Optional[List[IReportElement]]:
+        return self.__read(self.__get_path(uri, content_hash, "elements"))
+
+    def add_report_elements(
+        self, uri: str, content_hash: str, report_elements: List[IReportElement]
+    ) -> None:
+        self.__write(self.__get_path(uri, content_hash, "elements"), report_elements)
+
+    def get_links(
+        self, uri: str, content_hash: str, link_name: str
+    ) -> Optional[List[CompiledLink]]:
+        return self.__read(self.__get_path(uri, content_hash, link_name))
+
+    def add_links(
+        self, uri: str, content_hash: str, link_name: str, links: List[CompiledLink]
+    ) -> None:
+        self.__write(self.__get_path(uri, content_hash, link_name), links)
+
+    def __read(self, path: str) -> Optional[Any]:
+        # a corrupt or outdated entry, e.g. one of a class that was renamed or changed, is treated like a missing one
+        # and overwritten on the next add
+        with PickleCompiledTaxonomyRepository.__entry_memory_lock:
+            pickled_entry = PickleCompiledTaxonomyRepository.__entry_memory.get(path)
+
+        if pickled_entry is None:
+            try:
+                with open(path, "rb") as file:
+                    pickled_entry = zlib.decompress(file.read())
+            except Exception:
+                return None
+            self.__remember(path, pickled_entry)
+
+        try:
+            return pickle.loads(pickled_entry)
+        except Exception:
+            return None
+
+    def __write(self, path: str, entry: Any) -> None:
+        pickled_entry = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        data = zlib.compress(pickled_entry)
+
+        # write to a temporary file first, so concurrent readers never see a partial entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.__cache_location)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.__remember(path, pickled_entry)
+
+    def __remember(self, path: str, pickled_entry: bytes) -> None:
+        with PickleCompiledTaxonomyRepository.__entry_memory_lock:
+            entry_memory = PickleCompiledTaxonomyRepository.__entry_memory
+            memory_size = PickleCompiledTaxonomyRepository.__entry_memory_size
+            memory_size -= len(entry_memory.pop(path, b""))
+            if memory_size + len(pickled_entry) <= ENTRY_MEMORY_MAX_SIZE:
+                entry_memory[path] = pickled_entry
+                memory_size += len(pickled_entry)
+            PickleCompiledTaxonomyRepository.__entry_memory_size = memory_size
+
+    def __get_path(self, uri: str, content_hash: str, kind: str) -> str:
+        uri_hash = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        file_name = f"{uri_hash}-{content_hash}-{kind}-v{COMPILED_TAXONOMY_FORMAT_VERSION}.pickle.zz"
+        return os.path.join(self.__cache_location, file_name)
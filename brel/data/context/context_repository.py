@@ -6,7 +6,7 @@ from brel.brel_context import Context
 
 class ContextRepository(ABC):
     @abstractmethod
-    def get_context_copy(self, context_id: str) -> Optional[Context]:
+    def get_context(self, context_id: str) -> Optional[Context]:
         pass
 
     @abstractmethod
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Dict, Optional
 from brel.brel_context import Context
 from brel.data.context.context_repository import ContextRepository
@@ -6,19 +5,18 @@ from brel.data.context.context_repository import ContextRepository
 
 class InMemoryContextRepository(ContextRepository):
     def __init__(self):
-        self.__contexts = {}
+        self.__contexts: Dict[str, Context] = {}
 
-    def get_context_copy(self, context_id: str) -> Optional[Context]:
+    def get_context(self, context_id: str) -> Optional[Context]:
         """
         Retrieves a context from the repository by its context id.
+        The context is shared and must not be modified.
+        Use it as the base of a new Context to add fact specific characteristics.
         :param context_id: The id of the context to retrieve
-        :return: A copy of the context associated with the given context id or
+        :return: The context associated with the given context id or
         None if the context is not found.
         """
-        if context_id not in self.__contexts:
-            return None
-
-        return deepcopy(self.__contexts[context_id])
+        return self.__contexts.get(context_id)
 
     def insert_context(self, context: Context) -> bool:
         """
@@ -0,0 +1,178 @@
+"""
+This module stores errors compactly.
+
+Errors are recorded as small tuples of the error code, the source line and document and the message arguments.
+The lxml element of an error is not kept, so the error does not keep its source tree alive.
+Identical errors are stored once with a count, and messages are only formatted when the errors are read.
+Records are indexed by severity and area.
+
+Badly formed filings can raise the same kind of error tens of thousands of times.
+The number of distinct errors per code can be capped. Errors beyond the cap are only counted.
+
+The repository is thread-safe, so the concurrent downloads of a DTS can report errors to it.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from brel.data.errors.error_repository import ErrorRepository
+from brel.errors.area import Area
+from brel.errors.error_code import ErrorCode
+from brel.errors.error_factory_registry import error_factory_registry
+from brel.errors.error_instance import ErrorInstance
+from brel.errors.severity import Severity
+
+type ErrorRecordKey = Tuple[
+    ErrorCode, Optional[int], Optional[str], Tuple[Tuple[str, str], ...]
+]
+
+
+class CompactErrorRepository(ErrorRepository):
+    def __init__(self, max_per_code: Optional[int] = None) -> None:
+        """
+        :param max_per_code: The maximum number of distinct errors stored per error code. None for no limit.
+        """
+        self.__max_per_code = max_per_code
+        self.__prototypes: Dict[ErrorCode, ErrorInstance] = {}
+        self.__message_fields: Dict[ErrorCode, set[str]] = {}
+        # a record is spread over several lists and indexes, so they are only changed and read under the lock
+        self.__lock = threading.Lock()
+        self.__clear()
+
+    def insert_premade(self, error: ErrorInstance) -> None:
+        # premade errors are kept as they are, as they do not have an error code
+        with self.__lock:
+            index = len(self.__records)
+            self.__records.append(None)
+            self.__counts.append(1)
+            self.__premade_errors[index] = error
+            self.__index(index, error.get_severity(), error.get_area())
+
+    def insert(
+        self,
+        error_code: ErrorCode,
+        error_context: Optional[etree._Element] = None,
+        **kwargs: Optional[str],
+    ) -> None:
+        with self.__lock:
+            prototype = self.__get_prototype(error_code)
+            message_fields = self.__message_fields[error_code]
+        if not message_fields <= kwargs.keys():
+            raise ValueError(
+                f"You have not provided the required arguments for the error {str(prototype.get_full_error_code())}"
+            )
+
+        source_line: Optional[int] = None
+        source_document: Optional[str] = None
+        if error_context is not None:
+            source_line = error_context.sourceline
+            source_document = error_context.getroottree().docinfo.URL
+
+        key: ErrorRecordKey = (
+            error_code,
+            source_line,
+            source_document,
+            # the arguments are formatted into the message anyway, so storing them as strings keeps the key hashable
+            tuple(sorted((name, str(value)) for name, value in kwargs.items())),
+        )
+
+        with self.__lock:
+            index = self.__record_indexes.get(key)
+            if index is not None:
+                self.__counts[index] += 1
+                return
+
+            if (
+                self.__max_per_code is not None
+                and self.__code_counts[error_code] >= self.__max_per_code
+            ):
+                self.__suppressed_counts[error_code] += 1
+                return
+
+            index = len(self.__records)
+            self.__records.append(key)
+            self.__counts.append(1)
+            self.__record_indexes[key] = index
+            self.__code_counts[error_code] += 1
+            self.__index(index, prototype.get_severity(), prototype.get_area())
+
+    def get_all(self) -> list[ErrorInstance]:
+        with self.__lock:
+            return [self.__materialize(index) for index in range(len(self.__records))]
+
+    def get_by_severity(self, severity: Severity) -> list[ErrorInstance]:
+        with self.__lock:
+            return [
+                self.__materialize(index) for index in self.__severity_indexes[severity]
+            ]
+
+    def get_by_area(self, area: Area) -> list[ErrorInstance]:
+        with self.__lock:
+            return [self.__materialize(index) for index in self.__area_indexes[area]]
+
+    def get_total_count(self) -> int:
+        with self.__lock:
+            return sum(self.__counts) + sum(self.__suppressed_counts.values())
+
+    def get_suppressed_counts(self) -> Dict[ErrorCode, int]:
+        """
+        :returns dict[ErrorCode, int]: The number of errors per code that were dropped because of the cap.
+        """
+        with self.__lock:
+            return dict(self.__suppressed_counts)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__clear()
+
+    def __clear(self) -> None:
+        self.__records: List[Optional[ErrorRecordKey]] = []
+        self.__counts: List[int] = []
+        self.__record_indexes: Dict[ErrorRecordKey, int] = {}
+        self.__premade_errors: Dict[int, ErrorInstance] = {}
+        self.__severity_indexes: Dict[Severity, List[int]] = defaultdict(list)
+        self.__area_indexes: Dict[Area, List[int]] = defaultdict(list)
+        self.__code_counts: Dict[ErrorCode, int] = defaultdict(int)
+        self.__suppressed_counts: Dict[ErrorCode, int] = defaultdict(int)
+
+    def __index(self, index: int, severity: Severity, area: Area) -> None:
+        self.__severity_indexes[severity].append(index)
+        self.__area_indexes[area].append(index)
+
+    def __get_prototype(self, error_code: ErrorCode) -> ErrorInstance:
+        """
+        The factory of an error code is called once, to know the severity, area and message arguments of its errors.
+        """
+        prototype = self.__prototypes.get(error_code)
+        if prototype is None:
+            error_instance_factory = error_factory_registry.get(error_code)
+            if not error_instance_factory:
+                raise ValueError(f"Error code {error_code} is not valid.")
+
+            prototype = error_instance_factory()
+            self.__prototypes[error_code] = prototype
+            self.__message_fields[error_code] = prototype.get_message_fields()
+        return prototype
+
+    def __materialize(self, index: int) -> ErrorInstance:
+        premade_error = self.__premade_errors.get(index)
+        if premade_error is not None:
+            return premade_error
+
+        error_code, source_line, source_document, arguments = self.__records[index]  # type: ignore
+        error_instance = error_factory_registry[error_code]()
+        error_instance.set_message_arguments(**dict(arguments))
+        error_instance.set_source(source_line, source_document)
+        error_instance.set_count(self.__counts[index])
+        return error_instance
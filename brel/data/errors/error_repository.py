@@ -12,6 +12,7 @@ from lxml import etree
 from abc import ABC, abstractmethod
 from typing import Callable, Optional, final
 
+from brel.errors.area import Area
 from brel.errors.error_factory_registry import error_factory_registry
 from brel.errors.error_code import ErrorCode
 from brel.errors.error_instance import ErrorInstance
@@ -19,14 +20,49 @@ from brel.errors.severity import Severity
 
 
 class ErrorRepository(ABC):
+    """
+    Implementations have to be thread-safe, as the files of a DTS are fetched by concurrent workers that report their errors.
+    """
+
     @abstractmethod
     def insert_premade(self, error: ErrorInstance) -> None:
         pass
 
+    @abstractmethod
+    def insert(
+        self,
+        error_code: ErrorCode,
+        error_context: Optional[etree._Element] = None,
+        **kwargs: Optional[str],
+    ) -> None:
+        """
+        Record an error.
+        :param error_code: The code of the error.
+        :param error_context: The lxml element the error occurred at.
+        :param kwargs: The arguments of the error message.
+        :raises ValueError: If the error code is unknown or an argument of the message is missing.
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> list[ErrorInstance]:
         pass
 
+    @abstractmethod
+    def get_by_severity(self, severity: Severity) -> list[ErrorInstance]:
+        pass
+
+    @abstractmethod
+    def get_by_area(self, area: Area) -> list[ErrorInstance]:
+        pass
+
+    @abstractmethod
+    def get_total_count(self) -> int:
+        """
+        :returns int: The number of errors that were inserted, including duplicates and suppressed errors.
+        """
+        pass
+
     @abstractmethod
     def clear(self) -> None:
         pass
@@ -48,21 +84,7 @@ class ErrorRepository(ABC):
 
         return error_instance
 
-    @final
-    def insert(
-        self,
-        error_code: ErrorCode,
-        error_context: Optional[etree._Element] = None,
-        **kwargs: Optional[str],
-    ) -> None:
-        error_instance = self.create(error_code, error_context, **kwargs)
-        self.insert_premade(error_instance)
-
     @final
     def upsert_if(self, condition: bool, error: ErrorInstance) -> None:
         if condition:
             self.insert_premade(error)
-
-    @final
-    def get_by_severity(self, severity: Severity) -> list[ErrorInstance]:
-        return [error for error in self.get_all() if error.get_severity() == severity]
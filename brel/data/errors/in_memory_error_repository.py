@@ -8,19 +8,47 @@
 ====================
 """
 
+from typing import Optional
+
+from lxml import etree
+
 from brel.data.errors.error_repository import ErrorRepository
+from brel.errors.area import Area
+from brel.errors.error_code import ErrorCode
 from brel.errors.error_instance import ErrorInstance
+from brel.errors.severity import Severity
 
 
 class InMemoryErrorRepository(ErrorRepository):
+    """
+    Keeps every error with its lxml element. Use the compact error repository for large or badly formed filings.
+    """
+
     def __init__(self) -> None:
         self.errors: list[ErrorInstance] = []
 
     def insert_premade(self, error: ErrorInstance) -> None:
         self.errors.append(error)
 
+    def insert(
+        self,
+        error_code: ErrorCode,
+        error_context: Optional[etree._Element] = None,
+        **kwargs: Optional[str],
+    ) -> None:
+        self.insert_premade(self.create(error_code, error_context, **kwargs))
+
     def get_all(self) -> list[ErrorInstance]:
         return self.errors
 
+    def get_by_severity(self, severity: Severity) -> list[ErrorInstance]:
+        return [error for error in self.errors if error.get_severity() == severity]
+
+    def get_by_area(self, area: Area) -> list[ErrorInstance]:
+        return [error for error in self.errors if error.get_area() == area]
+
+    def get_total_count(self) -> int:
+        return len(self.errors)
+
     def clear(self) -> None:
         self.errors.clear()
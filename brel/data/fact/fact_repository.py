@@ -2,15 +2,57 @@
 ====================
 
 - author: Robin Schmidiger
-- version: 0.2
-- date: 15 April 2025
+- version: 0.3
+- date: 18 October 2026
 
 ====================
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Hashable, Mapping, Optional, Tuple
 from brel.brel_fact import Fact
+from brel.characteristics import (
+    EntityCharacteristic,
+    PeriodCharacteristic,
+    UnitCharacteristic,
+)
+from brel.qnames.qname import QName
+from brel.reportelements.concept import Concept
+
+
+# the key of an index of the fact repository, e.g. ("period", "2023-01-01 - 2023-12-31")
+type FactIndexKey = Tuple[Hashable, ...]
+
+CORE_INDEX_KEY: FactIndexKey = ("core",)
+
+
+def concept_index_key(concept_qname: QName) -> FactIndexKey:
+    return ("concept", concept_qname)
+
+
+def period_index_key(period: PeriodCharacteristic) -> FactIndexKey:
+    return ("period", str(period))
+
+
+def entity_index_key(entity: EntityCharacteristic) -> FactIndexKey:
+    return ("entity", entity.get_value())
+
+
+def unit_index_key(unit: UnitCharacteristic) -> FactIndexKey:
+    return ("unit", unit.get_value())
+
+
+def dimension_index_key(
+    dimension_qname: QName, member: Optional[QName | str] = None
+) -> FactIndexKey:
+    """
+    :param dimension_qname: The name of the dimension.
+    :param member: If set, the key of the facts with this member.
+    For explicit dimensions, this is the name of the member. For typed dimensions, this is the value as a string.
+    """
+    if member is None:
+        return ("dimension", dimension_qname)
+    return ("member", dimension_qname, member)
 
 
 class FactRepository(ABC):
@@ -30,6 +72,46 @@ class FactRepository(ABC):
     def get_all(self) -> list[Fact]:
         pass
 
+    @abstractmethod
+    def get_all_core(self) -> list[Fact]:
+        pass
+
+    @abstractmethod
+    def get_by_concept(self, concept_qname: QName) -> list[Fact]:
+        pass
+
+    @abstractmethod
+    def get_by_period(self, period: PeriodCharacteristic) -> list[Fact]:
+        pass
+
+    @abstractmethod
+    def get_by_entity(self, entity: EntityCharacteristic) -> list[Fact]:
+        pass
+
+    @abstractmethod
+    def get_by_unit(self, unit: UnitCharacteristic) -> list[Fact]:
+        pass
+
+    @abstractmethod
+    def get_by_dimension(
+        self, dimension_qname: QName, member: Optional[QName | str] = None
+    ) -> list[Fact]:
+        pass
+
+    @abstractmethod
+    def get_index(self, key: FactIndexKey) -> Mapping[str, Fact]:
+        """
+        Get the facts of an index without copying them.
+        The mapping must not be changed and is only valid until the next upsert.
+        :param key: The key of the index, e.g. period_index_key(period).
+        :returns: The facts of the index by their id, in insertion order.
+        """
+        pass
+
+    @abstractmethod
+    def get_reported_concepts(self) -> list[Concept]:
+        pass
+
     @abstractmethod
     def upsert(self, fact: Fact) -> None:
         pass
@@ -2,21 +2,48 @@
 ====================
 
 - author: Robin Schmidiger
-- version: 0.1
-- date: 9 April 2025
+- version: 0.2
+- date: 18 October 2026
 
 ====================
 """
 
-from typing import Optional
-from brel.data.fact.fact_repository import FactRepository
+from typing import Dict, List, Mapping, Optional
+from brel.data.fact.fact_repository import (
+    CORE_INDEX_KEY,
+    FactIndexKey,
+    FactRepository,
+    concept_index_key,
+    dimension_index_key,
+    entity_index_key,
+    period_index_key,
+    unit_index_key,
+)
 from brel.brel_fact import Fact
+from brel.characteristics import (
+    EntityCharacteristic,
+    ExplicitDimensionCharacteristic,
+    PeriodCharacteristic,
+    TypedDimensionCharacteristic,
+    UnitCharacteristic,
+)
+from brel.qnames.qname import QName
+from brel.reportelements.concept import Concept
 
 
 class InMemoryFactRepository(FactRepository):
+    """
+    Stores the facts by their id.
+    Additionally, the facts are indexed by concept, period, entity, unit and dimension/member.
+    The indexes are maintained on upsert, so lookups only touch the matching facts.
+    """
+
     def __init__(self) -> None:
         self.__facts_by_id: dict[str, Fact] = {}
         self.__facts_without_id: list[Fact] = []
+        # index key -> fact id -> fact, for the concepts, periods, entities, units and dimensions.
+        # the inner dicts keep the insertion order of the facts.
+        self.__indexes: Dict[FactIndexKey, Dict[str, Fact]] = {}
 
     def get_by_id(self, id: str) -> Fact:
         return self.__facts_by_id[id]
@@ -33,6 +60,45 @@ class InMemoryFactRepository(FactRepository):
     def get_all(self):
         return list(self.__facts_by_id.values())
 
+    def get_all_core(self) -> list[Fact]:
+        return list(self.get_index(CORE_INDEX_KEY).values())
+
+    def get_by_concept(self, concept_qname: QName) -> list[Fact]:
+        return list(self.get_index(concept_index_key(concept_qname)).values())
+
+    def get_by_period(self, period: PeriodCharacteristic) -> list[Fact]:
+        return list(self.get_index(period_index_key(period)).values())
+
+    def get_by_entity(self, entity: EntityCharacteristic) -> list[Fact]:
+        return list(self.get_index(entity_index_key(entity)).values())
+
+    def get_by_unit(self, unit: UnitCharacteristic) -> list[Fact]:
+        return list(self.get_index(unit_index_key(unit)).values())
+
+    def get_by_dimension(
+        self, dimension_qname: QName, member: Optional[QName | str] = None
+    ) -> list[Fact]:
+        """
+        Get all facts that have a characteristic for the given dimension.
+        :param dimension_qname: The name of the dimension.
+        :param member: If set, only facts with this member are returned.
+        For explicit dimensions, this is the name of the member. For typed dimensions, this is the value as a string.
+        :returns: The matching facts.
+        """
+        return list(
+            self.get_index(dimension_index_key(dimension_qname, member)).values()
+        )
+
+    def get_index(self, key: FactIndexKey) -> Mapping[str, Fact]:
+        return self.__indexes.get(key, {})
+
+    def get_reported_concepts(self) -> list[Concept]:
+        return [
+            next(iter(facts.values())).get_concept()
+            for key, facts in self.__indexes.items()
+            if key[0] == "concept"
+        ]
+
     def upsert(self, fact: Fact) -> None:
         """
         Set the fact by its ID.
@@ -41,5 +107,53 @@ class InMemoryFactRepository(FactRepository):
         fact_id = fact.get_id()
         if fact_id is None:
             self.__facts_without_id.append(fact)
-        else:
-            self.__facts_by_id[fact_id] = fact
+            return
+
+        previous_fact = self.__facts_by_id.get(fact_id)
+        if previous_fact is not None:
+            for key in self.__get_index_keys(previous_fact):
+                del self.__indexes[key][fact_id]
+                if not self.__indexes[key]:
+                    del self.__indexes[key]
+
+        self.__facts_by_id[fact_id] = fact
+
+        for key in self.__get_index_keys(fact):
+            self.__indexes.setdefault(key, {})[fact_id] = fact
+
+    def __get_index_keys(self, fact: Fact) -> List[FactIndexKey]:
+        keys: List[FactIndexKey] = [concept_index_key(fact.get_concept().get_name())]
+
+        if fact.is_core():
+            keys.append(CORE_INDEX_KEY)
+
+        period = fact.get_period()
+        if period is not None:
+            keys.append(period_index_key(period))
+
+        entity = fact.get_entity()
+        if entity is not None:
+            keys.append(entity_index_key(entity))
+
+        unit = fact.get_unit()
+        if unit is not None:
+            keys.append(unit_index_key(unit))
+
+        for aspect in fact.get_aspects():
+            if aspect.is_core():
+                continue
+
+            characteristic = fact.get_characteristic(aspect)
+            if isinstance(characteristic, ExplicitDimensionCharacteristic):
+                dimension_qname = characteristic.get_dimension().get_name()
+                member: QName | str = characteristic.get_member().get_name()
+            elif isinstance(characteristic, TypedDimensionCharacteristic):
+                dimension_qname = characteristic.get_dimension().get_name()
+                member = characteristic.get_value()
+            else:
+                continue
+
+            keys.append(dimension_index_key(dimension_qname))
+            keys.append(dimension_index_key(dimension_qname, member))
+
+        return keys
@@ -9,10 +9,18 @@
 """
 
 import os
+from typing import Optional
 from brel.data.aspect.aspect_repository import AspectRepository
 from brel.data.aspect.in_memory_aspect_repository import InMemoryAspectRepository
 from brel.data.context.context_repository import ContextRepository
 from brel.data.context.in_memory_context_repository import InMemoryContextRepository
+from brel.data.compiled_taxonomy.compiled_taxonomy_repository import (
+    CompiledTaxonomyRepository,
+)
+from brel.data.compiled_taxonomy.pickle_compiled_taxonomy_repository import (
+    PickleCompiledTaxonomyRepository,
+)
+from brel.data.file.blob_file_repository import BlobFileRepository
 from brel.data.file.file_repository import FileRepository
 from brel.data.file.pyfs_file_repository import PyFsFileRepository
 from brel.data.namespace.in_memory_namespace_repository import (
@@ -23,7 +31,7 @@ from brel.data.report_element.in_memory_report_element_repository import (
     InMemoryReportElementRepository,
 )
 from brel.data.report_element.report_element_repository import ReportElementRepository
-from brel.data.errors.in_memory_error_repository import InMemoryErrorRepository
+from brel.data.errors.compact_error_repository import CompactErrorRepository
 from brel.data.errors.error_repository import ErrorRepository
 from brel.data.fact.fact_repository import FactRepository
 from brel.data.fact.in_memory_fact_repository import InMemoryFactRepository
@@ -52,8 +60,12 @@ def create_report_element_repository() -> ReportElementRepository:
     return InMemoryReportElementRepository()
 
 
+# distinct errors stored per error code. further errors of the same code are only counted.
+ERRORS_PER_CODE_LIMIT = 1000
+
+
 def create_error_repository() -> ErrorRepository:
-    return InMemoryErrorRepository()
+    return CompactErrorRepository(max_per_code=ERRORS_PER_CODE_LIMIT)
 
 
 def create_component_repository() -> ComponentRepository:
@@ -84,9 +96,32 @@ def create_namespace_repository() -> NamespaceRepository:
     return InMemoryNamespaceRepository()
 
 
+FILE_CACHE_MAX_SIZE = 2 * 1024**3
+
+
 def create_file_repository() -> FileRepository:
-    cache_location = os.path.join(os.path.expanduser("~"), ".brel", "dts_cache")
-    return PyFsFileRepository(cache_location, clear_cache=False)
+    cache_location = os.path.join(os.path.expanduser("~"), ".brel", "file_cache")
+
+    # files of the older text cache are moved over on their first use
+    legacy_cache_location = os.path.join(os.path.expanduser("~"), ".brel", "dts_cache")
+    legacy_repository: Optional[FileRepository] = None
+    if os.path.isdir(legacy_cache_location):
+        legacy_repository = PyFsFileRepository(legacy_cache_location, clear_cache=False)
+
+    return BlobFileRepository(
+        cache_location,
+        max_size=FILE_CACHE_MAX_SIZE,
+        legacy_repository=legacy_repository,
+    )
+
+
+def create_compiled_taxonomy_repository() -> CompiledTaxonomyRepository:
+    # set BREL_COMPILED_TAXONOMY_CACHE to keep the compiled taxonomies somewhere else, e.g. on a shared drive.
+    # the entries are pickles, so only trusted users may write to that location
+    cache_location = os.environ.get("BREL_COMPILED_TAXONOMY_CACHE") or os.path.join(
+        os.path.expanduser("~"), ".brel", "compiled_taxonomy_cache"
+    )
+    return PickleCompiledTaxonomyRepository(cache_location)
 
 
 def create_xml_repository() -> XMLRepository:
@@ -0,0 +1,235 @@
+"""
+This module caches files on disk by their content.
+
+Every file is stored once as a blob named after the SHA-256 hash of its content, optionally zlib-compressed.
+A small index entry per URI points to the blob, so identical files downloaded from different URIs share one blob.
+The metadata of a URI, such as its HTTP validators, is stored next to its index entry.
+Blobs and index entries are written to temporary files first and then renamed,
+so several processes can share the cache without ever reading a partial file.
+
+The cache is bounded. When it grows past its maximum size, the least recently used blobs are removed.
+Index entries of removed blobs are treated like missing entries.
+The repository is thread-safe. The size of the cache is only updated and trimmed under a lock.
+
+Files that are only found in a legacy repository, such as the older per-URI text cache, are imported on their first read.
+
+=================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+=================
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import zlib
+from io import BytesIO
+from typing import IO, Dict, List, Optional, Tuple, cast
+
+from brel.data.file.file_repository import FileRepository
+
+COMPRESSED_BLOB_SUFFIX = ".zz"
+RAW_BLOB_SUFFIX = ".blob"
+
+
+class BlobFileRepository(FileRepository):
+    def __init__(
+        self,
+        cache_location: str,
+        max_size: Optional[int] = None,
+        compress: bool = True,
+        legacy_repository: Optional[FileRepository] = None,
+    ) -> None:
+        """
+        :param cache_location: The directory of the cache.
+        :param max_size: The maximum size of all blobs in bytes. None for an unbounded cache.
+        :param compress: If True, new blobs are zlib-compressed. Otherwise, they are stored raw and read through a memory map.
+        :param legacy_repository: A repository that is read when a file is not in the cache. Its files are copied into the cache.
+        """
+        self.__blob_location = os.path.join(cache_location, "blobs")
+        self.__index_location = os.path.join(cache_location, "index")
+        self.__max_size = max_size
+        self.__compress = compress
+        self.__legacy_repository = legacy_repository
+        # the size is estimated per process and corrected whenever the cache is trimmed
+        self.__size: Optional[int] = None
+        self.__size_lock = threading.Lock()
+
+        os.makedirs(self.__blob_location, exist_ok=True)
+        os.makedirs(self.__index_location, exist_ok=True)
+
+    def add_file(self, uri: str, file: IO[bytes]) -> None:
+        content = file.read()
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        blob_path = self.__find_blob(content_hash)
+        if blob_path is not None:
+            self.__touch(blob_path)
+        else:
+            if self.__compress:
+                data = zlib.compress(content)
+                blob_path = self.__get_blob_path(content_hash, COMPRESSED_BLOB_SUFFIX)
+            else:
+                data = content
+                blob_path = self.__get_blob_path(content_hash, RAW_BLOB_SUFFIX)
+
+            self.__write_atomic(blob_path, data)
+            with self.__size_lock:
+                self.__add_size(len(data))
+
+        self.__write_atomic(self.__get_index_path(uri), content_hash.encode("ascii"))
+        with self.__size_lock:
+            self.__trim()
+
+    def get_file(self, uri: str) -> IO[bytes]:
+        blob_path = self.__find_blob_of_uri(uri)
+        if blob_path is None and self.__has_legacy_file(uri):
+            with self.__legacy_repository.get_file(uri) as legacy_file:  # type: ignore
+                self.add_file(uri, legacy_file)
+            blob_path = self.__find_blob_of_uri(uri)
+
+        if blob_path is None:
+            raise FileNotFoundError(f"{uri} is not in the file cache")
+
+        self.__touch(blob_path)
+
+        with open(blob_path, "rb") as blob_file:
+            if os.fstat(blob_file.fileno()).st_size == 0:
+                return BytesIO(b"")
+
+            mapped_blob = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if blob_path.endswith(COMPRESSED_BLOB_SUFFIX):
+            with mapped_blob:
+                return BytesIO(zlib.decompress(mapped_blob))
+
+        # the memory map stays valid after the file is closed and is released when it is closed itself
+        return cast(IO[bytes], mapped_blob)
+
+    def has_file(self, uri: str) -> bool:
+        return self.__find_blob_of_uri(uri) is not None or self.__has_legacy_file(uri)
+
+    def get_metadata(self, uri: str) -> Optional[Dict[str, str]]:
+        try:
+            with open(self.__get_index_path(uri) + ".json", "rb") as metadata_file:
+                return json.loads(metadata_file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def set_metadata(self, uri: str, metadata: Dict[str, str]) -> None:
+        self.__write_atomic(
+            self.__get_index_path(uri) + ".json", json.dumps(metadata).encode("utf-8")
+        )
+
+    def get_size(self) -> int:
+        """
+        :returns int: The size of all blobs in the cache in bytes.
+        """
+        return sum(size for _, size, _ in self.__list_blobs())
+
+    def __has_legacy_file(self, uri: str) -> bool:
+        return (
+            self.__legacy_repository is not None
+            and self.__legacy_repository.has_file(uri)
+        )
+
+    def __find_blob_of_uri(self, uri: str) -> Optional[str]:
+        try:
+            with open(self.__get_index_path(uri), "rb") as index_file:
+                content_hash = index_file.read().decode("ascii").strip()
+        except FileNotFoundError:
+            return None
+
+        return self.__find_blob(content_hash)
+
+    def __find_blob(self, content_hash: str) -> Optional[str]:
+        for suffix in (COMPRESSED_BLOB_SUFFIX, RAW_BLOB_SUFFIX):
+            blob_path = self.__get_blob_path(content_hash, suffix)
+            if os.path.exists(blob_path):
+                return blob_path
+        return None
+
+    def __get_blob_path(self, content_hash: str, suffix: str) -> str:
+        # blobs are spread over subdirectories, so no directory gets too large
+        return os.path.join(
+            self.__blob_location, content_hash[:2], content_hash + suffix
+        )
+
+    def __get_index_path(self, uri: str) -> str:
+        uri_hash = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        return os.path.join(self.__index_location, uri_hash[:2], uri_hash)
+
+    def __write_atomic(self, path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def __touch(self, blob_path: str) -> None:
+        try:
+            os.utime(blob_path)
+        except OSError:
+            # the blob was evicted by another process in the meantime
+            pass
+
+    def __add_size(self, size: int) -> None:
+        if self.__size is None:
+            self.__size = self.get_size()
+        else:
+            self.__size += size
+
+    def __trim(self) -> None:
+        """
+        Remove the least recently used blobs until the cache is below 90% of its maximum size.
+        """
+        if self.__max_size is None or self.__size is None:
+            return
+        if self.__size <= self.__max_size:
+            return
+
+        blobs = sorted(self.__list_blobs(), key=lambda blob: blob[2])
+        size = sum(blob_size for _, blob_size, _ in blobs)
+        target_size = self.__max_size * 9 // 10
+
+        for blob_path, blob_size, _ in blobs:
+            if size <= target_size:
+                break
+            try:
+                os.remove(blob_path)
+                size -= blob_size
+            except OSError:
+                # removed by another process or still mapped on platforms that lock mapped files
+                pass
+
+        self.__size = size
+
+    def __list_blobs(self) -> List[Tuple[str, int, float]]:
+        """
+        :returns: The path, size and last access time of every blob.
+        """
+        blobs: List[Tuple[str, int, float]] = []
+        for directory_path, _, file_names in os.walk(self.__blob_location):
+            for file_name in file_names:
+                if not file_name.endswith((COMPRESSED_BLOB_SUFFIX, RAW_BLOB_SUFFIX)):
+                    continue
+                blob_path = os.path.join(directory_path, file_name)
+                try:
+                    stat = os.stat(blob_path)
+                except OSError:
+                    continue
+                blobs.append((blob_path, stat.st_size, stat.st_mtime))
+        return blobs
@@ -9,10 +9,14 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import IO
+from typing import IO, Dict, Optional
 
 
 class FileRepository(ABC):
+    """
+    Implementations have to be thread-safe, as the files of a DTS are fetched by concurrent workers.
+    """
+
     @abstractmethod
     def get_file(self, uri: str) -> IO[bytes]:
         pass
@@ -24,3 +28,15 @@ class FileRepository(ABC):
     @abstractmethod
     def add_file(self, uri: str, file: IO[bytes]) -> None:
         pass
+
+    @abstractmethod
+    def get_metadata(self, uri: str) -> Optional[Dict[str, str]]:
+        """
+        :param uri: The URI of a file.
+        :returns: The metadata stored for the file, e.g. the HTTP validators it was downloaded with. None if there is none.
+        """
+        pass
+
+    @abstractmethod
+    def set_metadata(self, uri: str, metadata: Dict[str, str]) -> None:
+        pass
@@ -11,10 +11,11 @@ It downloads and caches files from the internet and the local file system.
 =================
 """
 
+import json
 import fs
 from brel.data.file.file_repository import FileRepository
 from brel.parsers.utils.file_utils import uri_to_filename
-from typing import IO
+from typing import IO, Dict, Optional
 
 
 class PyFsFileRepository(FileRepository):
@@ -40,3 +41,12 @@ class PyFsFileRepository(FileRepository):
     def has_file(self, uri: str) -> bool:
         file_name = uri_to_filename(uri)
         return self.fs.exists(file_name)
+
+    def get_metadata(self, uri: str) -> Optional[Dict[str, str]]:
+        metadata_file_name = uri_to_filename(uri) + ".meta.json"
+        if not self.fs.exists(metadata_file_name):
+            return None
+        return json.loads(self.fs.readtext(metadata_file_name))
+
+    def set_metadata(self, uri: str, metadata: Dict[str, str]) -> None:
+        self.fs.writetext(uri_to_filename(uri) + ".meta.json", json.dumps(metadata))
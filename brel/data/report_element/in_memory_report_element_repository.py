@@ -8,15 +8,39 @@
 ====================
 """
 
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Optional, cast
+
 from brel.data.report_element.report_element_repository import ReportElementRepository
 from brel.reportelements.i_report_element import IReportElement
 from brel.qnames.qname import QName
 
 
 class InMemoryReportElementRepository(ReportElementRepository):
+    """
+    Keeps the report elements indexed by their type and by the parts of their name,
+    so lookups by local name, prefix, namespace or type do not scan the whole repository.
+    The buckets of the indexes are dicts keyed by qname, so a replaced report element is also replaced in its buckets.
+    """
+
     def __init__(self) -> None:
         self.__elements_by_qname: dict[QName, IReportElement] = {}
         self.__elements_by_id: dict[str, IReportElement] = {}
+        self.__elements_by_type: dict[type, dict[QName, IReportElement]] = defaultdict(
+            dict
+        )
+        self.__elements_by_local_name: dict[
+            str, dict[QName, IReportElement]
+        ] = defaultdict(dict)
+        self.__elements_by_prefix: dict[str, dict[QName, IReportElement]] = defaultdict(
+            dict
+        )
+        self.__elements_by_uri: dict[str, dict[QName, IReportElement]] = defaultdict(
+            dict
+        )
+        # built on the first search by the start of a local name and dropped when a new local name is added
+        self.__sorted_local_names: Optional[list[str]] = None
 
     def has_qname(self, qname: QName) -> bool:
         return qname in self.__elements_by_qname
@@ -39,10 +63,64 @@ class InMemoryReportElementRepository(ReportElementRepository):
         return self.__elements_by_id[id]
 
     def upsert(self, report_element: IReportElement) -> None:
-        self.__elements_by_qname[report_element.get_name()] = report_element
+        qname = report_element.get_name()
+
+        replaced_element = self.__elements_by_qname.get(qname)
+        if replaced_element is not None:
+            del self.__elements_by_type[type(replaced_element)][qname]
+
+        self.__elements_by_qname[qname] = report_element
         report_element_id = report_element.get_id()
         if report_element_id is not None:
             self.__elements_by_id[report_element_id] = report_element
 
+        if qname.local_name not in self.__elements_by_local_name:
+            self.__sorted_local_names = None
+
+        self.__elements_by_type[type(report_element)][qname] = report_element
+        self.__elements_by_local_name[qname.local_name][qname] = report_element
+        self.__elements_by_prefix[qname.prefix][qname] = report_element
+        self.__elements_by_uri[qname.uri][qname] = report_element
+
     def get_all(self) -> list[IReportElement]:
         return list(self.__elements_by_qname.values())
+
+    def get_all_typed[T: IReportElement](self, report_element_type: type[T]) -> list[T]:
+        # the elements are grouped by their type, so every element of a matching group is a T
+        return cast(
+            list[T],
+            [
+                element
+                for element_type, elements in self.__elements_by_type.items()
+                if issubclass(element_type, report_element_type)
+                for element in elements.values()
+            ],
+        )
+
+    def get_by_local_name(self, local_name: str) -> list[IReportElement]:
+        return self.__get_bucket(self.__elements_by_local_name, local_name)
+
+    def get_by_prefix(self, prefix: str) -> list[IReportElement]:
+        return self.__get_bucket(self.__elements_by_prefix, prefix)
+
+    def get_by_uri(self, uri: str) -> list[IReportElement]:
+        return self.__get_bucket(self.__elements_by_uri, uri)
+
+    def get_by_local_name_start(self, start: str) -> list[IReportElement]:
+        if self.__sorted_local_names is None:
+            self.__sorted_local_names = sorted(self.__elements_by_local_name.keys())
+
+        elements: list[IReportElement] = []
+        index = bisect_left(self.__sorted_local_names, start)
+        while index < len(self.__sorted_local_names) and self.__sorted_local_names[
+            index
+        ].startswith(start):
+            elements.extend(self.get_by_local_name(self.__sorted_local_names[index]))
+            index += 1
+        return elements
+
+    def __get_bucket(
+        self, index: dict[str, dict[QName, IReportElement]], key: str
+    ) -> list[IReportElement]:
+        # .get instead of [], so lookups of unknown keys do not add empty buckets to the defaultdict
+        return list(index.get(key, {}).values())
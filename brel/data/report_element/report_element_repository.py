@@ -38,6 +38,27 @@ class ReportElementRepository(ABC):
     def get_all(self) -> list[IReportElement]:
         pass
 
+    @abstractmethod
+    def get_by_local_name(self, local_name: str) -> list[IReportElement]:
+        pass
+
+    @abstractmethod
+    def get_by_prefix(self, prefix: str) -> list[IReportElement]:
+        pass
+
+    @abstractmethod
+    def get_by_uri(self, uri: str) -> list[IReportElement]:
+        pass
+
+    @abstractmethod
+    def get_by_local_name_start(self, start: str) -> list[IReportElement]:
+        """
+        Get all report elements whose local name starts with a string, e.g. for autocompletion.
+        :param start: The start of the local name.
+        :return: The report elements, sorted by local name.
+        """
+        pass
+
     def get_typed_by_qname[
         T: IReportElement
     ](self, qname: QName, report_element_type: type[T]) -> T:
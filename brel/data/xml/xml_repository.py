@@ -11,14 +11,19 @@ The XMLSchemaManager class is responsible for downloading and caching XBRL taxon
 =================
 """
 
+from typing import List, Optional, Tuple
+
 import lxml
 import lxml.etree
+from brel.parsers.utils.lxml_utils import get_all_nsmaps
 from brel.parsers.utils.lxml_xpath_utils import add_xpath_functions
 
 
 class XMLRepository:
     def __init__(self) -> None:
         self.__xml_etree_cache: dict[str, lxml.etree._ElementTree] = {}
+        self.__content_hashes: dict[str, str] = {}
+        self.__namespaces: dict[str, List[Tuple[str, str]]] = {}
         add_xpath_functions()
 
     def normalize_uri(self, uri: str) -> str:
@@ -36,5 +41,47 @@ class XMLRepository:
     def get_all_etrees(self) -> list[lxml.etree._ElementTree]:
         return list(self.__xml_etree_cache.values())
 
-    def add_etree(self, uri: str, etree: lxml.etree._ElementTree) -> None:
-        self.__xml_etree_cache[self.normalize_uri(uri)] = etree
+    def get_all_uris(self) -> list[str]:
+        return list(self.__xml_etree_cache.keys())
+
+    def get_content_hash(self, uri: str) -> Optional[str]:
+        return self.__content_hashes.get(self.normalize_uri(uri))
+
+    def get_namespaces(self, uri: str) -> List[Tuple[str, str]]:
+        return self.__namespaces[self.normalize_uri(uri)]
+
+    def get_all_namespaces(self) -> List[Tuple[str, str]]:
+        """
+        :returns: The distinct (prefix, uri) namespace declarations of all documents.
+        """
+        all_namespaces: dict[Tuple[str, str], None] = {}
+        for namespaces in self.__namespaces.values():
+            all_namespaces.update(dict.fromkeys(namespaces))
+        return list(all_namespaces.keys())
+
+    def add_etree(
+        self,
+        uri: str,
+        etree: lxml.etree._ElementTree,
+        content_hash: Optional[str] = None,
+        namespaces: Optional[List[Tuple[str, str]]] = None,
+    ) -> None:
+        """
+        Add a parsed document.
+        :param namespaces: The (prefix, uri) namespace declarations of the document, as collected by the parser.
+        If None, they are collected from the tree, which visits every element.
+        """
+        normalized_uri = self.normalize_uri(uri)
+        self.__xml_etree_cache[normalized_uri] = etree
+        if content_hash is not None:
+            self.__content_hashes[normalized_uri] = content_hash
+
+        if namespaces is None:
+            namespaces = list(
+                {
+                    (prefix, namespace_uri): None
+                    for nsmap in get_all_nsmaps([etree])
+                    for prefix, namespace_uri in nsmap.items()
+                }.keys()
+            )
+        self.__namespaces[normalized_uri] = namespaces
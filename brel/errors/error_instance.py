@@ -1,4 +1,5 @@
-from typing import Callable, Optional, Self, cast, final
+from string import Formatter
+from typing import Callable, Dict, Optional, Self, cast, final
 from lxml import etree
 
 from brel.errors.area import Area
@@ -24,6 +25,10 @@ class ErrorInstance:
         self.__hint = hint
         self.__xbrl_error_code = xbrl_error_code
         self.__context: Optional[etree._Element] = None
+        self.__message_arguments: Optional[Dict[str, Optional[str]]] = None
+        self.__source_line: Optional[int] = None
+        self.__source_document: Optional[str] = None
+        self.__count = 1
 
     def update_message(self, **kwargs: Optional[str]):
         try:
@@ -33,8 +38,37 @@ class ErrorInstance:
                 f"You have not provided the required arguments for the error {str(self.get_full_error_code())}"
             )
 
+    def get_message_fields(self) -> set[str]:
+        """
+        :returns set[str]: The names of the arguments the message needs.
+        """
+        return {
+            field_name
+            for _, field_name, _, _ in Formatter().parse(self.__message)
+            if field_name
+        }
+
+    def set_message_arguments(self, **kwargs: Optional[str]):
+        """
+        Like `update_message`, but the message is only formatted when it is read.
+        """
+        missing_fields = self.get_message_fields() - kwargs.keys()
+        if missing_fields:
+            raise ValueError(
+                f"You have not provided the required arguments for the error {str(self.get_full_error_code())}"
+            )
+        self.__message_arguments = kwargs
+
     def set_context(self, context: etree._Element):
         self.__context = context
+        self.set_source(context.sourceline, context.getroottree().docinfo.URL)
+
+    def set_source(self, source_line: Optional[int], source_document: Optional[str]):
+        self.__source_line = source_line
+        self.__source_document = source_document
+
+    def set_count(self, count: int):
+        self.__count = count
 
     def get_severity(self):
         return self.__severity
@@ -46,11 +80,37 @@ class ErrorInstance:
         return self.__numeric_code
 
     def get_message(self):
+        if self.__message_arguments is not None:
+            return self.__message.format(**self.__message_arguments)
         return self.__message
 
+    def get_message_arguments(self) -> Dict[str, Optional[str]]:
+        return dict(self.__message_arguments or {})
+
     def get_context(self):
+        """
+        :returns: The lxml element the error occurred at. Compact error repositories do not keep the element and only record its source.
+        """
         return self.__context
 
+    def get_source_line(self) -> Optional[int]:
+        """
+        :returns int|None: The line in the source document the error occurred at. None if unknown.
+        """
+        return self.__source_line
+
+    def get_source_document(self) -> Optional[str]:
+        """
+        :returns str|None: The URI of the document the error occurred in. None if unknown.
+        """
+        return self.__source_document
+
+    def get_count(self) -> int:
+        """
+        :returns int: How often the error occurred. Identical errors are reported once with their count.
+        """
+        return self.__count
+
     def get_hint(self):
         return self.__hint
 
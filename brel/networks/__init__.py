@@ -2,6 +2,7 @@ from .i_network_node import INetworkNode
 from .i_network import INetwork
 
 from .calculation_network_node import CalculationNetworkNode
+from .calculation_inconsistency import CalculationInconsistency
 from .calculation_network import CalculationNetwork
 
 from .definition_network_node import DefinitionNetworkNode
@@ -0,0 +1,82 @@
+"""
+This module contains the CalculationInconsistency class.
+A CalculationInconsistency describes a summation in a calculation network that does not add up.
+
+=================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+=================
+"""
+
+from typing import List, Tuple
+
+from brel import Fact
+
+
+class CalculationInconsistency:
+    """
+    Class for representing a single inconsistent summation of a calculation network.
+    The summation consists of a fact of the parent concept and the facts of the child concepts that share its context.
+    Both the reported value and the computed sum are rounded to the lowest decimals of the facts involved.
+    """
+
+    def __init__(
+        self,
+        link_role: str,
+        parent_fact: Fact,
+        contributing_facts: List[Tuple[Fact, float]],
+        reported_value: float,
+        computed_value: float,
+        decimals: float,
+    ) -> None:
+        self.__link_role = link_role
+        self.__parent_fact = parent_fact
+        self.__contributing_facts = contributing_facts
+        self.__reported_value = reported_value
+        self.__computed_value = computed_value
+        self.__decimals = decimals
+
+    def get_link_role(self) -> str:
+        """
+        :returns str: the link role of the calculation network that contains the summation
+        """
+        return self.__link_role
+
+    def get_parent_fact(self) -> Fact:
+        """
+        :returns Fact: the fact of the parent concept, i.e. the total
+        """
+        return self.__parent_fact
+
+    def get_contributing_facts(self) -> List[Tuple[Fact, float]]:
+        """
+        :returns list[tuple[Fact, float]]: the facts of the child concepts together with the weight of their arc
+        """
+        return self.__contributing_facts
+
+    def get_reported_value(self) -> float:
+        """
+        :returns float: the rounded value of the parent fact
+        """
+        return self.__reported_value
+
+    def get_computed_value(self) -> float:
+        """
+        :returns float: the rounded, weighted sum of the contributing facts
+        """
+        return self.__computed_value
+
+    def get_decimals(self) -> float:
+        """
+        :returns float: the decimals both values were rounded to. `inf` if the values were compared exactly.
+        """
+        return self.__decimals
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__parent_fact.get_concept().get_name()} reported as {self.__reported_value}, "
+            f"but the children sum up to {self.__computed_value} in {self.__link_role}"
+        )
@@ -14,14 +14,19 @@ Calculation networks also contain helper functions for checking the consistency
 
 DEBUG = False
 
-from typing import Iterable, cast
+import math
+from typing import Dict, Hashable, Iterable, cast
 
 from brel import Fact, QName
-from brel.characteristics import Aspect, ICharacteristic
 from brel.networks import CalculationNetworkNode, INetwork, INetworkNode
+from brel.networks.calculation_inconsistency import CalculationInconsistency
 from brel.reportelements import *
 
 
+# concept name -> context key without the concept -> facts
+type CalculationFactGroups = Dict[QName, Dict[Hashable, list[Fact]]]
+
+
 class CalculationNetwork(INetwork):
     """
     The class for representing a calculation network.
@@ -99,7 +104,6 @@ class CalculationNetwork(INetwork):
 
         return True
 
-    # def is_aggregation_consistent(self, facts: list[Fact]) -> bool:
     def is_aggregation_consistent(self, facts: list[Fact]) -> bool:
         """
         A calculation network is aggregation consistent iff for concepts of nodes, the sum of the fact values of the children equals the fact value of the parent.
@@ -109,115 +113,156 @@ class CalculationNetwork(INetwork):
         :param facts: the facts of the filing against which to check the aggregation consistency
         :returns bool: True iff the network is aggregation consistent
         """
+        return not self.get_aggregation_inconsistencies(facts)
 
-        def is_subnetwork_aggregation_consistent(
-            node: CalculationNetworkNode,
-        ) -> bool:
-            """
-            Returns true if the subtree rooted at node is aggregation consistent.
-            Operates recursively.
-            Returns false if
-            - the sum of all children values does not equal the parent value
-            - any child subtree is not aggregation consistent
-            Returns true otherwise
-            """
-            # if the node is a leaf, it is aggregation consistent
-            # even though this case would be captured by the following code, it is more efficient to short circuit the trivial case without querying the facts
-            if node.is_leaf():
-                return True
+    def get_aggregation_inconsistencies(
+        self, facts: list[Fact]
+    ) -> list[CalculationInconsistency]:
+        """
+        Check every summation of the network against the facts and return all that do not add up.
+
+        A summation consists of a parent fact and the child facts with the same characteristics except for the concept.
+        Following the XBRL 2.1 binding rules, a summation is only checked if
+        - there is exactly one parent fact and at most one fact per child concept for the characteristics
+        - at least one child fact is reported
+        - none of the facts is nil
+        Missing children do not contribute to the sum.
+        The reported value and the sum are rounded to the lowest decimals of the facts involved before they are compared.
+        :param facts: the facts of the filing against which to check the aggregation consistency
+        :returns list[CalculationInconsistency]: all inconsistent summations. Empty iff the network is aggregation consistent.
+        """
+        return self._get_aggregation_inconsistencies(group_calculation_facts(facts))
 
-            concept = node.get_concept()
-            node_facts = list(
-                filter(
-                    lambda fact: fact.get_concept() == concept,
-                    facts,
-                )
-            )
+    def _get_aggregation_inconsistencies(
+        self, fact_groups: CalculationFactGroups
+    ) -> list[CalculationInconsistency]:
+        """
+        Same as `get_aggregation_inconsistencies`, but with facts already grouped by `group_calculation_facts`.
+        This allows checking multiple networks without grouping the facts again.
+        This method is for advanced users only.
+        """
+        inconsistencies: list[CalculationInconsistency] = []
 
-            for node_fact in node_facts:
-                node_value = float(node_fact)
+        for node in self.__get_parent_nodes():
+            parent_groups = fact_groups.get(node.get_concept().get_name())
+            if parent_groups is None:
+                continue
 
-                if DEBUG:  # pragma: no cover
-                    print(f"{node_fact._get_id()}: {node_value} = ", end=" ")
-
-                # get the sum of the children values
-                children_sum: float = 0
-                for child in node.get_children():
-                    child = cast(CalculationNetworkNode, child)
-                    child_concept = child.get_concept()
-
-                    # child facts are all facts with the same characteristics as the node fact, except for the concept
-                    child_facts: Iterable[Fact] = facts
-                    for node_aspect in node_fact.get_aspects():
-                        # if the aspect is the concept, then get all fact with the child_concept as the concept characteristic
-                        if node_aspect == Aspect.CONCEPT:
-                            child_facts = list(
-                                filter(
-                                    lambda fact: fact.get_concept() == child_concept,
-                                    child_facts,
-                                )
-                            )
-                        else:
-                            # otherwise, get all facts with the same characteristic as the node fact
-                            node_characteristic = node_fact.get_characteristic(
-                                node_aspect
-                            )
-                            child_facts = list(
-                                filter(
-                                    lambda fact: fact.get_characteristic(node_aspect)
-                                    == node_characteristic,
-                                    child_facts,
-                                )
-                            )
-
-                    # there should only be one child fact left
-                    all_child_facts = list(child_facts)
-                    parent_characteristics = {
-                        aspect.get_name(): str(node_fact.get_characteristic(aspect))
-                        for aspect in node_fact.get_aspects()
-                        if aspect != Aspect.CONCEPT
-                    }
-
-                    if len(all_child_facts) == 0:
-                        raise ValueError(
-                            f"Could not find a fact for concept {child_concept} with characteristics {parent_characteristics}"
-                        )
-                    elif len(all_child_facts) > 1:
-                        raise ValueError(
-                            f"Found more than one fact for concept {child_concept} with characteristics {parent_characteristics}"
-                        )
+            children = [cast(CalculationNetworkNode, c) for c in node.get_children()]
 
-                    child_fact = all_child_facts[0]
+            for context_key, parent_facts in parent_groups.items():
+                if len(parent_facts) > 1:
+                    continue
 
-                    children_sum += float(child_fact) * child.get_weight()
+                contributing_facts: list[tuple[Fact, float]] = []
+                is_bound = True
+                for child in children:
+                    child_facts = fact_groups.get(
+                        child.get_concept().get_name(), {}
+                    ).get(context_key)
 
-                    if DEBUG:  # pragma: no cover
-                        print(
-                            f"+ {child_fact._get_id()}: {float(child_fact)} * {child.get_weight()}",
-                            end=" ",
-                        )
+                    if child_facts is None:
+                        continue
+                    if len(child_facts) > 1:
+                        is_bound = False
+                        break
+
+                    contributing_facts.append((child_facts[0], child.get_weight()))
+
+                if not is_bound or not contributing_facts:
+                    continue
+
+                parent_fact = parent_facts[0]
+                decimals = min(
+                    _infer_decimals(fact)
+                    for fact in [parent_fact] + [fact for fact, _ in contributing_facts]
+                )
+
+                reported_value = _round(float(parent_fact), decimals)
+                computed_value = _round(
+                    sum(
+                        _round(float(fact), decimals) * weight
+                        for fact, weight in contributing_facts
+                    ),
+                    decimals,
+                )
 
                 if DEBUG:  # pragma: no cover
-                    print()
                     print(
-                        f"node concept: {concept}, node value: {node_value}, children sum: {children_sum}"
+                        f"{parent_fact._get_id()}: {reported_value} = {computed_value}"
                     )
 
-                if node_value != children_sum:
-                    return False
+                if reported_value != computed_value:
+                    inconsistencies.append(
+                        CalculationInconsistency(
+                            self.get_link_role(),
+                            parent_fact,
+                            contributing_facts,
+                            reported_value,
+                            computed_value,
+                            decimals,
+                        )
+                    )
 
-                # check the children
-                for child in node.get_children():
-                    child = cast(CalculationNetworkNode, child)
-                    if not is_subnetwork_aggregation_consistent(child):
-                        return False
+        return inconsistencies
 
-            return True
+    def __get_parent_nodes(self) -> list[CalculationNetworkNode]:
+        """
+        Get all nodes with children in depth-first order.
+        """
+        parent_nodes: list[CalculationNetworkNode] = []
+        stack = [cast(CalculationNetworkNode, root) for root in self.get_roots()][::-1]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf():
+                continue
 
-        # check the roots
-        for root in self.get_roots():
-            root = cast(CalculationNetworkNode, root)
-            if not is_subnetwork_aggregation_consistent(root):
-                return False
+            parent_nodes.append(node)
+            stack.extend(
+                cast(CalculationNetworkNode, child)
+                for child in reversed(node.get_children())
+            )
 
-        return True
+        return parent_nodes
+
+
+def group_calculation_facts(facts: Iterable[Fact]) -> CalculationFactGroups:
+    """
+    Group facts by their concept and by all other characteristics.
+    Nil facts are left out, since they do not take part in calculations.
+    :param facts: the facts to group
+    :returns: a dict from concept name to a dict from the context key without the concept to the facts
+    """
+    fact_groups: CalculationFactGroups = {}
+    for fact in facts:
+        if fact.get_value_as_str() == "":
+            continue
+
+        concept_groups = fact_groups.setdefault(fact.get_concept().get_name(), {})
+        context_key = fact.get_context()._get_key_without_concept()
+        concept_groups.setdefault(context_key, []).append(fact)
+
+    return fact_groups
+
+
+def _infer_decimals(fact: Fact) -> float:
+    """
+    Get the decimals of a fact. If the fact only has a precision, the decimals are inferred from it as described in XBRL 2.1.
+    :returns float: the decimals of the fact. `inf` if the fact is exact or has neither decimals nor precision.
+    """
+    decimals = fact.get_decimals()
+    if decimals is not None:
+        return decimals
+
+    precision = fact.get_precision()
+    value = float(fact)
+    if precision is None or precision == math.inf or value == 0:
+        return math.inf
+
+    return precision - math.floor(math.log10(abs(value))) - 1
+
+
+def _round(value: float, decimals: float) -> float:
+    if decimals == math.inf:
+        return value
+    return round(value, int(decimals))
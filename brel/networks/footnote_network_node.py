@@ -107,3 +107,17 @@ class FootnoteNetworkNode(INetworkNode):
             raise ValueError(f"The child {child} is not a FootnoteNetworkNode")
         self.__children.append(child)
         self.__children.sort(key=lambda x: x.get_order())
+
+    def _add_children(self, children: list[INetworkNode]):
+        """
+        Add several children to the node. The children are sorted once after all of them are added.
+        :param children: the children to add
+        """
+        typed_children = [
+            child for child in children if isinstance(child, FootnoteNetworkNode)
+        ]
+        if len(typed_children) != len(children):
+            raise ValueError("All children must be FootnoteNetworkNodes")
+
+        self.__children.extend(typed_children)
+        self.__children.sort(key=lambda x: x.get_order())
@@ -159,6 +159,15 @@ class INetworkNode(ABC):
         """
         raise NotImplementedError
 
+    def _add_children(self, children: list["INetworkNode"]):
+        """
+        Add several children to this node.
+        Nodes that keep their children ordered override this, so the children are only sorted once.
+        :param children: NetworkNodes to be added as children
+        """
+        for child in children:
+            self._add_child(child)
+
     def convert_to_dict(self) -> Dict[str, Any]:
         """
         Converts this node to a dictionary
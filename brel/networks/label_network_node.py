@@ -92,3 +92,10 @@ class LabelNetworkNode(INetworkNode):
         :param child: INetworkNode to be added as a child
         """
         self.__children.append(child)
+
+    def _add_children(self, children: list[INetworkNode]):
+        """
+        Adds several children to this node.
+        :param children: the nodes to be added as children
+        """
+        self.__children.extend(children)
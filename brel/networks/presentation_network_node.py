@@ -139,3 +139,18 @@ class PresentationNetworkNode(INetworkNode):
 
         self.__children.append(child)
         self.__children.sort(key=lambda node: node.get_order())
+
+    def _add_children(self, children: list[INetworkNode]):
+        """
+        Add several children to this node. The children are sorted once after all of them are added.
+        :param children: the nodes to be added as children
+        :raises TypeError: if one of the children is not of type PresentationNetworkNode
+        """
+        typed_children = [
+            child for child in children if isinstance(child, PresentationNetworkNode)
+        ]
+        if len(typed_children) != len(children):
+            raise TypeError("child must be of type PresentationNetworkNode")
+
+        self.__children.extend(typed_children)
+        self.__children.sort(key=lambda node: node.get_order())
@@ -92,3 +92,18 @@ class ReferenceNetworkNode(INetworkNode):
 
         self.__children.append(child)
         self.__children.sort(key=lambda node: node.get_order())
+
+    def _add_children(self, children: list[INetworkNode]):
+        """
+        Add several children to this node. The children are sorted once after all of them are added.
+        :param children: the nodes to be added as children
+        :raises ValueError: if one of the children is not of type ReferenceNetworkNode
+        """
+        typed_children = [
+            child for child in children if isinstance(child, ReferenceNetworkNode)
+        ]
+        if len(typed_children) != len(children):
+            raise ValueError("Child must be of type ReferenceNetworkNode")
+
+        self.__children.extend(typed_children)
+        self.__children.sort(key=lambda node: node.get_order())
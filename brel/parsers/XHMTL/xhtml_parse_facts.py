@@ -48,6 +48,14 @@ from brel.parsers.utils.lxml_utils import (
 from brel.qnames.qname_utils import qname_from_str
 from brel.reportelements.concept import Concept
 
+IX_NAMESPACES = {"ix": "http://www.xbrl.org/2013/inlineXBRL"}
+HEADERS_XPATH = etree.XPath(".//ix:header", namespaces=IX_NAMESPACES)
+FACT_ELEMENTS_XPATH = etree.XPath(
+    ".//ix:nonNumeric | .//ix:nonFraction", namespaces=IX_NAMESPACES
+)
+FOOTNOTES_XPATH = etree.XPath(".//ix:footnote", namespaces=IX_NAMESPACES)
+CONTINUATIONS_XPATH = etree.XPath(".//ix:continuation", namespaces=IX_NAMESPACES)
+
 
 def parse_headers(
     etrees: list[_Element], error_repository: ErrorRepository
@@ -57,11 +65,7 @@ def parse_headers(
     hidden_elements, resources_elements, references_elements = [], [], []
     for xbrl_instance in etrees:
         check_no_header_element_in_head(xbrl_instance, error_repository)
-        headers = find_elements(
-            xbrl_instance,
-            ".//ix:header",
-            namespaces={"ix": "http://www.xbrl.org/2013/inlineXBRL"},
-        )
+        headers = find_elements(xbrl_instance, HEADERS_XPATH)
         if len(headers) == 0:
             continue
 
@@ -142,9 +146,9 @@ def parse_instance_elements(
 ) -> Tuple[List[_Element], List[_Element], List[_Element]]:
     fact_elements, footnote_elements, continuation_elements = [], [], []
     for xbrl_instance in etrees:
-        facts = find_elements(xbrl_instance, ".//ix:nonNumeric | .//ix:nonFraction")
-        footnotes = find_elements(xbrl_instance, ".//ix:footnote")
-        continuations = find_elements(xbrl_instance, ".//ix:continuation")
+        facts = find_elements(xbrl_instance, FACT_ELEMENTS_XPATH)
+        footnotes = find_elements(xbrl_instance, FOOTNOTES_XPATH)
+        continuations = find_elements(xbrl_instance, CONTINUATIONS_XPATH)
 
         fact_elements += facts
         footnote_elements += footnotes
@@ -230,8 +234,8 @@ def parse_facts(
             )
             continue
 
-        context = context_repository.get_context_copy(context_id)
-        if not context:
+        base_context = context_repository.get_context(context_id)
+        if not base_context:
             error_repository.insert(
                 ErrorCode.IXBRL_INVALID_FACT_CONTEXT_ID,
                 fact_element,
@@ -239,6 +243,7 @@ def parse_facts(
             )
             continue
 
+        context = Context(context_id, base_context)
         for characteristic in characteristics:
             context._add_characteristic(characteristic)
 
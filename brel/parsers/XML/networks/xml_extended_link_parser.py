@@ -40,6 +40,26 @@ from brel.parsers.utils.lxml_utils import (
 from brel.reportelements import *
 from brel.resource import *
 from brel.contexts.filing_context import FilingContext
+from brel.data.errors.error_repository import ErrorRepository
+
+# compiled once, as they run for every extended link
+XLINK_NAMESPACES = {"xlink": "http://www.w3.org/1999/xlink"}
+ARC_ELEMENTS_XPATH = lxml.etree.XPath(
+    ".//*[@xlink:type='arc']", namespaces=XLINK_NAMESPACES
+)
+NODE_ELEMENTS_XPATH = lxml.etree.XPath(
+    ".//*[@xlink:type='resource' or @xlink:type='locator']",
+    namespaces=XLINK_NAMESPACES,
+)
+XLINK_FROM = "{http://www.w3.org/1999/xlink}from"
+XLINK_TO = "{http://www.w3.org/1999/xlink}to"
+XLINK_ARCROLE = "{http://www.w3.org/1999/xlink}arcrole"
+XLINK_LABEL = "{http://www.w3.org/1999/xlink}label"
+
+# an arc element with its from, to and arcrole attributes
+type ArcRecord = tuple[lxml.etree._Element, str, str, str]  # type: ignore
+# a locator or resource element with its label and the object it points to
+type LinkNodeRecord = tuple[lxml.etree._Element, str, IResource | IReportElement | Fact]  # type: ignore
 
 
 def get_object_from_reference(
@@ -113,155 +133,48 @@ def parse_xml_link(
             xml_link_element,
             type=get_clark_notation_tag(xml_link_element),
         )
+        return networks
 
-    for network_factory in network_factories:
-        nodes_lookup: dict[str, list[INetworkNode]] = defaultdict(list)
-        edges: set[tuple[str, str, str]] = set()
-        node_to_arcs: dict[str, list[lxml.etree._Element]] = defaultdict(list)  # type: ignore
-        roots: set[INetworkNode] = set()
-
-        for arc_element in find_elements(xml_link_element, ".//*[@xlink:type='arc']"):
-            arc_from = get_str_attribute(arc_element, "xlink:from")
-            arc_to = get_str_attribute(arc_element, "xlink:to")
-            arc_role = get_str_attribute(arc_element, "xlink:arcrole")
-
-            if (arc_from, arc_to, arc_role) in edges:
-                error_repository.insert(
-                    ErrorCode.DUPLICATE_LINKBASE_ARC,
-                    arc_element,
-                    arc_from=arc_from,
-                    arc_to=arc_to,
-                )
-                continue
-
-            edges.add((arc_from, arc_to, arc_role))
-            node_to_arcs[arc_from].append(arc_element)
-            node_to_arcs[arc_to].append(arc_element)
+    # the arcs and the locators are read once and shared by all factories of the link
+    arcs, arcs_from, arcs_to = __build_arc_table(xml_link_element, error_repository)
+    link_nodes = __resolve_link_nodes(xml_link_element, context)
 
-        for link_element in find_elements(
-            xml_link_element, ".//*[@xlink:type='resource' or @xlink:type='locator']"
-        ):
-            label = get_str_attribute(link_element, "xlink:label")
-            to_object: Optional[
-                IResource | IReportElement | Fact
-            ] = get_object_from_reference(link_element, context)
-
-            if to_object is None:
-                continue
-
-            node_arcs = node_to_arcs[label]
-            arcs_to = list(
-                filter(
-                    lambda arc: get_str_attribute(arc, "xlink:to", "") == label,
-                    node_arcs,
-                )
+    for network_factory in network_factories:
+        if network_factory.is_physical():
+            nodes_lookup, roots = __create_physical_nodes(
+                network_factory,
+                xml_link_element,
+                arcs_from,
+                arcs_to,
+                link_nodes,
+                error_repository,
             )
-            arcs_from = list(
-                filter(
-                    lambda arc: get_str_attribute(arc, "xlink:from", "") == label,
-                    node_arcs,
-                )
+        else:
+            nodes_lookup, roots = __create_logical_nodes(
+                network_factory,
+                xml_link_element,
+                arcs_from,
+                arcs_to,
+                link_nodes,
+                error_repository,
             )
 
-            if network_factory.is_physical():
-                if len(arcs_to) == 0 and len(arcs_from) == 0:
-                    node = network_factory.create_node(
-                        xml_link_element,
-                        link_element,
-                        None,
-                        to_object,
-                        error_repository,
-                    )
-
-                    if node is None:
-                        continue
-
-                    roots.add(node)
-                    nodes_lookup[label].append(node)
-                else:
-                    outgoing_role_types = set(
-                        get_str_attribute(arc, "xlink:arcrole") for arc in arcs_from
-                    )
-
-                    incoming_role_types = set(
-                        get_str_attribute(arc, "xlink:arcrole") for arc in arcs_to
-                    )
-
-                    for role_type in incoming_role_types.union(outgoing_role_types):
-                        node_arcs.sort(
-                            key=lambda arc: get_str_attribute(arc, "xlink:to") == label,
-                            reverse=True,
-                        )
-
-                        arc = next(
-                            (
-                                arc
-                                for arc in node_arcs
-                                if get_str_attribute(arc, "xlink:arcrole") == role_type
-                            ),
-                            None,
-                        )
-
-                        node = network_factory.create_node(
-                            xml_link_element,
-                            link_element,
-                            arc,
-                            to_object,
-                            error_repository,
-                        )
-
-                        if node is None:
-                            continue
-
-                        if role_type not in incoming_role_types:
-                            roots.add(node)
-                        nodes_lookup[label].append(node)
-
-            else:
-                if len(arcs_to) == 0 and len(arcs_from) == 0:
-                    node = network_factory.create_node(
-                        xml_link_element,
-                        link_element,
-                        None,
-                        to_object,
-                        error_repository,
-                    )
-
-                    if node is None:
-                        continue
-
-                    roots.add(node)
-                    nodes_lookup[label].append(node)
-                else:
-                    arc = arcs_to[0] if len(arcs_to) > 0 else arcs_from[0]
-
-                    node = network_factory.create_node(
-                        xml_link_element, link_element, arc, to_object, error_repository
-                    )
-
-                    if node is None:
-                        continue
-
-                    if len(arcs_to) == 0:
-                        roots.add(node)
-                    nodes_lookup[label].append(node)
-
         # second pass. Create the tree by iterating over the edges and adding the edge's 'to' node as a child to the edge's 'from' node
-        for arc_from, arc_to, arc_role in edges:
-            from_nodes = nodes_lookup[arc_from]
-            to_nodes = nodes_lookup[arc_to]
-
+        # the children of a node are collected first, so every node sorts its children only once
+        children_lookup: dict[INetworkNode, list[INetworkNode]] = defaultdict(list)
+        for _, arc_from, arc_to, arc_role in arcs:
             if network_factory.is_physical():
-                from_nodes = list(
-                    filter(lambda node: node.get_arc_role() == arc_role, from_nodes)
-                )
-                to_nodes = list(
-                    filter(lambda node: node.get_arc_role() == arc_role, to_nodes)
-                )
+                from_nodes = nodes_lookup[(arc_from, arc_role)]
+                to_nodes = nodes_lookup[(arc_to, arc_role)]
+            else:
+                from_nodes = nodes_lookup[(arc_from, None)]
+                to_nodes = nodes_lookup[(arc_to, None)]
 
             for from_node, to_node in itertools.product(from_nodes, to_nodes):
-                # Now we can link the nodes
-                from_node._add_child(to_node)  # type: ignore
+                children_lookup[from_node].append(to_node)
+
+        for from_node, children in children_lookup.items():
+            from_node._add_children(children)
 
         # third pass. If the network is physical, create a network for each arcrole in the roots
         # if the network is logical (not physical), create a single network with all the roots
@@ -270,11 +183,11 @@ def parse_xml_link(
             continue
 
         if network_factory.is_physical():
-            role_types = set(node.get_arc_role() for node in roots)
-            for role_type in role_types:
-                role_type_roots = [
-                    node for node in roots if node.get_arc_role() == role_type
-                ]
+            roots_by_role_type: dict[str, list[INetworkNode]] = defaultdict(list)
+            for node in roots:
+                roots_by_role_type[node.get_arc_role()].append(node)
+
+            for role_type_roots in roots_by_role_type.values():
                 network = network_factory.create_network(
                     xml_link_element, role_type_roots
                 )
@@ -283,11 +196,169 @@ def parse_xml_link(
                 )
                 networks.append(network)
         else:
-            root_nodes = list(roots)
-            network = network_factory.create_network(xml_link_element, root_nodes)
+            network = network_factory.create_network(xml_link_element, roots)
             network_factory.update_report_elements(
                 context.get_report_element_repository(), network
             )
             networks.append(network)
 
     return networks
+
+
+def __build_arc_table(
+    xml_link_element: lxml.etree._Element,  # type: ignore
+    error_repository: ErrorRepository,
+) -> tuple[list[ArcRecord], dict[str, list[ArcRecord]], dict[str, list[ArcRecord]]]:
+    """
+    Read the arcs of an extended link once. Duplicate arcs are reported and skipped.
+    :returns: the arcs in document order, the arcs by the label they start at and the arcs by the label they end at.
+    """
+    arcs: list[ArcRecord] = []
+    arcs_from: dict[str, list[ArcRecord]] = defaultdict(list)
+    arcs_to: dict[str, list[ArcRecord]] = defaultdict(list)
+    edges: set[tuple[str, str, str]] = set()
+
+    for arc_element in find_elements(xml_link_element, ARC_ELEMENTS_XPATH):
+        arc_from = __get_xlink_attribute(arc_element, XLINK_FROM)
+        arc_to = __get_xlink_attribute(arc_element, XLINK_TO)
+        arc_role = __get_xlink_attribute(arc_element, XLINK_ARCROLE)
+
+        if (arc_from, arc_to, arc_role) in edges:
+            error_repository.insert(
+                ErrorCode.DUPLICATE_LINKBASE_ARC,
+                arc_element,
+                arc_from=arc_from,
+                arc_to=arc_to,
+            )
+            continue
+
+        edges.add((arc_from, arc_to, arc_role))
+        arc = (arc_element, arc_from, arc_to, arc_role)
+        arcs.append(arc)
+        arcs_from[arc_from].append(arc)
+        arcs_to[arc_to].append(arc)
+
+    return arcs, arcs_from, arcs_to
+
+
+def __resolve_link_nodes(
+    xml_link_element: lxml.etree._Element,  # type: ignore
+    context: FilingContext,
+) -> list[LinkNodeRecord]:
+    """
+    Resolve the locators and resources of an extended link to the objects they point to.
+    Elements that cannot be resolved are reported and skipped.
+    """
+    link_nodes: list[LinkNodeRecord] = []
+    for link_element in find_elements(xml_link_element, NODE_ELEMENTS_XPATH):
+        label = __get_xlink_attribute(link_element, XLINK_LABEL)
+        to_object = get_object_from_reference(link_element, context)
+
+        if to_object is None:
+            continue
+
+        link_nodes.append((link_element, label, to_object))
+    return link_nodes
+
+
+def __create_physical_nodes(
+    network_factory: IXMLNetworkFactory,
+    xml_link_element: lxml.etree._Element,  # type: ignore
+    arcs_from: dict[str, list[ArcRecord]],
+    arcs_to: dict[str, list[ArcRecord]],
+    link_nodes: list[LinkNodeRecord],
+    error_repository: ErrorRepository,
+) -> tuple[dict[tuple[str, Optional[str]], list[INetworkNode]], list[INetworkNode]]:
+    """
+    Create a node per locator and arcrole. Physical networks are split by arcrole, so the nodes are looked up by label and arcrole.
+    A node is created from the first arc of its arcrole that ends at the locator, or else from the first one that starts at it.
+    """
+    nodes_lookup: dict[tuple[str, Optional[str]], list[INetworkNode]] = defaultdict(
+        list
+    )
+    roots: list[INetworkNode] = []
+
+    for link_element, label, to_object in link_nodes:
+        node_arcs_to = arcs_to.get(label, [])
+        node_arcs_from = arcs_from.get(label, [])
+
+        if len(node_arcs_to) == 0 and len(node_arcs_from) == 0:
+            node = network_factory.create_node(
+                xml_link_element, link_element, None, to_object, error_repository
+            )
+
+            if node is None:
+                continue
+
+            roots.append(node)
+            nodes_lookup[(label, node.get_arc_role())].append(node)
+            continue
+
+        # incoming arcs take precedence over outgoing arcs of the same arcrole
+        first_arc_by_role: dict[str, lxml.etree._Element] = {}  # type: ignore
+        for arc_element, _, _, arc_role in node_arcs_to:
+            first_arc_by_role.setdefault(arc_role, arc_element)
+        incoming_role_types = set(first_arc_by_role.keys())
+        for arc_element, _, _, arc_role in node_arcs_from:
+            first_arc_by_role.setdefault(arc_role, arc_element)
+
+        for role_type, arc_element in first_arc_by_role.items():
+            node = network_factory.create_node(
+                xml_link_element, link_element, arc_element, to_object, error_repository
+            )
+
+            if node is None:
+                continue
+
+            if role_type not in incoming_role_types:
+                roots.append(node)
+            nodes_lookup[(label, node.get_arc_role())].append(node)
+
+    return nodes_lookup, roots
+
+
+def __create_logical_nodes(
+    network_factory: IXMLNetworkFactory,
+    xml_link_element: lxml.etree._Element,  # type: ignore
+    arcs_from: dict[str, list[ArcRecord]],
+    arcs_to: dict[str, list[ArcRecord]],
+    link_nodes: list[LinkNodeRecord],
+    error_repository: ErrorRepository,
+) -> tuple[dict[tuple[str, Optional[str]], list[INetworkNode]], list[INetworkNode]]:
+    """
+    Create one node per locator. Logical networks contain all arcroles, so the nodes are only looked up by label.
+    """
+    nodes_lookup: dict[tuple[str, Optional[str]], list[INetworkNode]] = defaultdict(
+        list
+    )
+    roots: list[INetworkNode] = []
+
+    for link_element, label, to_object in link_nodes:
+        node_arcs_to = arcs_to.get(label, [])
+        node_arcs_from = arcs_from.get(label, [])
+
+        arc_element = None
+        if len(node_arcs_to) > 0:
+            arc_element = node_arcs_to[0][0]
+        elif len(node_arcs_from) > 0:
+            arc_element = node_arcs_from[0][0]
+
+        node = network_factory.create_node(
+            xml_link_element, link_element, arc_element, to_object, error_repository
+        )
+
+        if node is None:
+            continue
+
+        if len(node_arcs_to) == 0:
+            roots.append(node)
+        nodes_lookup[(label, None)].append(node)
+
+    return nodes_lookup, roots
+
+
+def __get_xlink_attribute(element: lxml.etree._Element, attribute: str) -> str:  # type: ignore
+    value = element.get(attribute)
+    if value is None:
+        raise ValueError(f"{attribute} attribute not found on element {element}")
+    return value
@@ -12,11 +12,19 @@ This module parses multiple etrees into a dict of networks.
 
 import json
 from collections import defaultdict
+from typing import List, Optional, cast
 from importlib.resources import files
-from lxml.etree import _Element  # type: ignore
+from lxml.etree import XPath, _Element  # type: ignore
+from brel.data.compiled_taxonomy.compiled_taxonomy_repository import CompiledLink
+from brel.data.report_element.report_element_repository import ReportElementRepository
 from brel.errors.error_code import ErrorCode
 from brel.networks import *
-from brel.parsers.XML.networks import parse_xml_link
+from brel.parsers.XML.networks import (
+    IXMLNetworkFactory,
+    LabelNetworkFactory,
+    ReferenceNetworkFactory,
+    parse_xml_link,
+)
 from brel.parsers.XML.table_linkbase.xml_table_linkbase_parser import (
     parse_table_linkbase_from_xml,
 )
@@ -25,6 +33,11 @@ from brel.parsers.utils.lxml_utils import (
     get_str_attribute,
     get_str_attribute_optional,
 )
+from brel.parsers.utils.compiled_link_utils import (
+    COMPILABLE_LINK_NAMES,
+    compile_link,
+    create_networks_from_compiled_link,
+)
 from brel.parsers.utils.network_utils import combine_networks
 from brel.qnames.qname_utils import qname_from_str
 from brel.reportelements import *
@@ -44,12 +57,36 @@ STANDARD_LINK_NAMES: list[str] = LINK_CONFIG["standard_link_names"]
 STANDARD_RESOURCE_ROLES: list[str] = LINK_CONFIG["standard_resource_roles"]
 STANDARD_LINK_ROLES: list[str] = LINK_CONFIG["standard_link_roles"]
 
+EXTENDED_LINKS_XPATH = XPath(
+    ".//link:*[@xlink:type='extended']",
+    namespaces={
+        "link": "http://www.xbrl.org/2003/linkbase",
+        "xlink": "http://www.w3.org/1999/xlink",
+    },
+)
+
+LINKBASE_TAG = "{http://www.xbrl.org/2003/linkbase}linkbase"
+
+# the factories that update the report elements with the networks of compiled links
+LINK_NETWORK_FACTORIES: dict[str, IXMLNetworkFactory] = {
+    "labelLink": LabelNetworkFactory(),
+    "referenceLink": ReferenceNetworkFactory(),
+}
+
+# the URI and the content hash of a linkbase and the local name of its compiled links
+type LinkGroup = tuple[str, str, str]
+
 
 def parse_networks_from_xmls(
     context: FilingContext,
+    link_names: Optional[List[str]] = None,
 ) -> None:
     """
     Parse the networks from a list of xml trees.
+    :param link_names: If set, only extended links with one of these local names are parsed, e.g. ["presentationLink"].
+    Table linkbases are only parsed if link_names is None.
+    The label and reference links of remote linkbases are stored in the compiled taxonomy repository after the first parse,
+    keyed by the URI and the content hash of the linkbase, and created from there on later parses.
     :param xml_trees: The xml trees to parse the networks from.
     :param qname_nsmap: The QNameNSMap to use for parsing.
     :param id_to_any: A mapping from xml ids to report elements, facts, and components.
@@ -68,41 +105,116 @@ def parse_networks_from_xmls(
     def is_standard_role(role: str) -> bool:
         return any(standard_role in role for standard_role in STANDARD_LINK_ROLES)
 
-    link_xmls: list[_Element] = [
-        element
-        for xml_tree in xml_service.get_all_etrees()
-        for element in find_elements(
-            xml_tree,
-            ".//link:*[@xlink:type='extended']",
-            namespaces={
-                "link": "http://www.xbrl.org/2003/linkbase",
-                "xlink": "http://www.w3.org/1999/xlink",
-            },
-        )
-    ]
+    compiled_taxonomy_repository = context.get_compiled_taxonomy_repository()
+    report_element_repository = context.get_report_element_repository()
+
+    # an extended link is either parsed from its xml or created from its compiled form
+    # cacheable links are compiled after parsing, grouped by their document and their local name
+    link_entries: list[
+        tuple[
+            Optional[str],
+            Optional[_Element],
+            Optional[list[INetwork]],
+            Optional[LinkGroup],
+        ]
+    ] = []
+    compiled_groups: dict[LinkGroup, Optional[list[CompiledLink]]] = {}
+
+    for uri in xml_service.get_all_uris():
+        etree = xml_service.get_etree(uri)
+
+        # only remote linkbases with a known content hash are cached, because published taxonomies do not change
+        # linkbases embedded in schemas are always parsed
+        content_hash: Optional[str] = None
+        if uri.startswith("http") and etree.getroot().tag == LINKBASE_TAG:
+            content_hash = xml_service.get_content_hash(uri)
+
+        cached_link_names: set[str] = set()
+        if content_hash is not None:
+            for link_name in COMPILABLE_LINK_NAMES:
+                if link_names is not None and link_name not in link_names:
+                    continue
+
+                cached_entries = __create_cached_link_entries(
+                    compiled_taxonomy_repository.get_links(
+                        uri, content_hash, link_name
+                    ),
+                    link_name,
+                    report_element_repository,
+                )
+                if cached_entries is not None:
+                    link_entries.extend(cached_entries)
+                    cached_link_names.add(link_name)
+                else:
+                    compiled_groups[(uri, content_hash, link_name)] = []
+
+        for link_xml in find_elements(etree, EXTENDED_LINKS_XPATH):
+            local_link_name = link_xml.tag.split("}")[-1]
+            if link_names is not None and local_link_name not in link_names:
+                continue
+            if local_link_name in cached_link_names:
+                continue
+
+            link_group: Optional[LinkGroup] = None
+            if (uri, content_hash, local_link_name) in compiled_groups:
+                link_group = (uri, cast(str, content_hash), local_link_name)
 
-    link_xmls.sort(
-        key=lambda link: is_standard_role(
-            get_str_attribute(link, qname_from_str("xlink:role", link), "")
-        ),
+            link_role = get_str_attribute_optional(
+                link_xml, qname_from_str("xlink:role", link_xml)
+            )
+            link_entries.append((link_role, link_xml, None, link_group))
+
+    link_entries.sort(
+        key=lambda link_entry: is_standard_role(link_entry[0] or ""),
         reverse=True,
     )
 
     # First pass: parse networks
-    for link_xml in link_xmls:
-        link_role = get_str_attribute_optional(
-            link_xml, qname_from_str("xlink:role", link_xml)
-        )
+    for link_role, link_xml, cached_networks, link_group in link_entries:
+        if cached_networks is not None:
+            link_role = cast(str, link_role)
+            for network in cached_networks:
+                LINK_NETWORK_FACTORIES[
+                    network.get_link_name().local_name
+                ].update_report_elements(report_element_repository, network)
+            networks[link_role].extend(cached_networks)
+            continue
+
+        link_xml = cast(_Element, link_xml)
         if link_role is None:
             error_repository.insert(ErrorCode.MISSING_LINK_ROLE, link_xml)
+            if link_group is not None:
+                compiled_groups[link_group] = None
             continue
 
+        error_count = error_repository.get_total_count()
         link_networks = parse_xml_link(context, link_xml)
         if link_networks is None:
             continue
+        link_networks = list(link_networks)
 
         networks[link_role].extend(link_networks)
 
+        # links with errors are parsed again next time, so their errors are reported again
+        if link_group is not None and compiled_groups[link_group] is not None:
+            compiled_link: Optional[CompiledLink] = None
+            if error_repository.get_total_count() == error_count:
+                compiled_link = compile_link(
+                    link_role, qname_from_str(link_xml.tag, link_xml), link_networks
+                )
+            if compiled_link is None:
+                compiled_groups[link_group] = None
+            else:
+                cast(list[CompiledLink], compiled_groups[link_group]).append(
+                    compiled_link
+                )
+
+    for (uri, content_hash, link_name), compiled_links in compiled_groups.items():
+        if compiled_links is not None:
+            compiled_taxonomy_repository.add_links(
+                uri, content_hash, link_name, compiled_links
+            )
+
     # Second pass: combine networks if they are of the same type
     for role, network_list in networks.items():
         networks_by_type: dict[type, list[INetwork]] = defaultdict(list)
@@ -123,4 +235,31 @@ def parse_networks_from_xmls(
         for network in network_list:
             network_repository.upsert(network)
 
-    parse_table_linkbase_from_xml(context)
+    if link_names is None:
+        parse_table_linkbase_from_xml(context)
+
+
+def __create_cached_link_entries(
+    compiled_links: Optional[list[CompiledLink]],
+    link_name: str,
+    report_element_repository: ReportElementRepository,
+) -> Optional[list[tuple[str, None, list[INetwork], None]]]:
+    """
+    Create the networks of the compiled links of a linkbase.
+    :param compiled_links: The compiled links of the linkbase. None if the linkbase was not compiled yet.
+    :param link_name: The local name of the compiled links.
+    :param report_element_repository: The report elements the links point to.
+    :returns: The link role and the networks of each link. None if a link cannot be created, so the linkbase has to be parsed.
+    """
+    if compiled_links is None:
+        return None
+
+    cached_entries: list[tuple[str, None, list[INetwork], None]] = []
+    for compiled_link in compiled_links:
+        link_networks = create_networks_from_compiled_link(
+            link_name, compiled_link, report_element_repository
+        )
+        if link_networks is None:
+            return None
+        cached_entries.append((compiled_link[0], None, link_networks, None))
+    return cached_entries
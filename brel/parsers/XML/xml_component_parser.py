@@ -30,6 +30,10 @@ from brel.data.component.component_repository import ComponentRepository
 from brel.data.network.network_repository import NetworkRepository
 from brel.parsers.utils.lxml_utils import find_element, find_elements, get_str_attribute
 
+LINK_NAMESPACES = {"link": "http://www.xbrl.org/2003/linkbase"}
+ROLE_TYPES_XPATH = lxml.etree.XPath(".//link:roleType", namespaces=LINK_NAMESPACES)
+USED_ONS_XPATH = lxml.etree.XPath("link:usedOn", namespaces=LINK_NAMESPACES)
+
 
 def parse_component_from_xml(
     context: FilingContext,
@@ -43,7 +47,7 @@ def parse_component_from_xml(
     info_element = find_element(xml_element, "link:definition")
     info = (info_element.text or "") if info_element is not None else ""
 
-    used_ons = [used_on.text for used_on in find_elements(xml_element, "link:usedOn")]
+    used_ons = [used_on.text for used_on in find_elements(xml_element, USED_ONS_XPATH)]
     networks_in_component = network_repository.get_by_linkrole(role_uri)
 
     if "link:presentationLink" not in used_ons and any(
@@ -130,9 +134,5 @@ def parse_components_xml(
     component_repository: ComponentRepository = context.get_component_repository()
 
     for schema in xml_service.get_all_etrees():
-        for roletype in find_elements(
-            schema,
-            ".//link:roleType",
-            namespaces={"link": "http://www.xbrl.org/2003/linkbase"},
-        ):
+        for roletype in find_elements(schema, ROLE_TYPES_XPATH):
             component_repository.upsert(parse_component_from_xml(context, roletype))
@@ -94,3 +94,22 @@ def parse_context_xml(
                 error_repository.insert(ErrorCode.INVALID_DIMENSION_TYPE, xml_dimension)
 
     return fact_context
+
+
+def extend_context(
+    context_template: Context,
+    characteristics: list[UnitCharacteristic | ConceptCharacteristic],
+) -> Context:
+    """
+    Creates a new Context from an already parsed context and the fact specific characteristics.
+    The context template is not copied but used as the base of the new context, so it is shared between all facts that reference it.
+    :param context_template: Context. The context parsed from the xbrli:context element.
+    :param characteristics: list[ICharacteristic]. The unit and concept characteristics of the fact.
+    :returns Context: The context of the fact.
+    """
+    fact_context = Context(context_template._get_id(), context_template)
+
+    for characteristic in characteristics:
+        fact_context._add_characteristic(characteristic)
+
+    return fact_context
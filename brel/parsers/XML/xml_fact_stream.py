@@ -0,0 +1,135 @@
+"""
+This module streams the facts of an XBRL instance in the XML syntax.
+
+The instance is never loaded as a whole. It is read with `lxml.etree.iterparse`,
+and every fact is turned into a Fact as soon as its element is closed.
+Processed facts are removed from the partial tree, so only the contexts, units and facts
+that wait for a context or unit defined further down in the instance stay in memory.
+
+Only the DTS referenced by the instance is loaded completely, as it is needed to resolve the concepts.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from typing import IO, Iterator, List
+
+import lxml
+import lxml.etree
+
+from brel import Fact
+from brel.contexts.filing_context import FilingContext
+from brel.parsers.XML.xml_facts_parser import XMLFactReader
+from brel.parsers.XML.xml_report_element_parser import parse_report_elements_xml
+
+XBRLI_CONTEXT_TAG = "{http://www.xbrl.org/2003/instance}context"
+XBRLI_UNIT_TAG = "{http://www.xbrl.org/2003/instance}unit"
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+DTS_REFERENCE_TAGS = [
+    "{http://www.xbrl.org/2003/linkbase}schemaRef",
+    "{http://www.xbrl.org/2003/linkbase}linkbaseRef",
+    "{http://www.xbrl.org/2003/linkbase}roleRef",
+    "{http://www.xbrl.org/2003/linkbase}arcroleRef",
+]
+
+
+def iter_facts_xml(context: FilingContext, source: str | IO[bytes]) -> Iterator[Fact]:
+    """
+    Stream the facts of an XBRL instance.
+    The report elements of the DTS have to be parsed into the context already.
+    The facts are not added to the fact repository of the context.
+    :param context: The filing context with the report elements of the DTS.
+    :param source: The path of the instance or a binary file object.
+    :returns Iterator[Fact]: The facts in the order in which they can be resolved.
+    Facts are yielded in document order, unless they reference a context or unit that is defined after them.
+    """
+    reader = XMLFactReader(context)
+    root: lxml.etree._Element | None = None  # type: ignore
+
+    for event, element in lxml.etree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+
+        if element is root:
+            break
+
+        parent = element.getparent()
+
+        if element.tag == XBRLI_CONTEXT_TAG and parent is root:
+            # contexts stay in the tree, because their qnames are resolved against the namespaces of the root
+            yield from reader.add_context(element)
+            continue
+
+        if element.tag == XBRLI_UNIT_TAG and parent is root:
+            yield from reader.add_unit(element)
+            continue
+
+        if element.get("contextRef") is not None:
+            fact = reader.read_fact(element)
+            if fact is not None:
+                yield fact
+
+        if parent is root and not __is_or_contains_pending(reader, element):
+            element.clear()
+            root.remove(element)
+
+    reader.finish()
+
+
+def iter_facts_from_instance(instance_path: str) -> Iterator[Fact]:
+    """
+    Load the DTS of an XBRL instance and stream its facts.
+    :param instance_path: The path of the XBRL instance in the XML syntax.
+    :returns Iterator[Fact]: The facts of the instance.
+    """
+    context = FilingContext()
+    xml_service = context.get_xml_service()
+
+    for reference_uri in __read_dts_references(instance_path):
+        xml_service.add_etree_recursive(reference_uri, instance_path)
+
+    parse_report_elements_xml(context)
+
+    yield from iter_facts_xml(context, instance_path)
+
+
+def __is_or_contains_pending(reader: XMLFactReader, element: lxml.etree._Element) -> bool:  # type: ignore
+    if not reader.has_pending_facts():
+        return False
+    return any(reader.is_pending(descendant) for descendant in element.iter())
+
+
+def __read_dts_references(instance_path: str) -> List[str]:
+    """
+    Read the DTS references at the top of an instance.
+    The references have to come before any context, unit or fact, so reading stops at the first other element.
+    """
+    reference_uris: List[str] = []
+    root: lxml.etree._Element | None = None  # type: ignore
+
+    for event, element in lxml.etree.iterparse(instance_path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+
+        if element.getparent() is not root:
+            continue
+
+        if element.tag not in DTS_REFERENCE_TAGS:
+            break
+
+        href = element.get(XLINK_HREF)
+        if href:
+            href_uri = href.split("#")[0]
+            if href_uri and href_uri not in reference_uris:
+                reference_uris.append(href_uri)
+
+    return reference_uris
@@ -11,7 +11,7 @@ It parses XBRL in the XML syntax.
 ====================
 """
 
-from typing import cast
+from typing import Dict, List, Optional, Set, Tuple, cast
 import lxml
 import lxml.etree
 
@@ -20,7 +20,7 @@ from brel.characteristics import *
 from brel.errors.error_code import ErrorCode
 from brel.errors.error_instance import ErrorInstance
 from brel.parsers.XML.characteristics import parse_unit_from_xml
-from brel.parsers.XML.xml_context_parser import parse_context_xml
+from brel.parsers.XML.xml_context_parser import extend_context, parse_context_xml
 from brel.parsers.utils.error_utils import error_on_none
 from brel.qnames.qname_utils import qname_from_str
 from brel.reportelements import Concept
@@ -31,20 +31,21 @@ from brel.parsers.utils.lxml_utils import (
     get_clark_notation_tag,
 )
 
+FACT_ELEMENTS_XPATH = lxml.etree.XPath(".//*[@contextRef]")
 
-def parse_fact_from_xml(
+
+def create_fact_from_xml(
     filingContext: FilingContext,
     fact_xml_element: lxml.etree._Element,  # type: ignore
     context: Context,
-) -> None:
+) -> Fact:
     """
     Create a single Fact from an lxml.etree._Element.
     :param fact_xml_element: The lxml.etree._Element to create the Fact from.
     :param context: The context of the fact. Note that new characteristics will be added to the context.
-    :returns: The newly Fact.
+    :returns: The newly created Fact. It is not added to the fact repository.
     """
     error_repository = filingContext.get_error_repository()
-    fact_repository = filingContext.get_fact_repository()
 
     fact_id = fact_xml_element.get("id")
 
@@ -80,99 +81,226 @@ def parse_fact_from_xml(
             context_concept=context_concept.get_value().get_name().clark_notation(),
         )
 
-    fact_repository.upsert(Fact(context, fact_value, fact_id))
+    return Fact(context, fact_value, fact_id)
 
 
-def parse_facts_xml(
-    context: FilingContext,
+def parse_fact_from_xml(
+    filingContext: FilingContext,
+    fact_xml_element: lxml.etree._Element,  # type: ignore
+    context: Context,
 ) -> None:
     """
-    Parse the facts.
-    :param etrees: The xbrl instance xml trees
+    Create a single Fact from an lxml.etree._Element and add it to the fact repository.
+    :param fact_xml_element: The lxml.etree._Element to create the Fact from.
+    :param context: The context of the fact. Note that new characteristics will be added to the context.
     """
-    report_element_repository = context.get_report_element_repository()
-    characteristics_repository = context.get_characteristic_repository()
-    error_repository = context.get_error_repository()
+    filingContext.get_fact_repository().upsert(
+        create_fact_from_xml(filingContext, fact_xml_element, context)
+    )
 
-    xml_service = context.get_xml_service()
 
-    for xbrl_instance in xml_service.get_all_etrees():
-        for xml_fact in find_elements(xbrl_instance, ".//*[@contextRef]"):
-            fact_characteristics: list[UnitCharacteristic | ConceptCharacteristic] = []
-
-            # ======== PARSE THE CONCEPT ========
-            concept_name = get_clark_notation_tag(xml_fact)
-
-            if not report_element_repository.has_typed_qname(
-                qname_from_str(concept_name, xml_fact), Concept
-            ):
-                error_repository.insert(
-                    ErrorCode.XML_FACT_INVALID_CONCEPT,
-                    xml_fact,
-                    concept_name=concept_name,
+class XMLFactReader:
+    """
+    Turns the fact elements of one XBRL instance into Facts.
+    The xbrli:context and xbrli:unit elements are registered with the reader as they are read.
+    Facts that reference a context or unit that has not been registered yet are buffered
+    and created as soon as the missing element is registered.
+    This allows reading an instance in document order, even if facts come before their contexts.
+    """
+
+    def __init__(self, context: FilingContext) -> None:
+        self.__context = context
+        self.__xml_contexts: Dict[str, lxml.etree._Element] = {}  # type: ignore
+        self.__xml_units: Dict[str, lxml.etree._Element] = {}  # type: ignore
+        # every xbrli:context is parsed exactly once. None marks contexts that failed to parse.
+        self.__context_templates: Dict[str, Optional[Context]] = {}
+        # (kind of the missing reference, id) -> facts waiting for it
+        self.__pending_facts: Dict[Tuple[str, str], List[lxml.etree._Element]] = {}  # type: ignore
+        # the same facts as a set, so checking if a fact is pending takes constant time
+        self.__pending_elements: Set[lxml.etree._Element] = set()  # type: ignore
+
+    def add_context(self, xml_context: lxml.etree._Element) -> List[Fact]:  # type: ignore
+        """
+        Register an xbrli:context element. If multiple contexts share an id, the first one is kept.
+        :param xml_context: The xbrli:context element.
+        :returns list[Fact]: The buffered facts that could be created now.
+        """
+        context_id = xml_context.get("id")
+        if context_id is None:
+            return []
+        self.__xml_contexts.setdefault(context_id, xml_context)
+        return self.__release(("context", context_id))
+
+    def add_unit(self, xml_unit: lxml.etree._Element) -> List[Fact]:  # type: ignore
+        """
+        Register an xbrli:unit element. If multiple units share an id, the first one is kept.
+        :param xml_unit: The xbrli:unit element.
+        :returns list[Fact]: The buffered facts that could be created now.
+        """
+        unit_id = xml_unit.get("id")
+        if unit_id is None:
+            return []
+        self.__xml_units.setdefault(unit_id, xml_unit)
+        return self.__release(("unit", unit_id))
+
+    def read_fact(self, xml_fact: lxml.etree._Element) -> Optional[Fact]:  # type: ignore
+        """
+        Create the Fact of a fact element.
+        :param xml_fact: An element with a contextRef attribute.
+        :returns Fact|None: The fact. None if the fact is invalid or buffered until its context or unit is registered.
+        """
+        report_element_repository = self.__context.get_report_element_repository()
+        characteristics_repository = self.__context.get_characteristic_repository()
+        error_repository = self.__context.get_error_repository()
+
+        fact_characteristics: list[UnitCharacteristic | ConceptCharacteristic] = []
+
+        # ======== PARSE THE CONCEPT ========
+        concept_name = get_clark_notation_tag(xml_fact)
+
+        if not report_element_repository.has_typed_qname(
+            qname_from_str(concept_name, xml_fact), Concept
+        ):
+            error_repository.insert(
+                ErrorCode.XML_FACT_INVALID_CONCEPT,
+                xml_fact,
+                concept_name=concept_name,
+            )
+            return None
+
+        # ======== CHECK THE REFERENCES ========
+        unit_id = xml_fact.get("unitRef")
+        if unit_id and unit_id not in self.__xml_units:
+            self.__buffer(("unit", unit_id), xml_fact)
+            return None
+
+        context_id = get_str_attribute(xml_fact, "contextRef")
+        if context_id not in self.__xml_contexts:
+            self.__buffer(("context", context_id), xml_fact)
+            return None
+
+        concept_characteristic = characteristics_repository.get_or_create(
+            concept_name,
+            ConceptCharacteristic,
+            lambda: ConceptCharacteristic(
+                report_element_repository.get_typed_by_qname(
+                    qname_from_str(concept_name, xml_fact),
+                    Concept,
                 )
-                continue
-
-            concept_characteristic = characteristics_repository.get_or_create(
-                concept_name,
-                ConceptCharacteristic,
-                lambda: ConceptCharacteristic(
-                    report_element_repository.get_typed_by_qname(
-                        qname_from_str(concept_name, xml_fact),
-                        Concept,
-                    )
-                ),
+            ),
+        )
+        fact_characteristics.append(concept_characteristic)
+
+        # ======== PARSE THE UNIT ========
+        if unit_id:
+            if not characteristics_repository.has(unit_id, UnitCharacteristic):
+                new_unit = parse_unit_from_xml(
+                    self.__context, self.__xml_units[unit_id]
+                )
+                if not new_unit:
+                    return None
+
+                characteristics_repository.upsert(unit_id, new_unit)
+
+            unit_characteristic = characteristics_repository.get(
+                unit_id, UnitCharacteristic
             )
-            fact_characteristics.append(concept_characteristic)
 
-            # ======== PARSE THE UNIT ========
-            unit_id = xml_fact.get("unitRef")
+            fact_characteristics.append(cast(UnitCharacteristic, unit_characteristic))
 
-            if unit_id:
-                unit_xml = xbrl_instance.find(f"{{*}}unit[@id='{unit_id}']")
+        # ======== PARSE THE CONTEXT ========
+        if context_id not in self.__context_templates:
+            self.__context_templates[context_id] = parse_context_xml(
+                self.__context, self.__xml_contexts[context_id], []
+            )
+
+        context_template = self.__context_templates[context_id]
+
+        if not context_template:
+            return None
+
+        fact_context = extend_context(context_template, fact_characteristics)
+
+        return create_fact_from_xml(self.__context, xml_fact, fact_context)
+
+    def has_pending_facts(self) -> bool:
+        """
+        :returns bool: True if any fact is waiting for its context or unit.
+        """
+        return len(self.__pending_elements) > 0
+
+    def is_pending(self, xml_fact: lxml.etree._Element) -> bool:  # type: ignore
+        """
+        :param xml_fact: A fact element that was passed to `read_fact`.
+        :returns bool: True if the fact is waiting for its context or unit.
+        """
+        return xml_fact in self.__pending_elements
 
-                if unit_xml is None:
+    def finish(self) -> None:
+        """
+        Report an error for every fact whose context or unit was never registered.
+        """
+        error_repository = self.__context.get_error_repository()
+
+        for (reference_kind, reference_id), xml_facts in self.__pending_facts.items():
+            for xml_fact in xml_facts:
+                if reference_kind == "unit":
                     error_repository.insert(
                         ErrorCode.XML_INVALID_FACT_UNIT_ID,
                         xml_fact,
-                        unit_id=unit_id,
+                        unit_id=reference_id,
+                    )
+                else:
+                    error_repository.insert(
+                        ErrorCode.XML_INVALID_FACT_CONTEXT_ID,
+                        xml_fact,
+                        context_id=reference_id,
                     )
 
-                    continue
+        self.__pending_facts = {}
+        self.__pending_elements = set()
 
-                if not characteristics_repository.has(unit_id, UnitCharacteristic):
-                    new_unit = parse_unit_from_xml(context, unit_xml)
-                    if not new_unit:
-                        continue
+    def __buffer(
+        self, reference: Tuple[str, str], xml_fact: lxml.etree._Element  # type: ignore
+    ) -> None:
+        self.__pending_facts.setdefault(reference, []).append(xml_fact)
+        self.__pending_elements.add(xml_fact)
 
-                    characteristics_repository.upsert(unit_id, new_unit)
+    def __release(self, reference: Tuple[str, str]) -> List[Fact]:
+        xml_facts = self.__pending_facts.pop(reference, [])
+        self.__pending_elements.difference_update(xml_facts)
 
-                unit_characteristic = characteristics_repository.get(
-                    unit_id, UnitCharacteristic
-                )
+        facts: List[Fact] = []
+        for xml_fact in xml_facts:
+            # the fact might still be waiting for its other reference, then it is buffered again
+            fact = self.read_fact(xml_fact)
+            if fact is not None:
+                facts.append(fact)
+        return facts
 
-                fact_characteristics.append(
-                    cast(UnitCharacteristic, unit_characteristic)
-                )
 
-            # ======== PARSE THE CONTEXT ========
-            context_id = get_str_attribute(xml_fact, "contextRef")
-
-            xml_context = xbrl_instance.find(
-                f"{{*}}context[@id='{context_id}']", namespaces=None
-            )
+def parse_facts_xml(
+    context: FilingContext,
+) -> None:
+    """
+    Parse the facts.
+    :param etrees: The xbrl instance xml trees
+    """
+    fact_repository = context.get_fact_repository()
+    xml_service = context.get_xml_service()
 
-            if xml_context is None:
-                error_repository.insert(
-                    ErrorCode.XML_INVALID_FACT_CONTEXT_ID,
-                    xml_fact,
-                    context_id=context_id,
-                )
-                continue
+    for xbrl_instance in xml_service.get_all_etrees():
+        reader = XMLFactReader(context)
 
-            fact_context = parse_context_xml(context, xml_context, fact_characteristics)
+        # register the contexts and units first, so no fact has to be buffered
+        for xml_context in xbrl_instance.iterfind("{*}context"):
+            reader.add_context(xml_context)
+        for xml_unit in xbrl_instance.iterfind("{*}unit"):
+            reader.add_unit(xml_unit)
 
-            if not fact_context:
-                continue
+        for xml_fact in find_elements(xbrl_instance, FACT_ELEMENTS_XPATH):
+            fact = reader.read_fact(xml_fact)
+            if fact is not None:
+                fact_repository.upsert(fact)
 
-            parse_fact_from_xml(context, xml_fact, fact_context)
+        reader.finish()
@@ -11,6 +11,8 @@ It parses XBRL in the XML syntax.
 ====================
 """
 
+from typing import List, Optional
+
 import lxml.etree
 
 from brel.data.errors.error_repository import ErrorRepository
@@ -27,33 +29,61 @@ from brel.qnames.qname_utils import (
     to_clark_notation,
     to_namespace_localname_notation,
 )
-from brel.reportelements import Dimension
+from brel.reportelements import Dimension, IReportElement
 from brel.services.xml.xml_service import XMLService
 
 from brel.data.report_element.report_element_repository import ReportElementRepository
 from brel.contexts.filing_context import FilingContext
 
+REPORT_ELEMENTS_XPATH = lxml.etree.XPath(
+    ".//xs:element[@name]", namespaces={"xs": "http://www.w3.org/2001/XMLSchema"}
+)
+
 
 def parse_report_elements_xml(
     context: FilingContext,
 ) -> None:
+    """
+    Parse the report elements of all schemas in the DTS.
+    Remote schemas belong to published taxonomies, which do not change.
+    Their report elements are stored in the compiled taxonomy repository after the first parse,
+    keyed by the URI and the content hash of the schema, and loaded from there on later parses.
+    :param context: The filing context.
+    """
     error_repository = context.get_error_repository()
     xml_service = context.get_xml_service()
     report_element_repository = context.get_report_element_repository()
+    compiled_taxonomy_repository = context.get_compiled_taxonomy_repository()
 
-    for etree in xml_service.get_all_etrees():
+    for uri in xml_service.get_all_uris():
+        etree = xml_service.get_etree(uri)
         if not has_str_attribute(etree.getroot(), "targetNamespace"):
             continue
 
+        # only remote schemas with a known content hash are cached
+        cacheable_hash: Optional[str] = None
+        if uri.startswith("http"):
+            cacheable_hash = xml_service.get_content_hash(uri)
+
+        if cacheable_hash is not None:
+            compiled_report_elements = compiled_taxonomy_repository.get_report_elements(
+                uri, cacheable_hash
+            )
+            if compiled_report_elements is not None:
+                for compiled_report_element in compiled_report_elements:
+                    if not report_element_repository.has_qname(
+                        compiled_report_element.get_name()
+                    ):
+                        report_element_repository.upsert(compiled_report_element)
+                continue
+
         target_namespace_url = get_str_attribute(etree.getroot(), "targetNamespace")
+        error_count = error_repository.get_total_count()
 
-        re_xmls = find_elements(
-            etree,
-            ".//xs:element[@name]",
-            namespaces={"xs": "http://www.w3.org/2001/XMLSchema"},
-        )
+        re_xmls = find_elements(etree, REPORT_ELEMENTS_XPATH)
+        report_elements: List[IReportElement] = []
         for re_xml in re_xmls:
-            parse_report_element(
+            report_element = parse_report_element(
                 report_element_repository=report_element_repository,
                 xml_service=xml_service,
                 current_etree=etree,
@@ -61,6 +91,17 @@ def parse_report_elements_xml(
                 target_namespace_url=target_namespace_url,
                 error_repository=error_repository,
             )
+            if report_element is not None:
+                report_elements.append(report_element)
+
+        # schemas with errors are parsed again next time, so their errors are reported again
+        if (
+            cacheable_hash is not None
+            and error_repository.get_total_count() == error_count
+        ):
+            compiled_taxonomy_repository.add_report_elements(
+                uri, cacheable_hash, report_elements
+            )
 
 
 def parse_report_element(
@@ -70,7 +111,11 @@ def parse_report_element(
     report_element_xml: lxml.etree._Element,  # type: ignore
     target_namespace_url: str,
     error_repository: ErrorRepository,
-):
+) -> Optional[IReportElement]:
+    """
+    Parse a single report element and add it to the repository.
+    :returns IReportElement|None: The report element if it was added to the repository. None otherwise.
+    """
     qname_tag = get_str_attribute(report_element_xml, "name")
     qname = qname_from_str(
         to_clark_notation(target_namespace_url, qname_tag), report_element_xml
@@ -103,7 +148,11 @@ def parse_report_element(
                         ref_id=ref_id,
                         ref_schema_name=ref_schema_name,
                     )
-                    return
+                    return report_element
                 ref_type = get_str_attribute(ref_xml, "type")
                 ref_type_qname = qname_from_str(ref_type, ref_xml)
                 report_element.make_typed(ref_type_qname)
+
+        return report_element
+
+    return None
@@ -13,10 +13,20 @@ from typing import final
 
 
 from brel.contexts.filing_context import FilingContext
+from brel.contexts.parsing_stage import ParsingStage
 
 DEBUG = False
 LOADING_INFO = False
 
+NETWORK_STAGE_LINK_NAMES: dict[ParsingStage, str] = {
+    ParsingStage.LABEL_NETWORKS: "labelLink",
+    ParsingStage.REFERENCE_NETWORKS: "referenceLink",
+    ParsingStage.PRESENTATION_NETWORKS: "presentationLink",
+    ParsingStage.CALCULATION_NETWORKS: "calculationLink",
+    ParsingStage.DEFINITION_NETWORKS: "definitionLink",
+    ParsingStage.FOOTNOTE_NETWORKS: "footnoteLink",
+}
+
 
 class FilingParser(ABC):
     """
@@ -37,16 +47,60 @@ class FilingParser(ABC):
         return self.__context
 
     @final
-    def parse(self) -> FilingContext:
+    def parse(self, lazy: bool = False) -> FilingContext:
         """
         Parse the filing.
+        :param lazy: If True, the stages are only registered with the context.
+        Each stage is run the first time its result is needed, together with the stages it depends on.
         """
+        if lazy:
+            self.__register_stages()
+            return self.get_context()
+
         self.parse_report_elements()
         self.parse_facts()
         self.parse_networks()
         self.parse_components()
         return self.get_context()
 
+    def __register_stages(self) -> None:
+        context = self.get_context()
+
+        context.register_stage(
+            ParsingStage.REPORT_ELEMENTS, self.parse_report_elements, []
+        )
+        context.register_stage(
+            ParsingStage.FACTS, self.parse_facts, [ParsingStage.REPORT_ELEMENTS]
+        )
+
+        for stage, link_name in NETWORK_STAGE_LINK_NAMES.items():
+            # footnote links point to facts, all other links only point to report elements
+            dependencies = (
+                [ParsingStage.REPORT_ELEMENTS, ParsingStage.FACTS]
+                if stage == ParsingStage.FOOTNOTE_NETWORKS
+                else [ParsingStage.REPORT_ELEMENTS]
+            )
+            context.register_stage(
+                stage,
+                lambda link_name=link_name: self.parse_networks_by_link_name(link_name),
+                dependencies,
+            )
+
+        context.register_stage(
+            ParsingStage.TABLE_LINKBASES,
+            self.parse_table_linkbases,
+            [ParsingStage.REPORT_ELEMENTS],
+        )
+        context.register_stage(
+            ParsingStage.COMPONENTS,
+            self.parse_components,
+            [
+                ParsingStage.PRESENTATION_NETWORKS,
+                ParsingStage.CALCULATION_NETWORKS,
+                ParsingStage.DEFINITION_NETWORKS,
+            ],
+        )
+
     @abstractmethod
     def get_filing_type(self) -> str:
         """
@@ -75,6 +129,21 @@ class FilingParser(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def parse_networks_by_link_name(self, link_name: str) -> None:
+        """
+        Parse only the networks of one kind of extended link. Used in lazy mode.
+        :param link_name: The local name of the extended links, e.g. "presentationLink".
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def parse_table_linkbases(self) -> None:
+        """
+        Parse the table linkbases. Used in lazy mode. Assumes that the report elements have been parsed already.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def parse_components(self) -> None:
         """
@@ -8,6 +8,8 @@
 ====================
 """
 
+from typing import List, Optional
+
 from brel.contexts.factory import create_filing_context
 from brel.parsers.factory import create_xhtml_filing_parser, create_xml_filing_parser
 from brel.parsers.filing_parser import FilingParser
@@ -17,20 +19,23 @@ class FilingParserFactory:
     def __init__(self) -> None:
         pass
 
-    def create_parser(self, files: list[str]) -> FilingParser:
+    def create_parser(
+        self, files: list[str], taxonomy_packages: Optional[List[str]] = None
+    ) -> FilingParser:
         """
         Create a filing parser based on the provided files.
         If all files are XML or XSD, an XML filing parser is created.
         If all files are XML, XSD, or HTML, an XHTML filing parser is created.
         Otherwise, a ValueError is raised.
         :param files: List of file names to determine the filing type. Cannot be empty.
+        :param taxonomy_packages: Paths of zipped taxonomy packages to mount before the DTS is loaded.
         :returns: An instance of FilingParser.
         :raises ValueError: If no supported filing parser is found for the provided files.
         """
         if not files:
             raise ValueError("No files provided for parsing.")
 
-        context = create_filing_context(files)
+        context = create_filing_context(files, taxonomy_packages)
 
         # Example logic to determine the filing type based on file names
         if all(file.endswith(".xml") or file.endswith(".xsd") for file in files):
@@ -16,9 +16,19 @@ class ZipPathLoader(PathLoader):
         return path.endswith(".zip")
 
     def load(self, path: str) -> list[str]:
+        """
+        Lists the files in a zip archive without extracting them.
+        The files are read directly from the archive later on, see `ZipArchiveSource`.
+        :param path: The path of the zip archive.
+        :returns: The paths of the .xml, .xhtml, .htm, .html and .xsd files, prefixed with the path of the archive.
+        """
         import zipfile
 
+        archive_path = path.replace("\\", "/")
         with zipfile.ZipFile(path, "r") as zip_ref:
             file_list = zip_ref.namelist()
-            # More extensions?
-            return [file for file in file_list if file.endswith((".xml", ".xhtml"))]
+            return [
+                f"{archive_path}/{file}"
+                for file in file_list
+                if file.endswith((".xml", ".xhtml", ".htm", ".html", ".xsd"))
+            ]
@@ -0,0 +1,168 @@
+"""
+This module compiles the networks of an extended link into a compact form and creates the networks from it again.
+
+Compiled links refer to report elements only by their name, so they do not depend on the filing they were parsed in.
+Label and reference links of published taxonomies do not change, so their compiled form can be reused across filings.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, cast
+
+from brel.data.compiled_taxonomy.compiled_taxonomy_repository import (
+    CompiledLink,
+    CompiledNode,
+)
+from brel.data.report_element.report_element_repository import ReportElementRepository
+from brel.networks import (
+    INetwork,
+    INetworkNode,
+    LabelNetwork,
+    LabelNetworkNode,
+    ReferenceNetwork,
+    ReferenceNetworkNode,
+)
+from brel.qnames.qname import QName
+from brel.reportelements import IReportElement
+from brel.resource import BrelLabel, BrelReference
+
+# the local names of the extended links that can be compiled
+COMPILABLE_LINK_NAMES = ("labelLink", "referenceLink")
+
+
+def compile_link(
+    link_role: str, link_name: QName, networks: List[INetwork]
+) -> Optional[CompiledLink]:
+    """
+    Compile the networks of a label or reference link.
+    :param link_role: The role of the extended link.
+    :param link_name: The name of the extended link.
+    :param networks: The networks parsed from the extended link.
+    :returns CompiledLink|None: The compiled link. None if a node points to something other than a report element or a resource.
+    """
+    node_objects: List[INetworkNode] = []
+    node_indexes: Dict[int, int] = {}
+    network_roots: List[List[int]] = []
+
+    for network in networks:
+        worklist = list(network.get_roots())
+        while len(worklist) > 0:
+            node = worklist.pop()
+            if id(node) not in node_indexes:
+                node_indexes[id(node)] = len(node_objects)
+                node_objects.append(node)
+                worklist.extend(node.get_children())
+
+        network_roots.append([node_indexes[id(root)] for root in network.get_roots()])
+
+    nodes: List[CompiledNode] = []
+    for node in node_objects:
+        if node.points_to() == "report element":
+            target: QName | BrelLabel | BrelReference = (
+                node.get_report_element().get_name()
+            )
+        elif node.points_to() == "resource":
+            target = cast(BrelLabel | BrelReference, node.get_resource())
+        else:
+            return None
+        nodes.append(
+            (target, node.get_arc_role(), node.get_arc_name(), node.get_order())
+        )
+
+    # the children of a node are listed in their order, so adding them again in that order keeps it
+    edges = [
+        (index, node_indexes[id(child)])
+        for index, node in enumerate(node_objects)
+        for child in node.get_children()
+    ]
+
+    return link_role, link_name, nodes, edges, network_roots
+
+
+def create_networks_from_compiled_link(
+    local_link_name: str,
+    compiled_link: CompiledLink,
+    report_element_repository: ReportElementRepository,
+) -> Optional[List[INetwork]]:
+    """
+    Create the networks of a compiled label or reference link.
+    The report elements are not updated, e.g. the labels are not added to their report elements.
+    :param local_link_name: The local name of the extended link. Either "labelLink" or "referenceLink".
+    :param compiled_link: The compiled link.
+    :param report_element_repository: The report elements the nodes point to.
+    :returns list[INetwork]|None: The networks. None if a report element of the link is not in the repository.
+    """
+    link_role, link_name, compiled_nodes, edges, network_roots = compiled_link
+
+    nodes: List[INetworkNode] = []
+    for target, arc_role, arc_name, order in compiled_nodes:
+        if isinstance(target, QName):
+            if not report_element_repository.has_qname(target):
+                return None
+            points_to: IReportElement | BrelLabel | BrelReference = (
+                report_element_repository.get_by_qname(target)
+            )
+        else:
+            points_to = cast(BrelLabel | BrelReference, target)
+
+        if local_link_name == "labelLink":
+            nodes.append(
+                LabelNetworkNode(
+                    cast(IReportElement | BrelLabel, points_to),
+                    arc_role,
+                    arc_name,
+                    link_role,
+                    link_name,
+                )
+            )
+        else:
+            nodes.append(
+                ReferenceNetworkNode(
+                    cast(IReportElement | BrelReference, points_to),
+                    [],
+                    arc_role,
+                    arc_name,
+                    link_role,
+                    link_name,
+                    order,
+                )
+            )
+
+    # the children of a node are added at once, so every node sorts its children only once
+    children: Dict[int, List[INetworkNode]] = defaultdict(list)
+    for parent_index, child_index in edges:
+        children[parent_index].append(nodes[child_index])
+    for parent_index, node_children in children.items():
+        nodes[parent_index]._add_children(node_children)
+
+    networks: List[INetwork] = []
+    for root_indexes in network_roots:
+        if local_link_name == "labelLink":
+            networks.append(
+                LabelNetwork(
+                    [cast(LabelNetworkNode, nodes[index]) for index in root_indexes],
+                    link_role,
+                    link_name,
+                    True,
+                )
+            )
+        else:
+            networks.append(
+                ReferenceNetwork(
+                    [
+                        cast(ReferenceNetworkNode, nodes[index])
+                        for index in root_indexes
+                    ],
+                    link_role,
+                    link_name,
+                    True,
+                )
+            )
+    return networks
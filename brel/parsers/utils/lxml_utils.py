@@ -9,7 +9,8 @@
 """
 
 from copy import deepcopy
-from typing import Dict, List, Mapping, Optional, cast
+from functools import lru_cache
+from typing import IO, Dict, List, Mapping, Optional, Tuple, cast
 from brel.qnames.qname import QName
 import lxml.etree
 from lxml.etree import _Element, _ElementTree, XPath  # type: ignore
@@ -97,22 +98,67 @@ def get_prefix_localname_tag(element: _Element) -> str:
     return qname_from_str(element.tag, element).prefix_local_name_notation()
 
 
+XPATH_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=XPATH_CACHE_SIZE)
+def _compile_xpath(xpath_query: str, namespaces: Tuple[Tuple[str, str], ...]) -> XPath:
+    """
+    Compile an XPath query. The compiled queries are cached by the query and the namespaces.
+    The namespaces are passed as a sorted tuple of (prefix, uri) pairs, so they are hashable.
+    """
+    return XPath(xpath_query, namespaces=dict(namespaces))
+
+
+def get_xpath_cache_info() -> Dict[str, int]:
+    """
+    Get the statistics of the compiled XPath cache used by `find_elements`.
+    :returns: A dict with the number of cache hits and misses, the number of cached queries and the maximum number of cached queries.
+    """
+    cache_info = _compile_xpath.cache_info()
+    return {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "size": cache_info.currsize,
+        "max_size": cache_info.maxsize or 0,
+    }
+
+
+def clear_xpath_cache() -> None:
+    """
+    Clear the compiled XPath cache used by `find_elements` and reset its statistics.
+    """
+    _compile_xpath.cache_clear()
+
+
 def find_elements(
     element: _ElementTree | _Element,  # type: ignore
-    xpath_query: str | QName,
+    xpath_query: str | QName | XPath,
     namespaces: Optional[Dict[str, str]] = None,
 ) -> list[_Element]:
+    """
+    Find all elements matching an XPath query.
+    String queries are compiled once per query and namespaces and then taken from a bounded cache.
+    Queries that run for every document should be compiled upfront and passed as XPath objects.
+    :param element: The element or tree to run the query on.
+    :param xpath_query: The query as a string, a QName or a compiled XPath object.
+    :param namespaces: The namespaces of the query. Defaults to the namespaces in scope of the element. Ignored for compiled queries.
+    :returns: The matching elements. An empty list if the query cannot be evaluated.
+    """
     if isinstance(xpath_query, QName):
         xpath_query = xpath_query.prefix_local_name_notation()
 
     if isinstance(element, _ElementTree):
         element = element.getroot()
 
-    if not namespaces:
-        namespaces = {k: v for k, v in element.nsmap.items() if k is not None}
-
     try:
-        find = XPath(xpath_query, namespaces=namespaces)
+        if isinstance(xpath_query, XPath):
+            find = xpath_query
+        else:
+            if not namespaces:
+                namespaces = {k: v for k, v in element.nsmap.items() if k is not None}
+            find = _compile_xpath(xpath_query, tuple(sorted(namespaces.items())))
+
         result = find(element)
         return cast(List[_Element], result)
     except lxml.etree.XPathEvalError:
@@ -161,6 +207,25 @@ def get_all_nsmaps(
     return nsmaps
 
 
+def parse_xml_with_namespaces(
+    file: IO[bytes],
+) -> Tuple[_ElementTree, List[Tuple[str, str]]]:  # type: ignore
+    """
+    Parse an XML document and collect its namespace declarations in the same pass.
+    The declarations are taken from the start-ns events of the parser,
+    so the cost depends on the number of declarations and not on the number of elements.
+    :param file: The XML document.
+    :returns: The parsed tree and the distinct (prefix, uri) declarations in document order. Default namespaces are left out.
+    """
+    namespaces: Dict[Tuple[str, str], None] = {}
+    events = lxml.etree.iterparse(file, events=("start-ns",))
+    for _, (prefix, uri) in events:
+        if prefix:
+            namespaces[(prefix, uri)] = None
+
+    return events.root.getroottree(), list(namespaces.keys())
+
+
 def get_elem_lang_recursive(xml_element: _Element | None) -> Optional[str]:
     """
     Recursively traverse the given lxml element up the tree, returning the first xml:lang attribute found.
@@ -1,7 +1,11 @@
+import heapq
+from collections import defaultdict
+from typing import Dict, Hashable, List, Set, Tuple
+
 from brel.networks import INetwork, INetworkNode
 
-# from brel.utils import pprint
-from functools import cmp_to_key
+# a node type, what the node points to and the identity of its target
+type NodeKey = Tuple[type, str, Hashable]
 
 
 def nodes_equal(self: INetworkNode, other: INetworkNode) -> bool:
@@ -47,50 +51,105 @@ def combine_networks(networks: list[INetwork]) -> INetwork:
         return networks[0]
 
     # Step 1. sort the networks by prerequisite
-
-    def is_prerequisite(n1: INetwork, n2: INetwork) -> int:
-        # n1 is a prerequisite of n2 if all roots of n2 are in n1
-        # and if the roots of n2 are not a subset of the roots of n1
-        n1_roots = n1.get_roots()
-        n2_roots = n2.get_roots()
-
-        n1_nodes = n1.get_all_nodes()
-
-        result = all((n2_root in n1_nodes for n2_root in n2_roots)) and not all(
-            (n2_root in n1_roots for n2_root in n2_roots)
-        )
-
-        if result:
-            return -1
-        else:
-            return 1
-
-    networks_sorted = networks.copy()
-    sorted(networks_sorted, key=cmp_to_key(is_prerequisite))
+    networks_sorted = __sort_by_prerequisite(networks)
 
     # Step 2. Make an aggregate network.
     # In this case we re-use the first network as the aggregate network.
-    agg_network = networks_sorted.pop()
+    # The nodes of the aggregate network are indexed by their key, so a matching node is found in constant time.
+    agg_network = networks_sorted[0]
     agg_roots = agg_network.get_roots()
-
-    def get_all_nodes():
-        all_nodes = []
-        for root in agg_roots:
-            all_nodes.extend(root.get_all_descendants())
-        return all_nodes
+    aggregate_nodes: Dict[NodeKey, INetworkNode] = {}
+    for root in agg_roots:
+        __index_nodes(aggregate_nodes, root)
 
     # Step 3. Add the roots of each network to the aggregate network.
     # if there is a node in the aggregate network that fits, then add the children of the root to that node.
     # otherwise, add the root to the aggregate networks roots.
-    while len(networks_sorted) > 0:
-        network = networks_sorted.pop()
-        aggregate_nodes = get_all_nodes()
+    # the children are added to their parents at the end, so every parent sorts its children only once
+    new_children: Dict[INetworkNode, List[INetworkNode]] = defaultdict(list)
+    for network in networks_sorted[1:]:
+        added_nodes: List[INetworkNode] = []
         for root in network.get_roots():
-            parent = next((n for n in aggregate_nodes if nodes_equal(n, root)), None)
+            parent = aggregate_nodes.get(__get_node_key(root))
             if parent is None:
                 agg_roots.append(root)
+                added_nodes.append(root)
             else:
-                for child in root.get_children():
-                    parent._add_child(child)
+                children = root.get_children()
+                new_children[parent].extend(children)
+                added_nodes.extend(children)
+
+        # the added nodes are indexed after the whole network is merged, so the roots of a network do not match each other
+        for node in added_nodes:
+            __index_nodes(aggregate_nodes, node)
+
+    for parent, children in new_children.items():
+        parent._add_children(children)
 
     return agg_network
+
+
+def __sort_by_prerequisite(networks: list[INetwork]) -> list[INetwork]:
+    """
+    Sort the networks topologically. A network is a prerequisite of another network if one of the roots of the other network
+    points to the same thing as a node below the roots of the network. Prerequisites come first, so the roots of the other
+    network can be attached to that node. Otherwise, the networks keep their order. Networks in a cycle are appended in their order.
+    """
+    networks_by_key: Dict[NodeKey, Set[int]] = defaultdict(set)
+    for index, network in enumerate(networks):
+        for root in network.get_roots():
+            for child in root.get_children():
+                for node in child.get_all_descendants():
+                    networks_by_key[__get_node_key(node)].add(index)
+
+    dependents: Dict[int, Set[int]] = defaultdict(set)
+    prerequisite_counts = [0] * len(networks)
+    for index, network in enumerate(networks):
+        prerequisites: Set[int] = set()
+        for root in network.get_roots():
+            prerequisites.update(networks_by_key.get(__get_node_key(root), ()))
+        prerequisites.discard(index)
+
+        prerequisite_counts[index] = len(prerequisites)
+        for prerequisite in prerequisites:
+            dependents[prerequisite].add(index)
+
+    # the ready networks are kept in a heap, so networks without prerequisites between them keep their order
+    ready = [index for index, count in enumerate(prerequisite_counts) if count == 0]
+    heapq.heapify(ready)
+    order: List[int] = []
+    while len(ready) > 0:
+        index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in dependents[index]:
+            prerequisite_counts[dependent] -= 1
+            if prerequisite_counts[dependent] == 0:
+                heapq.heappush(ready, dependent)
+
+    ordered = set(order)
+    order.extend(index for index in range(len(networks)) if index not in ordered)
+
+    return [networks[index] for index in order]
+
+
+def __index_nodes(index: Dict[NodeKey, INetworkNode], node: INetworkNode) -> None:
+    """
+    Add a node and all its descendants to the index. Nodes that are already indexed under a key are kept.
+    """
+    for descendant in node.get_all_descendants():
+        index.setdefault(__get_node_key(descendant), descendant)
+
+
+def __get_node_key(node: INetworkNode) -> NodeKey:
+    """
+    Get a hashable key of a node. Nodes with the same key are equal according to `nodes_equal`.
+    Report elements are identified by their name, as a DTS has one report element per name. Resources and facts are only equal to themselves.
+    """
+    points_to = node.points_to()
+    if points_to == "report element":
+        return type(node), points_to, node.get_report_element().get_name()
+    elif points_to == "resource":
+        return type(node), points_to, id(node.get_resource())
+    elif points_to == "fact":
+        return type(node), points_to, id(node.get_fact())
+    return type(node), points_to, id(node)
@@ -17,10 +17,12 @@ from brel.parsers.XHMTL.networks.xhtml_parse_footnote_network import (
     parse_footnote_networks_xhtml,
 )
 from brel.parsers.XML.networks.xml_networks_parser import parse_networks_from_xmls
+from brel.parsers.XML.table_linkbase.xml_table_linkbase_parser import (
+    parse_table_linkbase_from_xml,
+)
 from brel.parsers.XML.xml_component_parser import parse_components_xml
 from brel.parsers.XML.xml_report_element_parser import parse_report_elements_xml
 from brel.parsers.filing_parser import FilingParser
-from brel.parsers.utils.lxml_utils import get_all_nsmaps
 
 
 class XHTMLFilingParser(FilingParser):
@@ -39,10 +41,8 @@ class XHTMLFilingParser(FilingParser):
         namespace_repository.upsert("xml", "http://www.w3.org/XML/1998/namespace")
         namespace_repository.upsert("html", "http://www.w3.org/1999/xhtml")
 
-        xml_trees = xml_service.get_all_etrees()
-        for nsmap in get_all_nsmaps(xml_trees):
-            for prefix, url in nsmap.items():
-                namespace_repository.upsert(prefix, url)
+        for prefix, url in xml_service.get_all_namespaces():
+            namespace_repository.upsert(prefix, url)
 
     def parse_report_elements(self) -> None:
         parse_report_elements_xml(self.get_context())
@@ -56,6 +56,16 @@ class XHTMLFilingParser(FilingParser):
         )
         parse_networks_from_xmls(self.get_context())
 
+    def parse_networks_by_link_name(self, link_name: str) -> None:
+        if link_name == "footnoteLink":
+            parse_footnote_networks_xhtml(
+                self.get_context(), self.__footnote_network_elements
+            )
+        parse_networks_from_xmls(self.get_context(), [link_name])
+
+    def parse_table_linkbases(self) -> None:
+        parse_table_linkbase_from_xml(self.get_context())
+
     def parse_components(self) -> None:
         parse_components_xml(self.get_context())
 
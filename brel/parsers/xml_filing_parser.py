@@ -17,7 +17,9 @@ from brel.parsers.XML.xml_report_element_parser import parse_report_elements_xml
 from brel.parsers.filing_parser import FilingParser
 from brel.contexts.filing_context import FilingContext
 from brel.parsers.XML.networks.xml_networks_parser import parse_networks_from_xmls
-from brel.parsers.utils.lxml_utils import get_all_nsmaps
+from brel.parsers.XML.table_linkbase.xml_table_linkbase_parser import (
+    parse_table_linkbase_from_xml,
+)
 
 
 class XMLFilingParser(FilingParser):
@@ -35,10 +37,8 @@ class XMLFilingParser(FilingParser):
 
         namespace_repository.upsert("xml", "http://www.w3.org/XML/1998/namespace")
 
-        xml_trees = xml_service.get_all_etrees()
-        for nsmap in get_all_nsmaps(xml_trees):
-            for prefix, url in nsmap.items():
-                namespace_repository.upsert(prefix, url)
+        for prefix, url in xml_service.get_all_namespaces():
+            namespace_repository.upsert(prefix, url)
 
     def parse_report_elements(self) -> None:
         parse_report_elements_xml(self.get_context())
@@ -49,6 +49,12 @@ class XMLFilingParser(FilingParser):
     def parse_networks(self) -> None:
         parse_networks_from_xmls(self.get_context())
 
+    def parse_networks_by_link_name(self, link_name: str) -> None:
+        parse_networks_from_xmls(self.get_context(), [link_name])
+
+    def parse_table_linkbases(self) -> None:
+        parse_table_linkbase_from_xml(self.get_context())
+
     def parse_components(self) -> None:
         parse_components_xml(self.get_context())
 
@@ -13,7 +13,7 @@ This module contains the Abstract class. An abstract a kind of report element th
 from typing import Any, Dict, List, Optional
 from brel import QName
 from brel.reportelements import IReportElement
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -28,7 +28,7 @@ class Abstract(IReportElement):
     def __init__(self, qname: QName, id: str | None, labels: list[BrelLabel]) -> None:
         self.__qname = qname
         self.__id = id
-        self.__labels = labels
+        self.__label_index = LabelIndex(self.__qname, labels)
 
     def get_name(self) -> QName:
         """
@@ -49,14 +49,20 @@ class Abstract(IReportElement):
         Get the labels of the abstract element.
         :returns list[Label]: contains the labels of the abstract element
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        :returns LabelIndex: the labels of the abstract indexed by their language
+        """
+        return self.__label_index
 
     def _add_label(self, label: BrelLabel):
         """
         Add a label to the abstract element.
         :param label: the label to add to the abstract element
         """
-        self.__labels.append(label)
+        self.__label_index.add(label)
 
     def __str__(self) -> str:
         return self.__qname.__str__()
@@ -85,7 +91,7 @@ class Abstract(IReportElement):
         abstract_literal = translation_service.get("report-element:abstract", languages)
 
         label = translation_service.get_from_labels(
-            self.get_labels(), languages, self.select_main_label().__str__()
+            self.get_label_index(), languages, self.select_main_label().__str__()
         )
 
         return {
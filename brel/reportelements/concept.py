@@ -20,7 +20,7 @@ from brel import QName
 from brel.data.errors.error_repository import ErrorRepository
 from brel.errors.error_code import ErrorCode
 from brel.reportelements import IReportElement
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 textual_types = [
@@ -168,7 +168,7 @@ class Concept(IReportElement):
     ) -> None:
         self.__name: QName = name
         self.__id: str | None = id
-        self.__labels: list[BrelLabel] = labels
+        self.__label_index = LabelIndex(self.__name, labels)
         self.__period_type: str = period_type
         self.__balance_type: str | None = balance_type
         self.__nillable: bool = nillable
@@ -200,14 +200,20 @@ class Concept(IReportElement):
         Get the labels of the concept.
         :returns list[Label]: all labels of the concept
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        :returns LabelIndex: the labels of the concept indexed by their language
+        """
+        return self.__label_index
 
     def _add_label(self, label: BrelLabel) -> None:
         """
         Add a label to the concept.
         :param label: the label to add to the concept
         """
-        self.__labels.append(label)
+        self.__label_index.add(label)
 
     def get_period_type(self) -> str:
         """
@@ -375,7 +381,7 @@ class Concept(IReportElement):
 
         label_literal = translation_service.get("literal:label", languages)
         label = translation_service.get_from_labels(
-            self.get_labels(), languages, self.select_main_label().__str__()
+            self.get_label_index(), languages, self.select_main_label().__str__()
         )
 
         report_element_type_literal = translation_service.get(
@@ -16,7 +16,7 @@ The already existing dimensions are the core aspects of a fact, namely the perio
 from typing import Any, Dict, List, Optional
 from brel import QName
 from brel.reportelements import IReportElement
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -32,7 +32,7 @@ class Dimension(IReportElement):
     def __init__(self, name: QName, id: str | None, labels: list[BrelLabel]) -> None:
         self.__name = name
         self.__id = id
-        self.__labels = labels
+        self.__label_index = LabelIndex(self.__name, labels)
         self.__type: QName | None = None
 
     def get_name(self) -> QName:
@@ -54,14 +54,20 @@ class Dimension(IReportElement):
         Get the labels of the dimension.
         :returns list[Label]: all labels of the dimension
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        :returns LabelIndex: the labels of the dimension indexed by their language
+        """
+        return self.__label_index
 
     def _add_label(self, label: BrelLabel):
         """
         Add a label to the dimension.
         :param label: the label to add to the dimension
         """
-        self.__labels.append(label)
+        self.__label_index.add(label)
 
     def is_explicit(self) -> bool:
         """
@@ -119,7 +125,7 @@ class Dimension(IReportElement):
 
         label_literal = translation_service.get("literal:label", languages)
         label = translation_service.get_from_labels(
-            self.get_labels(), languages, self.select_main_label().__str__()
+            self.get_label_index(), languages, self.select_main_label().__str__()
         )
 
         report_element_type_literal = translation_service.get(
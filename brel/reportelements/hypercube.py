@@ -13,7 +13,7 @@ This module contains the Hypercube class.
 from typing import Any, Dict, List, Optional
 from brel import QName
 from brel.reportelements import IReportElement
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -21,7 +21,7 @@ class Hypercube(IReportElement):
     def __init__(self, name: QName, id: str | None, labels: list[BrelLabel]):
         self.__name = name
         self.__id = id
-        self.__labels = labels
+        self.__label_index = LabelIndex(self.__name, labels)
 
     def get_name(self) -> QName:
         """
@@ -39,7 +39,13 @@ class Hypercube(IReportElement):
         """
         @return list[BrelLabel]: the labels of the hypercube
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        :returns LabelIndex: the labels of the hypercube indexed by their language
+        """
+        return self.__label_index
 
     def _add_label(self, label: BrelLabel):
         """
@@ -47,7 +53,7 @@ class Hypercube(IReportElement):
         However, if you want to add a label to a hypercube, you can use this method.
         @param label: the label to add to the hypercube
         """
-        self.__labels.append(label)
+        self.__label_index.add(label)
 
     def __str__(self) -> str:
         """
@@ -81,7 +87,7 @@ class Hypercube(IReportElement):
         )
 
         label = translation_service.get_from_labels(
-            self.get_labels(), languages, self.select_main_label().__str__()
+            self.get_label_index(), languages, self.select_main_label().__str__()
         )
 
         return {
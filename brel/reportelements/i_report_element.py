@@ -19,7 +19,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from brel import QName
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -54,6 +54,15 @@ class IReportElement(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_label_index(self) -> LabelIndex:  # pragma: no cover
+        """
+        Get the labels of the report element indexed by their language.
+        The index is updated whenever a label is added, so translations look labels up by language without scanning them.
+        :returns LabelIndex: containing the labels of the report element
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _add_label(self, label: BrelLabel):  # pragma: no cover
         raise NotImplementedError
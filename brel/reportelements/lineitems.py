@@ -13,7 +13,7 @@ This module contains the LineItems class.
 from typing import Dict, Any, List, Optional
 from brel import QName
 from brel.reportelements import IReportElement
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -21,7 +21,7 @@ class LineItems(IReportElement):
     def __init__(self, name: QName, id: str | None, labels: list[BrelLabel]):
         self.__name = name
         self.__id = id
-        self.__labels = labels
+        self.__label_index = LabelIndex(self.__name, labels)
 
     def get_name(self) -> QName:
         """
@@ -39,7 +39,13 @@ class LineItems(IReportElement):
         """
         :returns list[BrelLabel]: the labels of the line items
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        :returns LabelIndex: the labels of the line items indexed by their language
+        """
+        return self.__label_index
 
     def _add_label(self, label: BrelLabel):
         """
@@ -47,7 +53,7 @@ class LineItems(IReportElement):
         However, if you want to add a label to a line items, you can use this method.
         :param label: the label to add to the line items
         """
-        self.__labels.append(label)
+        self.__label_index.add(label)
 
     def __str__(self) -> str:
         """
@@ -81,7 +87,7 @@ class LineItems(IReportElement):
         )
 
         label = translation_service.get_from_labels(
-            self.get_labels(), languages, self.select_main_label().__str__()
+            self.get_label_index(), languages, self.select_main_label().__str__()
         )
 
         return {
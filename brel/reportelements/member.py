@@ -14,7 +14,7 @@ Members are used to represent the possible values of an explicit dimension.
 from typing import Any, Dict, List, Optional
 from brel import QName
 from brel.reportelements import IReportElement
-from brel.resource import BrelLabel
+from brel.resource import BrelLabel, LabelIndex
 from brel.services.translation.translation_service import TranslationService
 
 
@@ -27,7 +27,7 @@ class Member(IReportElement):
     def __init__(self, name: QName, id: str | None, labels: list[BrelLabel]):
         self.__name = name
         self.__id = id
-        self.__labels = labels
+        self.__label_index = LabelIndex(self.__name, labels)
 
     def get_name(self) -> QName:
         """
@@ -45,7 +45,13 @@ class Member(IReportElement):
         """
         :returns list[BrelLabel]: the labels of the member
         """
-        return self.__labels
+        return self.__label_index.get_labels()
+
+    def get_label_index(self) -> LabelIndex:
+        """
+        :returns LabelIndex: the labels of the member indexed by their language
+        """
+        return self.__label_index
 
     def _add_label(self, label: BrelLabel):
         """
@@ -53,7 +59,7 @@ class Member(IReportElement):
         However, if you want to add a label to a member, you can use this method.
         :param label: the label to add to the member
         """
-        self.__labels.append(label)
+        self.__label_index.add(label)
 
     def __str__(self) -> str:
         return self.__name.__str__()
@@ -82,7 +88,7 @@ class Member(IReportElement):
         member_literal = translation_service.get("report-element:member", languages)
 
         label = translation_service.get_from_labels(
-            self.get_labels(), languages, self.select_main_label().__str__()
+            self.get_label_index(), languages, self.select_main_label().__str__()
         )
 
         return {
@@ -4,3 +4,4 @@ from .brel_label import BrelLabel
 
 from .brel_reference import BrelReference
 from .brel_footnote import BrelFootnote
+from .label_index import LabelIndex
@@ -0,0 +1,87 @@
+"""
+This module contains the LabelIndex class, which indexes the labels of a report element or an aspect by their language.
+
+=================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+=================
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from brel.resource.brel_label import BrelLabel
+
+# the lowercased language tag and the lowercased tag without its locale
+type LanguageKey = Tuple[str, str]
+
+
+def get_language_key(language: str) -> LanguageKey:
+    """
+    Normalize a language tag, e.g. 'en-US' to ('en-us', 'en').
+    Language tags are compared through their keys, so they are only lowercased and split once.
+    :param language: the language tag to normalize
+    :returns LanguageKey: the lowercased tag and the lowercased tag without its locale
+    """
+    normalized_language = language.lower()
+    return normalized_language, normalized_language.split("-")[0]
+
+
+class LabelIndex:
+    """
+    The labels of a report element or an aspect, indexed by their normalized language when they are added.
+    The first label of a language wins, like in a linear scan over the labels.
+    """
+
+    def __init__(self, owner_name: Hashable, labels: List[BrelLabel]) -> None:
+        """
+        :param owner_name: the name of the report element or the aspect that owns the labels
+        :param labels: the labels of the owner. The list is kept, so labels have to be added through the index.
+        """
+        self.__owner_name = owner_name
+        self.__labels = labels
+        self.__labels_by_language: Dict[str, BrelLabel] = {}
+        self.__labels_by_base_language: Dict[str, BrelLabel] = {}
+        for label in labels:
+            self.__index_label(label)
+
+    def get_owner_name(self) -> Hashable:
+        """
+        :returns Hashable: the name of the report element or the aspect that owns the labels
+        """
+        return self.__owner_name
+
+    def get_labels(self) -> List[BrelLabel]:
+        """
+        :returns list[BrelLabel]: the labels in the order they were added
+        """
+        return self.__labels
+
+    def add(self, label: BrelLabel) -> None:
+        """
+        Add a label and index its language.
+        :param label: the label to add
+        """
+        self.__labels.append(label)
+        self.__index_label(label)
+
+    def get(self, language_key: LanguageKey, match_locale: bool) -> Optional[BrelLabel]:
+        """
+        Get the first label of a language.
+        :param language_key: the key of the language, see get_language_key
+        :param match_locale: if False, the locale of the language is ignored
+        :returns BrelLabel|None: the first label of the language. None if there is none.
+        """
+        if match_locale:
+            return self.__labels_by_language.get(language_key[0])
+        return self.__labels_by_base_language.get(language_key[1])
+
+    def __index_label(self, label: BrelLabel) -> None:
+        language_key = get_language_key(label.get_language())
+        self.__labels_by_language.setdefault(language_key[0], label)
+        self.__labels_by_base_language.setdefault(language_key[1], label)
+
+    def __len__(self) -> int:
+        return len(self.__labels)
@@ -8,16 +8,19 @@
 ====================
 """
 
-from lxml.etree import parse as parse_xml
+import os
 from lxml.html import html5parser
 from requests import Session
+from requests.adapters import HTTPAdapter
 from brel.data.errors.error_repository import ErrorRepository
 from brel.data.file.file_repository import FileRepository
 from brel.data.namespace.namespace_repository import NamespaceRepository
 from brel.data.report_element.report_element_repository import ReportElementRepository
 from brel.data.uri_rewrite.uri_rewrite_repository import URIRewriteRepository
 from brel.data.xml.xml_repository import XMLRepository
+from brel.parsers.utils.lxml_utils import parse_xml_with_namespaces
 from brel.services.file.file_service import FileService
+from brel.services.file.host_rate_limiter import HostRateLimiter
 from brel.services.report_element.report_element_service import ReportElementService
 from brel.services.xml.xml_file_parser_resolver import XMLFileParserResolver
 from brel.services.xml.xml_service import XMLService
@@ -30,12 +33,31 @@ def create_report_element_service(
     return ReportElementService(namespace_repository, report_element_repository)
 
 
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 16
+
+
 def create_file_service(
     file_repository: FileRepository,
     error_repository: ErrorRepository,
 ) -> FileService:
     session = Session()
-    return FileService(file_repository, error_repository, session)
+    # one pool per host, large enough for the concurrent downloads of the DTS discovery
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+
+    # sec.gov allows at most 10 requests per second
+    rate_limiter = HostRateLimiter({"www.sec.gov": 0.1})
+
+    # set BREL_OFFLINE=1 to work only with cached files, e.g. on machines without network access
+    offline = os.environ.get("BREL_OFFLINE", "") not in ("", "0")
+    return FileService(
+        file_repository, error_repository, session, rate_limiter, offline=offline
+    )
 
 
 def create_xml_service(
@@ -51,6 +73,6 @@ def create_xml_service(
 
 def create_xml_file_parser_resolver() -> XMLFileParserResolver:
     return XMLFileParserResolver(
-        lambda content: parse_xml(content),
-        lambda content: parse_xml(content),
+        lambda content: parse_xml_with_namespaces(content),
+        lambda content: parse_xml_with_namespaces(content),
     )
@@ -1,4 +1,16 @@
 """
+The file service fetches the files of a filing and its DTS into the file repository.
+
+Remote files are downloaded once and then served from the repository.
+Downloads are rate limited per host and retried with exponential backoff if the server is busy (429) or fails (5xx).
+A download is given up if the server asks for a longer wait than `max_backoff`.
+If `revalidate_after` is set, cached files that are older than that are revalidated with a conditional request,
+so unchanged files are not downloaded again.
+In offline mode, the network is never used and only cached files are available.
+
+Files inside zip archives, such as zipped filings and taxonomy packages, are read directly from the archive.
+They are neither extracted nor copied into the repository.
+
 ====================
 
 - author: Robin Schmidiger
@@ -9,12 +21,17 @@
 """
 
 import time
+from email.utils import parsedate_to_datetime
 from io import BytesIO
-from typing import IO
-from requests import Session
+from typing import IO, Dict, List, Optional
+from requests import RequestException, Response, Session
 from brel.data.errors.error_repository import ErrorRepository
 from brel.data.file.file_repository import FileRepository
 from brel.errors.error_code import ErrorCode
+from brel.services.file.host_rate_limiter import HostRateLimiter
+from brel.services.file.zip_archive_source import ZipArchiveSource
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
 class FileService:
@@ -23,10 +40,35 @@ class FileService:
         file_repository: FileRepository,
         error_repository: ErrorRepository,
         session: Session,
+        rate_limiter: HostRateLimiter,
+        timeout: float = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60,
+        revalidate_after: Optional[float] = None,
+        offline: bool = False,
+        archive_source: Optional[ZipArchiveSource] = None,
     ) -> None:
+        """
+        :param timeout: The timeout of a single request in seconds.
+        :param max_retries: How often a request is retried after a connection error, a 429 or a 5xx response.
+        :param backoff_factor: The wait before the n-th retry is backoff_factor * 2**n seconds, unless the server sends a Retry-After header.
+        :param max_backoff: The longest wait before a retry in seconds. If the Retry-After header of the server asks for a longer wait, the request is not retried.
+        :param revalidate_after: The age in seconds after which cached remote files are revalidated. None to never revalidate.
+        :param offline: If True, no requests are sent and only cached files are available.
+        :param archive_source: The source of files inside zip archives.
+        """
         self.__file_repository = file_repository
         self.__error_repository = error_repository
         self.__session = session
+        self.__rate_limiter = rate_limiter
+        self.__timeout = timeout
+        self.__max_retries = max_retries
+        self.__backoff_factor = backoff_factor
+        self.__max_backoff = max_backoff
+        self.__revalidate_after = revalidate_after
+        self.__offline = offline
+        self.__archive_source = archive_source or ZipArchiveSource()
 
     def add_file(self, uri: str, file: IO[bytes]) -> None:
         self.__file_repository.add_file(uri, file)
@@ -37,31 +79,167 @@ class FileService:
     def has_file(self, uri: str) -> bool:
         return self.__file_repository.has_file(uri)
 
+    def mount_archive(self, archive_path: str) -> List[str]:
+        """
+        Mount a zip archive read-only, e.g. a taxonomy package.
+        :param archive_path: The path of the archive on disk.
+        :returns list[str]: The paths of all files in the archive.
+        """
+        self.__archive_source.mount(archive_path)
+        return self.__archive_source.get_file_paths(archive_path)
+
+    def has_archive_file(self, path: str) -> bool:
+        return self.__archive_source.has_file(path)
+
+    def get_archive_file(self, path: str) -> IO[bytes]:
+        """
+        :param path: The path of a file inside a zip archive, e.g. 'report.zip/report.xsd'.
+        :returns IO[bytes]: The content of the file, streamed from the archive.
+        """
+        return self.__archive_source.get_file(path)
+
+    def normalize_archive_path(self, path: str) -> str:
+        return self.__archive_source.normalize_path(path)
+
+    def get_local_file(self, path: str) -> IO[bytes]:
+        """
+        Open a local file without adding it to the repository.
+        :param path: The path of a file on disk or inside a zip archive.
+        :returns IO[bytes]: The content of the file.
+        """
+        if self.has_archive_file(path):
+            return self.get_archive_file(path)
+        return open(path, "rb")
+
+    def is_offline(self) -> bool:
+        return self.__offline
+
+    def needs_revalidation(self, uri: str) -> bool:
+        """
+        :param uri: The URI of a cached remote file.
+        :returns bool: True if the cached file is older than `revalidate_after` and the service is online.
+        """
+        if self.__offline or self.__revalidate_after is None:
+            return False
+
+        metadata = self.__file_repository.get_metadata(uri)
+        if metadata is None or "checked_at" not in metadata:
+            return True
+
+        return time.time() - float(metadata["checked_at"]) > self.__revalidate_after
+
     def download_and_add_file(self, uri: str) -> IO[bytes]:
-        headers = {}
+        """
+        Download a remote file into the repository.
+        If the file is cached already, the download is a conditional request and the cached file is kept if it did not change.
+        If the download fails, an error is added to the error repository and the cached file, if any, is returned.
+        :param uri: The URI of the remote file.
+        :returns IO[bytes]: The content of the file.
+        """
+        if self.__offline:
+            if not self.has_file(uri):
+                self.__error_repository.insert(
+                    ErrorCode.UNAVAILABLE_REMOTE_FILE,
+                    uri=uri,
+                    status_code="none, as brel is in offline mode",
+                )
+            return self.get_file(uri)
+
+        headers: Dict[str, str] = {}
 
         if "www.sec.gov" in uri:
             headers = {
                 "User-Agent": "Robin Schmidiger rschmidiger64@gmail.com",
-                "Accept-Encoding": "gzip",
                 "Host": "www.sec.gov",
             }
-            time.sleep(0.1)
-
-        response = self.__session.get(uri, headers=headers, timeout=10)
-        try:
-            response.raise_for_status()
-            file = BytesIO(response.content)
-            self.add_file(uri, file)
-        except:
+
+        metadata = self.__file_repository.get_metadata(uri) or {}
+        if self.has_file(uri):
+            if "etag" in metadata:
+                headers["If-None-Match"] = metadata["etag"]
+            if "last_modified" in metadata:
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        response = self.__get_with_retries(uri, headers)
+
+        if response is not None and response.status_code == 304:
+            metadata["checked_at"] = str(time.time())
+            self.__file_repository.set_metadata(uri, metadata)
+        elif response is not None and response.ok:
+            # requests decompresses gzip and deflate encoded responses transparently
+            self.add_file(uri, BytesIO(response.content))
+            self.__file_repository.set_metadata(uri, self.__get_validators(response))
+        else:
             self.__error_repository.insert(
                 ErrorCode.UNAVAILABLE_REMOTE_FILE,
                 uri=uri,
-                status_code=str(response.status_code),
+                status_code="none" if response is None else str(response.status_code),
             )
 
         return self.get_file(uri)
 
+    def __get_with_retries(
+        self, uri: str, headers: Dict[str, str]
+    ) -> Optional[Response]:
+        """
+        :returns: The last response. None if no response was received, e.g. because the host is unreachable.
+        """
+        response: Optional[Response] = None
+        for attempt in range(self.__max_retries + 1):
+            self.__rate_limiter.acquire(uri)
+            try:
+                response = self.__session.get(
+                    uri, headers=headers, timeout=self.__timeout
+                )
+            except RequestException:
+                response = None
+
+            is_last_attempt = attempt == self.__max_retries
+            if is_last_attempt or (
+                response is not None and response.status_code not in RETRY_STATUS_CODES
+            ):
+                break
+
+            backoff = self.__get_backoff(attempt, response)
+            if backoff is None:
+                break
+            time.sleep(backoff)
+
+        return response
+
+    def __get_backoff(
+        self, attempt: int, response: Optional[Response]
+    ) -> Optional[float]:
+        """
+        :returns: The wait before the next retry in seconds. None if the server asks for a wait longer than `max_backoff`.
+        """
+        backoff = min(self.__backoff_factor * 2**attempt, self.__max_backoff)
+        retry_after = None if response is None else response.headers.get("Retry-After")
+        if retry_after is None:
+            return backoff
+
+        if retry_after.isdigit():
+            requested_backoff = float(retry_after)
+        else:
+            try:
+                requested_backoff = max(
+                    parsedate_to_datetime(retry_after).timestamp() - time.time(), 0
+                )
+            except (TypeError, ValueError):
+                return backoff
+
+        if requested_backoff > self.__max_backoff:
+            return None
+        return requested_backoff
+
+    def __get_validators(self, response: Response) -> Dict[str, str]:
+        validators = {"checked_at": str(time.time())}
+        if "ETag" in response.headers:
+            validators["etag"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["last_modified"] = response.headers["Last-Modified"]
+        return validators
+
     def copy_and_add_file(self, local_path: str) -> IO[bytes]:
         with open(local_path, "rb") as file:
             self.add_file(local_path, file)
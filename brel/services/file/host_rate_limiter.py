@@ -0,0 +1,54 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """
+    Limits the rate of requests per host with a token bucket.
+    Every host has a bucket of `burst` tokens that refills by one token per interval.
+    Each request takes a token and waits until the token is available.
+    Requests to hosts without a configured interval are never delayed.
+    The limiter is thread-safe, so it can be shared by concurrent downloads.
+    """
+
+    def __init__(self, min_intervals: Dict[str, float], burst: int = 1) -> None:
+        """
+        :param min_intervals: Number of seconds it takes to refill one token, keyed by host name.
+        :param burst: The number of requests that may be sent at once after a pause. With 1, requests are evenly spaced by the interval.
+        """
+        self.__min_intervals = dict(min_intervals)
+        self.__burst = max(burst, 1)
+        # the tokens of a host and the time they were counted. the tokens become negative when requests are waiting.
+        self.__buckets: Dict[str, Tuple[float, float]] = {}
+        self.__lock = threading.Lock()
+
+    def acquire(self, uri: str) -> None:
+        """
+        Blocks until a request to the host of the given uri may be sent.
+        :param uri: The URI that is about to be requested.
+        """
+        host = urlparse(uri).hostname or ""
+        interval = self.__min_intervals.get(host, 0.0)
+        if interval <= 0.0:
+            return
+
+        with self.__lock:
+            now = time.monotonic()
+            tokens, counted_at = self.__buckets.get(host, (self.__burst, now))
+            tokens = min(self.__burst, tokens + (now - counted_at) / interval) - 1
+            self.__buckets[host] = (tokens, now)
+
+        if tokens < 0:
+            time.sleep(-tokens * interval)
@@ -0,0 +1,116 @@
+"""
+This module reads files from zip archives without extracting them.
+
+A file inside an archive is addressed by the path of the archive followed by the name of the file in the archive,
+e.g. `filings/report.zip/report/report.xsd`. Relative references between files in the same archive resolve like on disk.
+Archives are opened on first use and stay open, so every member is streamed directly from the archive.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import os
+import posixpath
+import re
+import threading
+import zipfile
+from typing import IO, Dict, List, Optional, Tuple
+
+ARCHIVE_SEGMENT_PATTERN = re.compile(r"\.zip(?=/)", re.IGNORECASE)
+
+
+class ZipArchiveSource:
+    def __init__(self) -> None:
+        self.__archives: Dict[str, zipfile.ZipFile] = {}
+        self.__lock = threading.Lock()
+
+    def mount(self, archive_path: str) -> None:
+        """
+        Open an archive, so its files can be read.
+        Archives are mounted read-only. Archives that are referenced by a path are mounted automatically.
+        :param archive_path: The path of the zip archive on disk.
+        :raises FileNotFoundError: If the archive does not exist.
+        """
+        self.__get_archive(self.__normalize(archive_path))
+
+    def get_file_paths(self, archive_path: str) -> List[str]:
+        """
+        :param archive_path: The path of the zip archive on disk.
+        :returns: The paths of all files in the archive, prefixed with the path of the archive.
+        """
+        archive_path = self.__normalize(archive_path)
+        archive = self.__get_archive(archive_path)
+        return [
+            f"{archive_path}/{name}"
+            for name in archive.namelist()
+            if not name.endswith("/")
+        ]
+
+    def has_file(self, path: str) -> bool:
+        """
+        :param path: A path that may point into an archive.
+        :returns bool: True if the path points to a file in an archive, False otherwise.
+        """
+        return self.__find(path) is not None
+
+    def get_file(self, path: str) -> IO[bytes]:
+        """
+        :param path: The path of a file in an archive.
+        :returns IO[bytes]: A stream of the decompressed content of the file.
+        :raises FileNotFoundError: If the path does not point to a file in an archive.
+        """
+        found = self.__find(path)
+        if found is None:
+            raise FileNotFoundError(f"{path} is not a file in a zip archive")
+
+        archive, name = found
+        return archive.open(name, "r")
+
+    def normalize_path(self, path: str) -> str:
+        """
+        Collapse the '.' and '..' segments of a path into an archive, so every file in an archive has one path.
+        Other paths are returned unchanged.
+        :param path: The path to normalize.
+        :returns str: The normalized path.
+        """
+        if self.__find(path) is None:
+            return path
+        return posixpath.normpath(self.__normalize(path))
+
+    def __find(self, path: str) -> Optional[Tuple[zipfile.ZipFile, str]]:
+        """
+        Split a path into the archive and the name of the file in the archive.
+        Archives can be nested in folders with a '.zip' suffix, so every '.zip/' segment is tried from left to right.
+        """
+        if path.startswith(("http://", "https://")):
+            return None
+
+        path = self.__normalize(path)
+        for match in ARCHIVE_SEGMENT_PATTERN.finditer(path):
+            archive_path = path[: match.end()]
+            if archive_path not in self.__archives and not os.path.isfile(archive_path):
+                continue
+
+            name = posixpath.normpath(path[match.end() + 1 :])
+            archive = self.__get_archive(archive_path)
+            try:
+                archive.getinfo(name)
+            except KeyError:
+                return None
+            return archive, name
+
+        return None
+
+    def __get_archive(self, archive_path: str) -> zipfile.ZipFile:
+        with self.__lock:
+            if archive_path not in self.__archives:
+                self.__archives[archive_path] = zipfile.ZipFile(archive_path, "r")
+            return self.__archives[archive_path]
+
+    def __normalize(self, path: str) -> str:
+        return path.replace("\\", "/")
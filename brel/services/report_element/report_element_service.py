@@ -27,58 +27,20 @@ class ReportElementService:
     def get_fuzzy_typed[
         T: IReportElement
     ](self, search_params: QNameSearchParams, report_element_type: type[T],) -> list[T]:
-        uri_candidates: set[str] = set()
-        if search_params.uri:
-            uri_candidates.add(search_params.uri)
-
-        prefix_candidates: set[str] = set()
-        if search_params.prefix:
-            prefix_candidates.add(search_params.prefix)
-
-        if search_params.uri and not search_params.prefix:
-            prefix_candidates = set(
-                self.__namespace_repository.get_prefixes(search_params.uri)
-            )
-        elif not search_params.uri and search_params.prefix:
-            uri_candidates = set(
-                self.__namespace_repository.get_uris(search_params.prefix)
-            )
-
-        if uri_candidates or prefix_candidates:
-            qname_candidates = (
-                QName(
-                    uri,
-                    prefix,
-                    search_params.local_name,
-                )
-                for uri in uri_candidates
-                for prefix in prefix_candidates
-            )
-
-            matching_qnames = filter(
-                lambda qname: self.__report_element_repository.has_typed_qname(
-                    qname, report_element_type
-                ),
-                qname_candidates,
-            )
-
-            return [
-                self.__report_element_repository.get_typed_by_qname(
-                    qname, report_element_type
-                )
-                for qname in matching_qnames
-            ]
-        else:
-            return list(
-                filter(
-                    lambda qname: qname.get_name().local_name
-                    == search_params.local_name,
-                    self.__report_element_repository.get_all_typed(report_element_type),
-                )
-            )
+        return [
+            report_element
+            for report_element in self.get_fuzzy(search_params)
+            if isinstance(report_element, report_element_type)
+        ]
 
     def get_fuzzy(self, search_params: QNameSearchParams) -> list[IReportElement]:
-        # TODO schmidi replace with call to find_typed and make typechecker happy somehow
+        """
+        Find the report elements that match a local name and optionally a namespace uri and/or a prefix.
+        If only the uri or only the prefix is given, the other one is looked up in the namespace repository.
+        The candidates are taken from the local name index of the repository, so the lookup does not scan all report elements.
+        :param search_params: The local name and the optional uri and prefix to search for.
+        :returns list[IReportElement]: The matching report elements.
+        """
         uri_candidates: set[str] = set()
         if search_params.uri:
             uri_candidates.add(search_params.uri)
@@ -96,29 +58,16 @@ class ReportElementService:
                 self.__namespace_repository.get_uris(search_params.prefix)
             )
 
-        if uri_candidates or prefix_candidates:
-            return list(
-                map(
-                    self.__report_element_repository.get_by_qname,
-                    filter(
-                        lambda qname: self.__report_element_repository.has_qname(qname),
-                        [
-                            QName(
-                                uri,
-                                prefix,
-                                search_params.local_name,
-                            )
-                            for uri in uri_candidates
-                            for prefix in prefix_candidates
-                        ],
-                    ),
-                )
-            )
-        else:
-            return list(
-                filter(
-                    lambda qname: qname.get_name().local_name
-                    == search_params.local_name,
-                    self.__report_element_repository.get_all(),
-                )
-            )
+        report_elements = self.__report_element_repository.get_by_local_name(
+            search_params.local_name
+        )
+
+        if not search_params.uri and not search_params.prefix:
+            return report_elements
+
+        return [
+            report_element
+            for report_element in report_elements
+            if report_element.get_name().uri in uri_candidates
+            and report_element.get_name().prefix in prefix_candidates
+        ]
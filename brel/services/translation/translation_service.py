@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import os
 from typing import Dict, List, Optional
 
@@ -8,16 +8,32 @@ from brel.qnames.qname import QName
 import csv
 
 from brel.resource.brel_label import BrelLabel
+from brel.resource.label_index import LabelIndex, LanguageKey, get_language_key
+
+TRANSLATION_CACHE_SIZE = 65536
 
 
 class TranslationService:
     def __init__(self):
         self.__translations: Dict[QName, Dict[str, str]] = defaultdict(dict)
+        # the translations of every qname by the full and by the locale-insensitive language key
+        # the first translation in load order wins, like in a linear scan over the translations
+        self.__translations_by_language: Dict[QName, Dict[str, str]] = {}
+        self.__translations_by_base_language: Dict[QName, Dict[str, str]] = {}
         self.__match_locale = True
+        self.__resolved: OrderedDict[tuple, str] = OrderedDict()
 
     def set_match_locale(self, match_locale: bool):
+        if match_locale != self.__match_locale:
+            self.clear_cache()
         self.__match_locale = match_locale
 
+    def clear_cache(self) -> None:
+        """
+        Forget all resolved translations and labels.
+        """
+        self.__resolved = OrderedDict()
+
     def load_from_csv(self, path: Optional[str] = None, override: bool = True) -> None:
         if override:
             self.__translations = defaultdict(dict)
@@ -43,15 +59,16 @@ class TranslationService:
                 qname = QName(namespace, "", localname)
                 self.__translations[qname][(language + "-" + locale)] = translation
 
+        self.__index_translations()
+
     def languages_match(self, requested_language: str, available_language: str):
-        requested_language = requested_language.lower()
-        available_language = available_language.lower()
+        requested_key = get_language_key(requested_language)
+        available_key = get_language_key(available_language)
 
         if not self.__match_locale:
-            requested_language = requested_language.split("-")[0]
-            available_language = available_language.split("-")[0]
+            return requested_key[1] == available_key[1]
 
-        return requested_language == available_language
+        return requested_key[0] == available_key[0]
 
     def get_single(self, qname: QName, language: str) -> str:
         """
@@ -63,17 +80,15 @@ class TranslationService:
         if language == "":
             return qname.local_name
 
-        language = language.lower()
-        if qname not in self.__translations:
+        if qname not in self.__translations_by_language:
             return qname.local_name
 
-        for translation_language, translation in self.__translations[qname].items():
-            if self.languages_match(language, translation_language):
-                return translation
-
-        raise KeyError(
-            f"No suitable translation for {qname.clark_notation()} found for language {language}"
-        )
+        translation = self.__find_translation(qname, get_language_key(language))
+        if translation is None:
+            raise KeyError(
+                f"No suitable translation for {qname.clark_notation()} found for language {language.lower()}"
+            )
+        return translation
 
     def get(
         self,
@@ -90,15 +105,22 @@ class TranslationService:
         if isinstance(languages, str):
             languages = [languages]
 
+        cache_key = ("translation", qname, tuple(languages), base)
+        translation = self.__get_resolved(cache_key)
+        if translation is not None:
+            return translation
+
         if isinstance(qname, str):
             split_qname = qname.split(":")
             qname = QName(base + split_qname[0], "", split_qname[1])
 
         for language in languages:
             try:
-                return self.get_single(qname, language)
-            except:
+                translation = self.get_single(qname, language)
+            except KeyError:
                 continue
+            self.__set_resolved(cache_key, translation)
+            return translation
 
         raise KeyError(
             f"No suitable translation for {qname.clark_notation()} found for languages {languages}"
@@ -106,41 +128,103 @@ class TranslationService:
 
     def get_from_labels(
         self,
-        labels: List[BrelLabel],
+        labels: LabelIndex | List[BrelLabel],
         languages: str | List[str],
         default_label: str | BrelLabel = "NO_LABEL",
     ) -> str:
         """
         Select the first label with the given language.
+        Pass the label index of a report element or an aspect, so its labels are not indexed again and the label is cached.
+        :param labels: the labels to select from
         :param languages: the languages of the label to select
         :returns BrelLabel: the first label with the given language
         """
         if isinstance(languages, str):
             languages = [languages]
 
+        # labels are only ever added to their owner, so its name and its label count identify its labels
+        cache_key: Optional[tuple] = None
+        if isinstance(labels, LabelIndex):
+            cache_key = (
+                "labels",
+                labels.get_owner_name(),
+                len(labels),
+                tuple(languages),
+                str(default_label),
+            )
+            resolved_label = self.__get_resolved(cache_key)
+            if resolved_label is not None:
+                return resolved_label
+        else:
+            labels = LabelIndex(None, labels)
+
         if isinstance(default_label, str):
             default_label = BrelLabel(default_label, "", "")
 
         for language in languages:
-            label = self.get_label_with_language(labels, language, default_label)
+            if language == "":
+                label: Optional[BrelLabel] = default_label
+            else:
+                label = labels.get(get_language_key(language), self.__match_locale)
+
             if label is not None:
-                return label.__str__()
+                resolved_label = label.__str__()
+                if cache_key is not None:
+                    self.__set_resolved(cache_key, resolved_label)
+                return resolved_label
 
         raise ValueError(f"No label found for languages: {languages}")
 
     def get_label_with_language(
-        self, labels: List[BrelLabel], language: str, default_label: BrelLabel
+        self,
+        labels: LabelIndex | List[BrelLabel],
+        language: str,
+        default_label: BrelLabel,
     ) -> Optional[BrelLabel]:
         """
         Get the label with the given language.
+        :param labels: the labels to select from. A label index is looked up without indexing the labels again.
         :param language: the language of the label to get
         :returns BrelLabel: the label with the given language
         """
         if language == "":
             return default_label
 
-        for label in labels:
-            if self.languages_match(language, label.get_language()):
-                return label
-
-        return None
+        if not isinstance(labels, LabelIndex):
+            labels = LabelIndex(None, labels)
+        return labels.get(get_language_key(language), self.__match_locale)
+
+    def __index_translations(self) -> None:
+        self.__translations_by_language = {}
+        self.__translations_by_base_language = {}
+
+        for qname, translations in self.__translations.items():
+            by_language: Dict[str, str] = {}
+            by_base_language: Dict[str, str] = {}
+            for language, translation in translations.items():
+                language_key = get_language_key(language)
+                by_language.setdefault(language_key[0], translation)
+                by_base_language.setdefault(language_key[1], translation)
+
+            self.__translations_by_language[qname] = by_language
+            self.__translations_by_base_language[qname] = by_base_language
+
+        self.clear_cache()
+
+    def __find_translation(
+        self, qname: QName, language_key: LanguageKey
+    ) -> Optional[str]:
+        if self.__match_locale:
+            return self.__translations_by_language[qname].get(language_key[0])
+        return self.__translations_by_base_language[qname].get(language_key[1])
+
+    def __get_resolved(self, cache_key: tuple) -> Optional[str]:
+        resolved = self.__resolved.get(cache_key)
+        if resolved is not None:
+            self.__resolved.move_to_end(cache_key)
+        return resolved
+
+    def __set_resolved(self, cache_key: tuple, resolved: str) -> None:
+        self.__resolved[cache_key] = resolved
+        if len(self.__resolved) > TRANSLATION_CACHE_SIZE:
+            self.__resolved.popitem(last=False)
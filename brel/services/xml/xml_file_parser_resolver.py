@@ -8,17 +8,25 @@
 ====================
 """
 
-from typing import IO, Callable, Dict
+from typing import IO, Callable, Dict, List, Tuple
 from lxml.etree import _ElementTree  # type: ignore
 
 
+type XMLFileParser = Callable[[IO[bytes]], Tuple[_ElementTree, List[Tuple[str, str]]]]
+
+
 class XMLFileParserResolver:
+    """
+    Resolves the parser of a file by its extension.
+    A parser returns the parsed tree and the (prefix, uri) namespace declarations of the document.
+    """
+
     def __init__(
         self,
-        xml_parser: Callable[[IO[bytes]], _ElementTree],
-        xhtml_parser: Callable[[IO[bytes]], _ElementTree],
+        xml_parser: XMLFileParser,
+        xhtml_parser: XMLFileParser,
     ):
-        self.__parsers: Dict[str, Callable[[IO[bytes]], _ElementTree]] = {
+        self.__parsers: Dict[str, XMLFileParser] = {
             ".xml": xml_parser,
             ".xsd": xml_parser,
             ".xhtml": xhtml_parser,
@@ -26,7 +34,7 @@ class XMLFileParserResolver:
             ".html": xhtml_parser,
         }
 
-    def get_parser(self, file_name: str) -> Callable[[IO[bytes]], _ElementTree]:
+    def get_parser(self, file_name: str) -> XMLFileParser:
         for ext, parser in self.__parsers.items():
             if file_name.endswith(ext):
                 return parser
@@ -8,10 +8,12 @@
 ====================
 """
 
-import re
-from typing import List, Optional, Set
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import List, Optional, Set, Tuple
 import urllib.parse
-from lxml.etree import _ElementTree  # type: ignore
+from lxml.etree import XPath, _Element, _ElementTree  # type: ignore
 import urllib
 
 from brel.data.uri_rewrite.uri_rewrite_repository import URIRewriteRepository
@@ -20,6 +22,24 @@ from brel.parsers.utils.lxml_utils import get_str_attribute
 from brel.services.file.file_service import FileService
 from brel.services.xml.xml_file_parser_resolver import XMLFileParserResolver
 
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+# the elements that are followed during DTS discovery, as listed in section 3.2 of the XBRL 2.1 spec.
+# all conditions are checked in a single traversal of the tree.
+DTS_REFERENCE_ELEMENTS_XPATH = XPath(
+    """//*[
+        self::link:schemaRef or self::link:linkbaseRef
+        or self::link:roleRef or self::link:arcroleRef
+        or @xlink:type='locator'
+        or self::xs:import or self::xs:include
+    ]""",
+    namespaces={
+        "link": "http://www.xbrl.org/2003/linkbase",
+        "xlink": "http://www.w3.org/1999/xlink",
+        "xs": "http://www.w3.org/2001/XMLSchema",
+    },
+)
+
 
 class XMLService:
     def __init__(
@@ -28,11 +48,13 @@ class XMLService:
         xml_repository: XMLRepository,
         uri_rewrite_repository: URIRewriteRepository,
         parser_resolver: XMLFileParserResolver,
+        max_workers: int = 8,
     ) -> None:
         self.__file_service = file_service
         self.__uri_rewrite_repository = uri_rewrite_repository
         self.__xml_repository = xml_repository
         self.__parser_resolver = parser_resolver
+        self.__max_workers = max_workers
         self.__available_filing_languages: Optional[List[str]] = None
 
     def add_etree_recursive(self, uri: str, referencing_uri: str = ".") -> None:
@@ -40,10 +62,53 @@ class XMLService:
         Recursively adds an XML file to the repository. the uri can be a local file path or a remote URL.
         If the file is remote, it will be downloaded and added to the repository.
         The method recursively adds all referenced files to the repository.
+        The DTS is discovered breadth-first. All files of one level are fetched and parsed concurrently.
         :param uri: The URI of the XML file to add.
         :param referencing_uri: The URI of the file that references this XML file.
         the referencing_uri is useful if a remote file references local files (e.g. http://example.com/file.xml has a reference to other_file.xml)
         """
+        root_uri = self.__resolve_uri(uri, referencing_uri)
+        if self.__xml_repository.has_etree(root_uri):
+            return
+
+        seen_uris: Set[str] = {self.__xml_repository.normalize_uri(root_uri)}
+        level: List[Tuple[str, str]] = [(root_uri, referencing_uri)]
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while level:
+                level_uris = [level_uri for level_uri, _ in level]
+                referencing_uris = [referencing for _, referencing in level]
+                results = executor.map(self.__load_file, level_uris, referencing_uris)
+
+                next_level: List[Tuple[str, str]] = []
+                # results are consumed in submission order, so the repository is filled deterministically
+                for level_uri, (
+                    etree,
+                    namespaces,
+                    content_hash,
+                    reference_uris,
+                ) in zip(level_uris, results):
+                    self.__xml_repository.add_etree(
+                        level_uri, etree, content_hash, namespaces
+                    )
+
+                    for reference_uri in sorted(reference_uris):
+                        resolved_uri = self.__resolve_uri(reference_uri, level_uri)
+                        normalized_uri = self.__xml_repository.normalize_uri(
+                            resolved_uri
+                        )
+                        if (
+                            normalized_uri in seen_uris
+                            or self.__xml_repository.has_etree(resolved_uri)
+                        ):
+                            continue
+
+                        seen_uris.add(normalized_uri)
+                        next_level.append((resolved_uri, level_uri))
+
+                level = next_level
+
+    def __resolve_uri(self, uri: str, referencing_uri: str) -> str:
         is_uri_remote = uri.startswith("http") or referencing_uri.startswith("http")
         if not is_uri_remote:
             referencing_splitting_char = "\\" if "\\" in referencing_uri else "/"
@@ -57,50 +122,69 @@ class XMLService:
             uri = urllib.parse.urljoin(referencing_uri, uri)
 
         uri = self.__uri_rewrite_repository.rewrite(uri)
-        is_uri_remote = uri.startswith("http") or referencing_uri.startswith("http")
-
-        if self.__xml_repository.has_etree(uri):
-            return
+        return self.__file_service.normalize_archive_path(uri)
 
+    def __load_file(
+        self, uri: str, referencing_uri: str
+    ) -> Tuple[_ElementTree, List[Tuple[str, str]], str, Set[str]]:
+        """
+        Fetches a single file into the file repository, parses it, hashes its content and extracts its references.
+        The namespace declarations are collected while parsing. The references are taken from the parsed tree,
+        so every file is read and parsed exactly once.
+        This method runs on the worker threads. It does not touch the XML repository.
+        The file service it calls is shared by the workers, so its file and error repositories have to be thread-safe.
+        """
+        is_uri_remote = uri.startswith("http") or referencing_uri.startswith("http")
         parser = self.__parser_resolver.get_parser(uri)
 
-        if self.__file_service.has_file(uri):
-            with self.__file_service.get_file(uri) as file:
-                self.__xml_repository.add_etree(uri, parser(file))
+        if self.__file_service.has_archive_file(uri):
+            # checked first, as the catalog of a mounted taxonomy package rewrites remote uris into the package
+            file = self.__file_service.get_archive_file(uri)
+        elif self.__file_service.has_file(uri) and not (
+            is_uri_remote and self.__file_service.needs_revalidation(uri)
+        ):
+            file = self.__file_service.get_file(uri)
         elif is_uri_remote:
-            with self.__file_service.download_and_add_file(uri) as file:
-                self.__xml_repository.add_etree(uri, parser(file))
+            file = self.__file_service.download_and_add_file(uri)
         else:
             local_filepath = urllib.parse.urlparse(uri).path
-            with self.__file_service.copy_and_add_file(local_filepath) as file:
-                self.__xml_repository.add_etree(uri, parser(file))
-
-        with self.__file_service.get_file(uri) as file:
-            for reference_uri in self.__extract_references(file.read()):
-                self.add_etree_recursive(reference_uri, referencing_uri=uri)
-
-    def __extract_references(self, content: bytes) -> set[str]:
-        reference_uris: set[str] = set()
-        reference_pattern = re.compile(
-            r":href=['\"]([^'\"]+)['\"]|schemaLocation=['\"]([^'\"]+)['\"]"
+            file = self.__file_service.copy_and_add_file(local_filepath)
+
+        with file:
+            content = file.read()
+
+        etree, namespaces = parser(BytesIO(content))
+        # the trees are parsed from memory, so the uri is set explicitly. errors refer to their document by it.
+        etree.docinfo.URL = uri
+        return (
+            etree,
+            namespaces,
+            hashlib.sha256(content).hexdigest(),
+            self.__extract_references(etree),
         )
 
-        for match in reference_pattern.finditer(content.decode("utf-8")):
-            href = match.group(1)
-            if href:
-                if "#" in href:
-                    href_uri, _ = href.split("#")
-                else:
-                    href_uri = href
+    def __extract_references(self, etree: _ElementTree) -> set[str]:
+        """
+        Extracts the URIs of the documents that are discovered from a parsed document.
+        These are the hrefs of schemaRef, linkbaseRef, roleRef, arcroleRef and locator elements
+        and the schemaLocations of xs:import and xs:include elements.
+        Other hrefs, such as hyperlinks in the body of an inline XBRL document, are not followed.
+        :param etree: The parsed document.
+        :returns: The referenced URIs without fragments.
+        """
+        reference_uris: set[str] = set()
 
-                if href_uri:
-                    reference_uris.add(href_uri)
+        reference_elements: List[_Element] = DTS_REFERENCE_ELEMENTS_XPATH(etree)
+        for reference_element in reference_elements:
+            reference = reference_element.get(XLINK_HREF)
+            if reference is None:
+                reference = reference_element.get("schemaLocation")
+            if reference is None:
+                continue
 
-            schema_location = match.group(2)
-            if schema_location:
-                # get only last part, as there can be 2 links, only the second of which is relevant in our case.
-                schema_location = schema_location.split()[-1]
-                reference_uris.add(schema_location)
+            reference_uri = reference.strip().split("#")[0]
+            if reference_uri:
+                reference_uris.add(reference_uri)
 
         return reference_uris
 
@@ -110,6 +194,22 @@ class XMLService:
     def get_all_etrees(self) -> list[_ElementTree]:
         return self.__xml_repository.get_all_etrees()
 
+    def get_all_uris(self) -> list[str]:
+        return self.__xml_repository.get_all_uris()
+
+    def get_all_namespaces(self) -> List[Tuple[str, str]]:
+        """
+        :returns: The distinct (prefix, uri) namespace declarations of all loaded documents.
+        """
+        return self.__xml_repository.get_all_namespaces()
+
+    def get_content_hash(self, uri: str) -> Optional[str]:
+        """
+        :param uri: The URI of a file in the repository.
+        :returns str|None: The SHA-256 hash of the raw content of the file. None if the file was not loaded from raw content.
+        """
+        return self.__xml_repository.get_content_hash(uri)
+
     def get_available_filing_languages(self) -> List[str]:
         if self.__available_filing_languages is None:
             all_languages: Set[str] = set()
@@ -4,3 +4,4 @@ from brel.utils.print_component import pprint_component
 from brel.utils.edgar import open_edgar
 
 from brel.utils.pprint import pprint
+from brel.utils.spark_loader import load_facts_spark_df
@@ -0,0 +1,161 @@
+"""
+This module loads the facts of many filings into a single Spark DataFrame.
+
+The filings are not opened on the driver.
+Instead, the paths are distributed over the Spark executors and each executor opens its share of the filings.
+The executors emit one row per fact, so the facts never have to pass through the driver.
+All filings share the schema `FACT_ROW_SCHEMA`. Dimensions are stored in a map from the dimension name to the member.
+
+Example usage:
+
+```
+from brel.utils import load_facts_spark_df
+
+df = load_facts_spark_df(["filings/aapl-20230930.zip", "filings/msft-20230630.zip"])
+df.groupBy("filing").count().show()
+```
+
+Brel has to be installed on all executors.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pyspark import sql
+from pyspark.sql.types import (
+    DoubleType,
+    MapType,
+    StringType,
+    StructField,
+    StructType,
+)
+
+from brel import Fact, Filing
+from brel.characteristics import (
+    ExplicitDimensionCharacteristic,
+    TypedDimensionCharacteristic,
+)
+
+type FactRow = Tuple[
+    str,
+    Optional[str],
+    str,
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    str,
+    Optional[float],
+    dict[str, str],
+]
+
+FACT_ROW_SCHEMA = StructType(
+    [
+        StructField("filing", StringType(), nullable=False),
+        StructField("id", StringType(), nullable=True),
+        StructField("concept", StringType(), nullable=False),
+        StructField("period", StringType(), nullable=True),
+        StructField("entity", StringType(), nullable=True),
+        StructField("unit", StringType(), nullable=True),
+        StructField("value", StringType(), nullable=False),
+        StructField("numeric_value", DoubleType(), nullable=True),
+        StructField(
+            "dimensions",
+            MapType(StringType(), StringType(), valueContainsNull=False),
+            nullable=False,
+        ),
+    ]
+)
+
+
+def fact_to_row(filing_path: str, fact: Fact) -> FactRow:
+    """
+    Convert a fact to a row of `FACT_ROW_SCHEMA`.
+    :param filing_path: The path of the filing that contains the fact.
+    :param fact: The fact to convert.
+    :returns FactRow: The fact as a tuple in the order of the schema.
+    """
+    concept = fact.get_concept()
+    period = fact.get_period()
+    entity = fact.get_entity()
+    unit = fact.get_unit()
+
+    numeric_value: Optional[float] = None
+    if concept.is_numeric():
+        try:
+            numeric_value = float(fact)
+        except ValueError:
+            # nil facts have an empty value
+            numeric_value = None
+
+    dimensions: dict[str, str] = {}
+    for aspect in fact.get_aspects():
+        if aspect.is_core():
+            continue
+
+        characteristic = fact.get_characteristic(aspect)
+        if isinstance(characteristic, ExplicitDimensionCharacteristic):
+            dimensions[str(characteristic.get_dimension().get_name())] = str(
+                characteristic.get_member().get_name()
+            )
+        elif isinstance(characteristic, TypedDimensionCharacteristic):
+            dimensions[str(characteristic.get_dimension().get_name())] = str(
+                characteristic.get_value()
+            )
+
+    return (
+        filing_path,
+        fact.get_id(),
+        str(concept.get_name()),
+        None if period is None else str(period),
+        None if entity is None else entity.get_value(),
+        None if unit is None else unit.get_value(),
+        str(fact),
+        numeric_value,
+        dimensions,
+    )
+
+
+def iter_fact_rows(filing_paths: Iterable[str]) -> Iterator[FactRow]:
+    """
+    Open the filings one after the other and yield the rows of their facts.
+    This function is passed to `mapPartitions`, so it runs on the executors.
+    Only one filing is kept in memory at a time.
+    :param filing_paths: The paths of the filings. Any path supported by `Filing.open` works.
+    :returns Iterator[FactRow]: The rows of all facts of the filings.
+    """
+    for filing_path in filing_paths:
+        filing = Filing.open(filing_path)
+        for fact in filing.get_all_facts():
+            yield fact_to_row(filing_path, fact)
+
+
+def load_facts_spark_df(
+    filing_paths: List[str],
+    spark: Optional[sql.SparkSession] = None,
+    num_partitions: Optional[int] = None,
+) -> sql.DataFrame:
+    """
+    Load the facts of many filings into a single Spark DataFrame.
+    The filings are parsed in parallel on the Spark executors.
+    :param filing_paths: The paths of the filings. The paths have to be readable from the executors.
+    :param spark: The Spark session. If None, the active session is used or a new one is created.
+    :param num_partitions: The number of partitions the paths are split into. Defaults to one partition per filing.
+    :returns pyspark.sql.DataFrame: The facts of all filings with the schema `FACT_ROW_SCHEMA`.
+    """
+    if spark is None:
+        spark = sql.SparkSession.builder.getOrCreate()
+
+    if num_partitions is None:
+        num_partitions = max(len(filing_paths), 1)
+
+    rows = spark.sparkContext.parallelize(filing_paths, num_partitions).mapPartitions(
+        iter_fact_rows
+    )
+    return spark.createDataFrame(rows, schema=FACT_ROW_SCHEMA)
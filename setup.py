@@ -85,6 +85,7 @@ setup(
         "pluggy>=1.4.0",
         "prettytable>=3.9.0",
         "py4j>=0.10.9.7",
+        "pyarrow>=15.0.0",
         "pydoc-markdown>=4.8.2",
         "Pygments>=2.17.2",
         "pyspark>=3.5.1",
@@ -166,6 +167,7 @@ setup(
             "pluggy==1.4.0",
             "prettytable==3.9.0",
             "py4j==0.10.9.7",
+            "pyarrow==15.0.0",
             "pydoc-markdown==4.8.2",
             "Pygments==2.17.2",
             "pyspark==3.5.1",
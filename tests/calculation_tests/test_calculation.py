@@ -259,6 +259,94 @@ def test_calculation_validation_NG_aggregation():
     ), "The children of Assets do not add up to 100. The network should not be aggregation consistent"
 
 
+def test_calculation_validation_decimals():
+    # Current Assets
+    #   Cash and Cash Equivalents at Carrying Value
+    #   Inventory, Net
+
+    # Current Assets: 80000 (decimals = -3)
+    # Cash and Cash Equivalents at Carrying Value: 10400 (decimals = -2)
+    # Inventory, Net: 69700 (decimals = -2)
+
+    # rounded to thousands, the children add up to 10000 + 70000 = 80000
+
+    nodes = [
+        create_node(concepts[1], 1, 1),
+        create_node(concepts[2], 1, 1),
+        create_node(concepts[3], 1, 2),
+    ]
+
+    nodes[0]._add_child(nodes[1])
+    nodes[0]._add_child(nodes[2])
+
+    network = CalculationNetwork([nodes[0]], link_role, link_name, False)
+
+    def fact_with_decimals(concept: Concept, value: str, decimals: float):
+        context = Context("unspecified")
+        context._add_characteristic(ConceptCharacteristic(concept))
+        return Fact(context, value, "unspecified", decimals)
+
+    facts = [
+        fact_with_decimals(concepts[1], "80000", -3),
+        fact_with_decimals(concepts[2], "10400", -2),
+        fact_with_decimals(concepts[3], "69700", -2),
+    ]
+
+    assert network.is_aggregation_consistent(
+        facts
+    ), "Rounded to thousands, the children of Current Assets add up to 80000"
+
+    facts[0] = fact_with_decimals(concepts[1], "90000", -3)
+    inconsistencies = network.get_aggregation_inconsistencies(facts)
+    assert (
+        len(inconsistencies) == 1
+    ), f"Expected one inconsistency, got {len(inconsistencies)}"
+    assert inconsistencies[0].get_reported_value() == 90000
+    assert inconsistencies[0].get_computed_value() == 80000
+    assert inconsistencies[0].get_decimals() == -3
+
+
+def test_calculation_validation_all_inconsistencies():
+    # Assets: 100, but the children add up to 90
+    #   Current Assets: 80, but the children add up to 70
+    #     Cash and Cash Equivalents at Carrying Value: 10
+    #     Inventory, Net: 60
+    #   Noncurrent Assets: 10
+
+    nodes = [
+        create_node(concepts[0], 1, 1),
+        create_node(concepts[1], 1, 1),
+        create_node(concepts[2], 1, 1),
+        create_node(concepts[3], 1, 2),
+        create_node(concepts[7], 1, 2),
+    ]
+
+    nodes[0]._add_child(nodes[1])
+    nodes[1]._add_child(nodes[2])
+    nodes[1]._add_child(nodes[3])
+    nodes[0]._add_child(nodes[4])
+
+    facts = [
+        fact_from_concept(concepts[0], "100"),
+        fact_from_concept(concepts[1], "80"),
+        fact_from_concept(concepts[2], "10"),
+        fact_from_concept(concepts[3], "60"),
+        fact_from_concept(concepts[7], "10"),
+    ]
+
+    network = CalculationNetwork([nodes[0]], link_role, link_name, False)
+    inconsistencies = network.get_aggregation_inconsistencies(facts)
+
+    reported = [
+        inconsistency.get_parent_fact().get_concept()
+        for inconsistency in inconsistencies
+    ]
+    assert reported == [
+        concepts[0],
+        concepts[1],
+    ], f"Expected Assets and Current Assets to be inconsistent, got {reported}"
+
+
 if __name__ == "__main__":
     test_calculation_validation_GD()
     # test_calculation_validation_NG_aggregation()
@@ -0,0 +1,73 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import os
+import time
+from io import BytesIO
+
+from brel.data.file.blob_file_repository import BlobFileRepository
+from brel.data.file.pyfs_file_repository import PyFsFileRepository
+
+
+def test_blob_file_repository_roundtrip(tmp_path):
+    for compress in (True, False):
+        repository = BlobFileRepository(
+            str(tmp_path / str(compress)), compress=compress
+        )
+        uri = "https://example.com/taxonomy.xsd"
+        content = "<schema>café</schema>".encode("latin-1")
+
+        assert not repository.has_file(uri), "Expected the file to be missing"
+        repository.add_file(uri, BytesIO(content))
+        assert repository.has_file(uri), "Expected the file to be cached"
+
+        with repository.get_file(uri) as file:
+            assert file.read() == content, "Expected the raw bytes to be returned"
+
+        repository.add_file("https://mirror.example.com/taxonomy.xsd", BytesIO(content))
+        blob_count = sum(
+            len(file_names)
+            for _, _, file_names in os.walk(tmp_path / str(compress) / "blobs")
+        )
+        assert blob_count == 1, "Expected identical content to be stored once"
+
+
+def test_blob_file_repository_eviction(tmp_path):
+    repository = BlobFileRepository(str(tmp_path), max_size=2500, compress=False)
+
+    for i in range(3):
+        repository.add_file(f"file{i}.xml", BytesIO(bytes([i]) * 1000))
+        # make sure the access times differ
+        time.sleep(0.01)
+        with repository.get_file("file0.xml"):
+            pass
+
+    assert repository.get_size() <= 2500, "Expected the cache to be trimmed"
+    assert repository.has_file("file0.xml"), "Expected the recently used file to stay"
+    assert not repository.has_file(
+        "file1.xml"
+    ), "Expected the least recently used file to be evicted"
+    assert repository.has_file("file2.xml"), "Expected the newest file to stay"
+
+
+def test_blob_file_repository_legacy_import(tmp_path):
+    legacy_repository = PyFsFileRepository(str(tmp_path / "legacy"), clear_cache=False)
+    uri = "https://example.com/taxonomy.xsd"
+    legacy_repository.add_file(uri, BytesIO(b"<schema/>"))
+
+    repository = BlobFileRepository(
+        str(tmp_path / "cache"), legacy_repository=legacy_repository
+    )
+    assert repository.has_file(uri), "Expected legacy files to be found"
+    with repository.get_file(uri) as file:
+        assert file.read() == b"<schema/>", "Expected the legacy content"
+
+    reopened_repository = BlobFileRepository(str(tmp_path / "cache"))
+    assert reopened_repository.has_file(uri), "Expected the legacy file to be imported"
@@ -0,0 +1,318 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from brel import QName
+from brel.brel_filing import Filing
+from brel.data.factory import create_report_element_repository
+from brel.data.compiled_taxonomy.pickle_compiled_taxonomy_repository import (
+    PickleCompiledTaxonomyRepository,
+)
+from brel.networks import LabelNetwork, LabelNetworkNode
+from brel.parsers.utils.compiled_link_utils import (
+    compile_link,
+    create_networks_from_compiled_link,
+)
+
+from brel.reportelements import Concept, Member
+from brel.resource import BrelLabel
+
+REMOTE_SCHEMA = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:link="http://www.xbrl.org/2003/linkbase"
+    xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:xbrli="http://www.xbrl.org/2003/instance"
+    xmlns:remote="http://remote/2024" targetNamespace="http://remote/2024" elementFormDefault="qualified">
+    <xs:annotation>
+        <xs:appinfo>
+            <link:linkbaseRef xlink:href="remote_lab.xml" xlink:type="simple" xlink:arcrole="http://www.w3.org/1999/xlink/properties/linkbase"/>
+        </xs:appinfo>
+    </xs:annotation>
+    <xs:element id="remote_Revenue" name="Revenue" type="xbrli:monetaryItemType" substitutionGroup="xbrli:item" xbrli:periodType="duration"/>
+</xs:schema>"""
+
+REMOTE_LABEL_LINKBASE = """<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+    <link:labelLink xlink:type="extended" xlink:role="http://www.xbrl.org/2003/role/link">
+        <link:loc xlink:type="locator" xlink:href="remote.xsd#remote_Revenue" xlink:label="revenue_loc"/>
+        <link:label xlink:type="resource" xlink:label="revenue_lab" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="en">Revenue</link:label>
+        <link:label xlink:type="resource" xlink:label="revenue_lab" xlink:role="http://www.xbrl.org/2003/role/terseLabel" xml:lang="de">Umsatz</link:label>
+        <link:labelArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/concept-label" xlink:from="revenue_loc" xlink:to="revenue_lab"/>
+    </link:labelLink>
+</link:linkbase>"""
+
+INSTANCE = """<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase"
+    xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:iso4217="http://www.xbrl.org/2003/iso4217" xmlns:remote="http://remote/2024">
+    <link:schemaRef xlink:type="simple" xlink:href="{server_uri}/remote.xsd"/>
+    <xbrli:context id="c1">
+        <xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">1</xbrli:identifier></xbrli:entity>
+        <xbrli:period><xbrli:startDate>2024-01-01</xbrli:startDate><xbrli:endDate>2024-12-31</xbrli:endDate></xbrli:period>
+    </xbrli:context>
+    <xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+    <remote:Revenue contextRef="c1" unitRef="usd" decimals="0">100</remote:Revenue>
+</xbrli:xbrl>"""
+
+
+class StandInTaxonomyHandler(BaseHTTPRequestHandler):
+    """
+    Serves a published taxonomy that consists of a schema and its label linkbase.
+    """
+
+    documents = {
+        "/remote.xsd": REMOTE_SCHEMA,
+        "/remote_lab.xml": REMOTE_LABEL_LINKBASE,
+    }
+
+    def do_GET(self) -> None:
+        if self.path not in self.documents:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        content = self.documents[self.path].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_uri():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInTaxonomyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_compiled_taxonomy_roundtrip(tmp_path):
+    repository = PickleCompiledTaxonomyRepository(str(tmp_path))
+    uri = "https://example.com/taxonomy.xsd"
+
+    assert (
+        repository.get_report_elements(uri, "abc") is None
+    ), "Expected no report elements before adding them"
+
+    concept = Concept(
+        QName("https://example.com", "ex", "Revenue"),
+        "ex_Revenue",
+        [],
+        "duration",
+        "credit",
+        True,
+        "xbrli:monetaryItemType",
+    )
+    member = Member(QName("https://example.com", "ex", "FooMember"), None, [])
+    repository.add_report_elements(uri, "abc", [concept, member])
+
+    report_elements = repository.get_report_elements(uri, "abc")
+    assert report_elements is not None, "Expected the report elements to be stored"
+    assert [re.get_name() for re in report_elements] == [
+        concept.get_name(),
+        member.get_name(),
+    ], f"Expected the same report elements, got {report_elements}"
+    assert (
+        isinstance(report_elements[0], Concept) and report_elements[0].is_numeric()
+    ), "Expected the concept to keep its data type"
+
+    assert (
+        repository.get_report_elements(uri, "def") is None
+    ), "Expected a different content hash to miss"
+
+
+def test_compiled_taxonomy_filing_open(tmp_path, monkeypatch):
+    monkeypatch.setenv("BREL_COMPILED_TAXONOMY_CACHE", str(tmp_path))
+    filing_path = "tests/end_to_end_tests/hand_made_report/ete_filing"
+
+    # the first open fills the cache for the remote schemas, the second one reads from it
+    first_names = {
+        re.get_name() for re in Filing.open(filing_path).get_all_report_elements()
+    }
+    entries = {
+        entry.name: entry.stat().st_ino
+        for entry in os.scandir(tmp_path)
+        if entry.name.endswith(".pickle.zz")
+    }
+    assert len(entries) > 0, "Expected the remote schemas to be cached"
+
+    second_filing = Filing.open(filing_path)
+    second_names = {re.get_name() for re in second_filing.get_all_report_elements()}
+
+    # entries are replaced whenever a schema is parsed and stored again, so unchanged entries were read from the cache
+    assert entries == {
+        entry.name: entry.stat().st_ino
+        for entry in os.scandir(tmp_path)
+        if entry.name.endswith(".pickle.zz")
+    }, "Expected the second open to read the remote schemas from the cache"
+    assert (
+        first_names == second_names
+    ), f"Expected the same report elements, got {first_names ^ second_names}"
+
+    balance = second_filing.get_concept("ete:balance")
+    assert balance is not None and len(
+        balance.get_labels()
+    ), "Expected the labels of the filing to be attached"
+
+
+def test_compiled_taxonomy_refuses_world_writable_location(tmp_path):
+    cache_path = tmp_path / "cache"
+    cache_path.mkdir()
+    os.chmod(cache_path, 0o777)
+
+    if os.name == "posix":
+        with pytest.raises(PermissionError):
+            PickleCompiledTaxonomyRepository(str(cache_path))
+
+
+def test_compiled_taxonomy_ignores_unreadable_entries(tmp_path):
+    uri = "https://example.com/taxonomy.xsd"
+    PickleCompiledTaxonomyRepository(str(tmp_path / "written")).add_report_elements(
+        uri, "abc", []
+    )
+
+    # the entries written by this process are kept in memory, so the unreadable entries are placed in another location
+    unreadable_path = tmp_path / "unreadable"
+    unreadable_path.mkdir(mode=0o700)
+    for entry in os.scandir(tmp_path / "written"):
+        (unreadable_path / entry.name).write_bytes(b"not a compiled taxonomy")
+
+    repository = PickleCompiledTaxonomyRepository(str(unreadable_path))
+    assert (
+        repository.get_report_elements(uri, "abc") is None
+    ), "Expected an unreadable entry to be treated as missing"
+
+
+def test_compiled_taxonomy_keeps_entries_in_memory(tmp_path):
+    uri = "https://example.com/taxonomy.xsd"
+    member = Member(QName("https://example.com", "ex", "FooMember"), None, [])
+    PickleCompiledTaxonomyRepository(str(tmp_path)).add_report_elements(
+        uri, "abc", [member]
+    )
+
+    for entry in os.scandir(tmp_path):
+        os.remove(entry.path)
+
+    repository = PickleCompiledTaxonomyRepository(str(tmp_path))
+    first_report_elements = repository.get_report_elements(uri, "abc")
+    second_report_elements = repository.get_report_elements(uri, "abc")
+    assert (
+        first_report_elements is not None and second_report_elements is not None
+    ), "Expected the entry to be read from memory"
+    assert (
+        first_report_elements[0].get_name() == member.get_name()
+    ), "Expected the same report element"
+    assert (
+        first_report_elements[0] is not second_report_elements[0]
+    ), "Expected every read to create its own report elements"
+
+
+def test_compiled_link_roundtrip(tmp_path):
+    repository = PickleCompiledTaxonomyRepository(str(tmp_path))
+    uri = "https://example.com/taxonomy_lab.xml"
+    link_role = "http://www.xbrl.org/2003/role/link"
+    link_name = QName("http://www.xbrl.org/2003/linkbase", "link", "labelLink")
+    arc_name = QName("http://www.xbrl.org/2003/linkbase", "link", "labelArc")
+    arc_role = "http://www.xbrl.org/2003/arcrole/concept-label"
+
+    concept = Concept(
+        QName("https://example.com", "ex", "Revenue"),
+        "ex_Revenue",
+        [],
+        "duration",
+        "credit",
+        True,
+        "xbrli:monetaryItemType",
+    )
+    label = BrelLabel("Revenue", "ex_Revenue_label", "en")
+    root = LabelNetworkNode(concept, arc_role, arc_name, link_role, link_name)
+    root._add_children(
+        [LabelNetworkNode(label, arc_role, arc_name, link_role, link_name)]
+    )
+    network = LabelNetwork([root], link_role, link_name, True)
+
+    compiled_link = compile_link(link_role, link_name, [network])
+    assert compiled_link is not None, "Expected the label link to be compiled"
+    repository.add_links(uri, "abc", "labelLink", [compiled_link])
+
+    compiled_links = repository.get_links(uri, "abc", "labelLink")
+    assert compiled_links is not None, "Expected the compiled links to be stored"
+    assert (
+        repository.get_links(uri, "abc", "referenceLink") is None
+    ), "Expected the reference links to miss"
+
+    report_element_repository = create_report_element_repository()
+    assert (
+        create_networks_from_compiled_link(
+            "labelLink", compiled_links[0], report_element_repository
+        )
+        is None
+    ), "Expected a link to a missing report element to miss"
+
+    report_element_repository.upsert(concept)
+    networks = create_networks_from_compiled_link(
+        "labelLink", compiled_links[0], report_element_repository
+    )
+    assert networks is not None and len(networks) == 1, "Expected one network"
+    created_root = networks[0].get_roots()[0]
+    assert (
+        created_root.get_report_element() is concept
+    ), "Expected the root to point to the report element of the repository"
+    assert [str(child.get_resource()) for child in created_root.get_children()] == [
+        "Revenue"
+    ], "Expected the label to be a child of the root"
+
+
+def test_compiled_label_linkbase_filing_open(tmp_path, monkeypatch, server_uri):
+    # the downloaded taxonomy and the compiled taxonomy are cached apart from the other tests
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    cache_path = tmp_path / "compiled_taxonomy_cache"
+    monkeypatch.setenv("BREL_COMPILED_TAXONOMY_CACHE", str(cache_path))
+
+    instance_path = tmp_path / "instance.xml"
+    instance_path.write_text(INSTANCE.format(server_uri=server_uri), encoding="utf-8")
+
+    def get_revenue_labels() -> list[tuple[str, str, str]]:
+        filing = Filing.open(str(instance_path))
+        revenue = filing.get_concept_by_name(
+            QName("http://remote/2024", "remote", "Revenue")
+        )
+        return sorted(
+            (str(label.get_label_role()), label.get_language(), str(label))
+            for label in revenue.get_labels()
+        )
+
+    first_labels = get_revenue_labels()
+    label_entries = {
+        entry.name: entry.stat().st_ino
+        for entry in os.scandir(cache_path)
+        if "-labelLink-" in entry.name
+    }
+    assert len(label_entries) == 1, "Expected the label linkbase to be cached"
+
+    second_labels = get_revenue_labels()
+
+    # entries are replaced whenever a linkbase is parsed and stored again, so an unchanged entry was read from the cache
+    assert label_entries == {
+        entry.name: entry.stat().st_ino
+        for entry in os.scandir(cache_path)
+        if "-labelLink-" in entry.name
+    }, "Expected the second open to create the label networks from the cache"
+    assert (
+        first_labels == second_labels
+    ), f"Expected the same labels, got {second_labels}"
+    assert [language for _, language, _ in second_labels] == [
+        "en",
+        "de",
+    ], f"Expected both labels of the linkbase, got {second_labels}"
@@ -9,8 +9,11 @@
 """
 
 
+from brel import Context, QName
 from brel.brel_filing import Filing
+from brel.characteristics import ConceptCharacteristic, PeriodCharacteristic
 from brel.characteristics.brel_aspect import Aspect
+from brel.reportelements import Concept
 
 
 def test_context_getters():
@@ -70,3 +73,63 @@ def test_context_getters():
     assert context.__eq__(context), "Expected True, got False"
 
     assert "ete:cash" in str(context), f"Expected 'ete:cash', got {str(context)}"
+
+
+def test_context_layering():
+    base = Context("c-001")
+    period = PeriodCharacteristic._instant("2024-05-03")
+    base._add_characteristic(period)
+
+    concept = Concept(
+        QName("", "ete", "cash"),
+        None,
+        [],
+        "instant",
+        "debit",
+        False,
+        "monetaryItemType",
+    )
+    concept_characteristic = ConceptCharacteristic(concept)
+    context = Context("c-001", base)
+    context._add_characteristic(concept_characteristic)
+
+    assert context.get_aspects() == [
+        Aspect.CONCEPT,
+        Aspect.PERIOD,
+    ], f"Expected [concept, period], got {context.get_aspects()}"
+    assert context.get_period() is period, "Expected the period of the base context"
+    assert context.get_concept() is concept_characteristic, "Expected the concept"
+
+    assert base.get_aspects() == [
+        Aspect.PERIOD
+    ], f"Expected the base context to be unchanged, got {base.get_aspects()}"
+    assert not base.has_characteristic(
+        Aspect.CONCEPT
+    ), "Expected the base context to have no concept"
+
+    # characteristics of the base context cannot be overridden
+    context._add_characteristic(PeriodCharacteristic._instant("2020-01-01"))
+    assert context.get_period() is period, "Expected the period of the base context"
+
+
+def test_context_equality():
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+
+    cash_context = filing.get_facts_by_concept_name("ete:cash")[0].get_context()
+    balance_context = filing.get_facts_by_concept_name("ete:balance")[0].get_context()
+    assert (
+        cash_context != balance_context
+    ), "Expected contexts with different concepts to differ"
+
+    # the same characteristics in a context with a different id
+    copy = Context("other-id")
+    for aspect in cash_context.get_aspects():
+        characteristic = cash_context.get_characteristic(aspect)
+        assert characteristic is not None, f"Expected a characteristic for {aspect}"
+        copy._add_characteristic(characteristic)
+
+    assert copy == cash_context, "Expected contexts with equal characteristics"
+    assert hash(copy) == hash(cash_context), "Expected equal hashes"
+
+    grouped = {cash_context: "cash"}
+    assert grouped[copy] == "cash", "Expected contexts to be usable as dict keys"
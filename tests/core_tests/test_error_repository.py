@@ -0,0 +1,100 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lxml import etree
+
+from brel.data.errors.compact_error_repository import CompactErrorRepository
+from brel.errors.area import Area
+from brel.errors.error_code import ErrorCode
+from brel.errors.severity import Severity
+
+
+def test_compact_error_repository_deduplicates():
+    repository = CompactErrorRepository()
+    root = etree.fromstring("<root>\n<context/>\n<context/>\n</root>")
+    first_context, second_context = root
+
+    for _ in range(3):
+        repository.insert(ErrorCode.MISSING_CONTEXT_PERIOD, first_context)
+    repository.insert(ErrorCode.MISSING_CONTEXT_PERIOD, second_context)
+    repository.insert(ErrorCode.INVALID_CONTEXT_PERIOD_DATE, date="2023-13-01")
+
+    errors = repository.get_all()
+    assert len(errors) == 3, f"Expected 3 distinct errors, got {len(errors)}"
+    assert repository.get_total_count() == 5, "Expected all 5 errors to be counted"
+    assert [error.get_count() for error in errors] == [
+        3,
+        1,
+        1,
+    ], "Expected identical errors to be aggregated"
+    assert errors[0].get_source_line() == 2, "Expected the source line to be recorded"
+    assert errors[0].get_context() is None, "Expected the element not to be kept"
+    assert (
+        "2023-13-01" in errors[2].get_message()
+    ), "Expected the message to be formatted when read"
+
+    assert (
+        len(repository.get_by_severity(Severity.ERROR)) == 3
+    ), "Expected all errors to be indexed by severity"
+    assert (
+        len(repository.get_by_area(Area.GENERAL_INSTANCE)) == 3
+    ), "Expected all errors to be indexed by area"
+    assert repository.get_by_severity(Severity.WARNING) == [], "Expected no warnings"
+
+    with pytest.raises(ValueError):
+        repository.insert(ErrorCode.INVALID_CONTEXT_PERIOD_DATE)
+
+
+def test_compact_error_repository_cap():
+    repository = CompactErrorRepository(max_per_code=2)
+
+    for day in range(10, 15):
+        repository.insert(ErrorCode.INVALID_CONTEXT_PERIOD_DATE, date=f"2023-13-{day}")
+
+    assert len(repository.get_all()) == 2, "Expected the errors to be capped"
+    assert repository.get_suppressed_counts() == {
+        ErrorCode.INVALID_CONTEXT_PERIOD_DATE: 3
+    }, "Expected the suppressed errors to be counted"
+    assert repository.get_total_count() == 5, "Expected suppressed errors in the total"
+
+    repository.clear()
+    assert repository.get_all() == [], "Expected no errors after clearing"
+
+
+def test_compact_error_repository_concurrent_inserts():
+    repository = CompactErrorRepository()
+
+    def insert_errors(_: int) -> None:
+        for day in range(2000):
+            repository.insert(
+                ErrorCode.INVALID_CONTEXT_PERIOD_DATE, date=f"2023-13-{day}"
+            )
+
+    # switch threads as often as possible, so the inserts interleave
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(insert_errors, range(8)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    errors = repository.get_all()
+    assert (
+        len(errors) == 2000
+    ), f"Expected every error to be stored once, got {len(errors)}"
+    assert all(
+        error.get_count() == 8 for error in errors
+    ), "Expected the count of every error to belong to its record"
+    assert repository.get_total_count() == 16000, "Expected every insert to be counted"
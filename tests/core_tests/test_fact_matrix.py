@@ -0,0 +1,47 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import numpy as np
+
+from brel.brel_filing import Filing
+
+
+def test_numeric_fact_matrix():
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+    matrix = filing.get_numeric_fact_matrix()
+
+    assert (
+        filing.get_numeric_fact_matrix() is matrix
+    ), "Expected the matrix to be cached"
+
+    facts = matrix.get_facts()
+    # f-013 reports against a string concept, so it is not part of the matrix
+    assert len(matrix) == 12, f"Expected 12 numeric facts, got {len(matrix)}"
+    assert matrix.get_values().dtype == np.float64, "Expected float64 values"
+
+    for row, fact in enumerate(facts):
+        assert matrix.get_values()[row] == float(fact), f"Wrong value in row {row}"
+
+        concept = matrix.get_concepts()[matrix.get_concept_codes()[row]]
+        assert concept == fact.get_concept().get_name(), f"Wrong concept in row {row}"
+
+        period = matrix.get_periods()[matrix.get_period_codes()[row]]
+        assert period == fact.get_period(), f"Wrong period in row {row}"
+
+        unit = matrix.get_units()[matrix.get_unit_codes()[row]]
+        assert unit == "USD", f"Expected USD in row {row}, got {unit}"
+
+    assert len(matrix.get_entities()) == 1, "Expected a single entity"
+    assert len(matrix.get_periods()) == 1, "Expected a single period"
+
+    assert matrix.get_dimensions() == [], "Expected no numeric facts with dimensions"
+    dimension = filing.get_report_element_by_name("ete:additional_explicit_dimension")
+    member_codes = matrix.get_member_codes(dimension.get_name())
+    assert (member_codes == -1).all(), "Expected no members for the dimension"
@@ -0,0 +1,58 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from datetime import date
+
+from brel.brel_filing import Filing
+
+
+def test_fact_query():
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+
+    all_facts = filing.query().to_list()
+    assert all_facts == filing.get_all_facts(), "Expected all facts without filters"
+
+    cash_facts = filing.query().concept("ete:cash").to_list()
+    assert cash_facts == filing.get_facts_by_concept_name(
+        "ete:cash"
+    ), f"Expected the ete:cash facts, got {cash_facts}"
+
+    facts = (
+        filing.query()
+        .concept("ete:concept1")
+        .unit("USD")
+        .entity("{http://www.sec.gov/CIK}1234")
+        .dimension("ete:additional_explicit_dimension", "ete:foo_member")
+        .instant()
+        .to_list()
+    )
+    assert [fact.get_id() for fact in facts] == [
+        "f-013"
+    ], f"Expected [f-013], got {facts}"
+
+    bar_count = (
+        filing.query()
+        .dimension("ete:additional_explicit_dimension", "ete:bar_member")
+        .count()
+    )
+    assert bar_count == 0, f"Expected no facts with ete:bar_member, got {bar_count}"
+
+    core_count = filing.query().core_only().count()
+    assert core_count == 12, f"Expected 12 core facts, got {core_count}"
+
+    duration_count = filing.query().duration().count()
+    assert duration_count == 12, f"Expected 12 duration facts, got {duration_count}"
+
+    in_range = filing.query().period_between(date(2024, 1, 1), date(2024, 12, 31))
+    in_range_ids = [fact.get_id() for fact in in_range]
+    assert in_range_ids == ["f-013"], f"Expected [f-013], got {in_range_ids}"
+
+    first = filing.query().concept("ete:cash").where(lambda fact: fact.get_value() > 0)
+    assert first.first() is cash_facts[0], "Expected the first ete:cash fact"
@@ -0,0 +1,87 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from brel.brel_filing import Filing
+from brel.data.fact.fact_repository import dimension_index_key
+from brel.data.fact.in_memory_fact_repository import InMemoryFactRepository
+
+
+def test_fact_repository_indexes():
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+    facts = filing.get_all_facts()
+
+    repository = InMemoryFactRepository()
+    for fact in facts:
+        repository.upsert(fact)
+
+    for fact in facts:
+        concept = fact.get_concept()
+        expected = [other for other in facts if other.get_concept() == concept]
+        actual = repository.get_by_concept(concept.get_name())
+        assert actual == expected, f"Expected {expected}, got {actual}"
+
+        period = fact.get_period()
+        assert period is not None, "Expected every fact to have a period"
+        expected = [other for other in facts if other.get_period() == period]
+        actual = repository.get_by_period(period)
+        assert actual == expected, f"Expected {expected}, got {actual}"
+
+        entity = fact.get_entity()
+        assert entity is not None, "Expected every fact to have an entity"
+        expected = [other for other in facts if other.get_entity() == entity]
+        actual = repository.get_by_entity(entity)
+        assert actual == expected, f"Expected {expected}, got {actual}"
+
+        unit = fact.get_unit()
+        assert unit is not None, "Expected every fact to have a unit"
+        expected = [other for other in facts if other.get_unit() == unit]
+        actual = repository.get_by_unit(unit)
+        assert actual == expected, f"Expected {expected}, got {actual}"
+
+    core_facts = repository.get_all_core()
+    assert core_facts == [
+        fact for fact in facts if fact.is_core()
+    ], f"Expected only the core facts, got {core_facts}"
+
+    f013 = repository.get_by_id("f-013")
+    dimension = filing.get_report_element_by_name("ete:additional_explicit_dimension")
+    member = filing.get_report_element_by_name("ete:foo_member")
+    other_member = filing.get_report_element_by_name("ete:bar_member")
+
+    dimension_facts = repository.get_by_dimension(dimension.get_name())
+    assert dimension_facts == [f013], f"Expected [f-013], got {dimension_facts}"
+    member_facts = repository.get_by_dimension(dimension.get_name(), member.get_name())
+    assert member_facts == [f013], f"Expected [f-013], got {member_facts}"
+    other_facts = repository.get_by_dimension(
+        dimension.get_name(), other_member.get_name()
+    )
+    assert other_facts == [], f"Expected no facts, got {other_facts}"
+
+    reported_concepts = repository.get_reported_concepts()
+    assert len(reported_concepts) == 13, f"Expected 13, got {len(reported_concepts)}"
+
+    # upserting a fact with an existing id replaces it in all indexes
+    repository.upsert(f013)
+    dimension_facts = repository.get_by_dimension(dimension.get_name())
+    assert dimension_facts == [f013], f"Expected [f-013], got {dimension_facts}"
+
+    # the indexes are handed out without copying them
+    index = repository.get_index(dimension_index_key(dimension.get_name()))
+    assert list(index.items()) == [
+        ("f-013", f013)
+    ], f"Expected the index of the dimension, got {index}"
+    assert repository.get_index(
+        dimension_index_key(dimension.get_name())
+    ) is repository.get_index(
+        dimension_index_key(dimension.get_name())
+    ), "Expected the index not to be copied"
+    assert (
+        len(repository.get_index(dimension_index_key(other_member.get_name()))) == 0
+    ), "Expected an empty index for an unknown key"
@@ -0,0 +1,68 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from io import BytesIO
+
+import lxml.etree
+
+from brel.brel_filing import Filing
+from brel.contexts.factory import create_filing_context
+from brel.parsers.XML.xml_fact_stream import iter_facts_xml
+from brel.parsers.XML.xml_report_element_parser import parse_report_elements_xml
+
+ETE_FOLDER = "tests/end_to_end_tests/hand_made_report/ete_filing"
+ETE_INSTANCE = f"{ETE_FOLDER}/ete_htm.xml"
+
+
+def test_iter_facts():
+    streamed_facts = [
+        fact for fact in Filing.iter_facts(ETE_INSTANCE) if fact.get_id() is not None
+    ]
+    facts = Filing.open(ETE_FOLDER).get_all_facts()
+
+    assert [fact.get_id() for fact in streamed_facts] == [
+        fact.get_id() for fact in facts
+    ], f"Expected the facts {[fact.get_id() for fact in facts]}"
+
+    for streamed_fact, fact in zip(streamed_facts, facts):
+        assert str(streamed_fact) == str(
+            fact
+        ), f"Expected {fact.get_id()} to have the value {fact}, got {streamed_fact}"
+        assert streamed_fact.get_concept().get_name() == fact.get_concept().get_name()
+        assert str(streamed_fact.get_period()) == str(fact.get_period())
+
+
+def test_iter_facts_forward_references():
+    # move all contexts and units behind the facts
+    instance = lxml.etree.parse(ETE_INSTANCE)
+    root = instance.getroot()
+    for element in list(root):
+        if isinstance(element.tag, str) and lxml.etree.QName(element).localname in [
+            "context",
+            "unit",
+        ]:
+            root.remove(element)
+            root.append(element)
+    instance_bytes = lxml.etree.tostring(instance)
+
+    context = create_filing_context([f"{ETE_FOLDER}/ete.xsd"])
+    parse_report_elements_xml(context)
+
+    streamed_ids = [
+        fact.get_id() for fact in iter_facts_xml(context, BytesIO(instance_bytes))
+    ]
+    expected_ids = [fact.get_id() for fact in Filing.iter_facts(ETE_INSTANCE)]
+
+    assert sorted(map(str, streamed_ids)) == sorted(
+        map(str, expected_ids)
+    ), f"Expected all facts to be resolved, got {streamed_ids}"
+    assert (
+        len(context.get_error_repository().get_all()) == 0
+    ), f"Expected no errors, got {context.get_error_repository().get_all()}"
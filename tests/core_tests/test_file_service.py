@@ -0,0 +1,144 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import Session
+
+from brel.data.factory import create_error_repository
+from brel.data.file.blob_file_repository import BlobFileRepository
+from brel.services.file.file_service import FileService
+from brel.services.file.host_rate_limiter import HostRateLimiter
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves /schema.xsd with an ETag and fails the first request to /flaky.xsd with a 503.
+    /busy.xsd always answers with a 429 that asks for a wait of one hour.
+    """
+
+    requests: list[str] = []
+    flaky_failures = 0
+
+    def do_GET(self) -> None:
+        StandInHandler.requests.append(self.path)
+        if self.path == "/schema.xsd":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.__send_content(b"<schema/>", {"ETag": '"v1"'})
+        elif self.path == "/flaky.xsd":
+            if StandInHandler.flaky_failures == 0:
+                StandInHandler.flaky_failures += 1
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+            self.__send_content(b"<flaky/>", {})
+        elif self.path == "/busy.xsd":
+            self.send_response(429)
+            self.send_header("Retry-After", "3600")
+            self.end_headers()
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def __send_content(self, content: bytes, headers: dict[str, str]) -> None:
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_uri():
+    StandInHandler.requests = []
+    StandInHandler.flaky_failures = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def create_file_service(tmp_path, **kwargs) -> FileService:
+    return FileService(
+        BlobFileRepository(str(tmp_path)),
+        create_error_repository(),
+        Session(),
+        HostRateLimiter({}),
+        backoff_factor=0,
+        **kwargs,
+    )
+
+
+def test_file_service_conditional_revalidation(tmp_path, server_uri):
+    file_service = create_file_service(tmp_path, revalidate_after=0)
+    uri = f"{server_uri}/schema.xsd"
+
+    with file_service.download_and_add_file(uri) as file:
+        assert file.read() == b"<schema/>", "Expected the downloaded content"
+    assert file_service.needs_revalidation(uri), "Expected the file to be stale"
+
+    with file_service.download_and_add_file(uri) as file:
+        assert file.read() == b"<schema/>", "Expected the cached content after a 304"
+    assert StandInHandler.requests == [
+        "/schema.xsd",
+        "/schema.xsd",
+    ], "Expected one download and one revalidation"
+
+
+def test_file_service_retries(tmp_path, server_uri):
+    file_service = create_file_service(tmp_path)
+
+    with file_service.download_and_add_file(f"{server_uri}/flaky.xsd") as file:
+        assert file.read() == b"<flaky/>", "Expected the content after the retry"
+    assert StandInHandler.requests == [
+        "/flaky.xsd",
+        "/flaky.xsd",
+    ], "Expected the 503 to be retried once"
+    assert not file_service.needs_revalidation(
+        f"{server_uri}/flaky.xsd"
+    ), "Expected no revalidation without revalidate_after"
+
+
+def test_file_service_gives_up_on_long_retry_after(tmp_path, server_uri):
+    file_service = create_file_service(tmp_path, max_backoff=1)
+
+    with pytest.raises(FileNotFoundError):
+        file_service.download_and_add_file(f"{server_uri}/busy.xsd")
+    assert StandInHandler.requests == [
+        "/busy.xsd"
+    ], "Expected no retry if the server asks for a wait longer than max_backoff"
+
+
+def test_file_service_offline(tmp_path, server_uri):
+    uri = f"{server_uri}/schema.xsd"
+    create_file_service(tmp_path).download_and_add_file(uri).close()
+
+    offline_file_service = create_file_service(tmp_path, offline=True)
+    with offline_file_service.download_and_add_file(uri) as file:
+        assert file.read() == b"<schema/>", "Expected the cached file offline"
+
+    with pytest.raises(FileNotFoundError):
+        offline_file_service.download_and_add_file(f"{server_uri}/other.xsd")
+
+    assert StandInHandler.requests == [
+        "/schema.xsd"
+    ], "Expected no requests in offline mode"
@@ -10,9 +10,14 @@
 
 from typing import List, Type
 
+import pandas as pd
+import pytest
+
 from brel.brel_component import Component
 from brel.brel_fact import Fact
 from brel.brel_filing import Filing
+from brel.contexts.parsing_stage import NETWORK_STAGES, ParsingStage
+from brel.contexts.filing_context import FilingContext
 
 from brel.errors.error_instance import ErrorInstance
 from brel.networks.i_network import INetwork
@@ -175,6 +180,113 @@ def test_filing_open():
         pass
 
 
+def test_filing_fact_table():
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+
+    df = filing.generate_fact_table_pandas_df(allow_mixed=True)
+    facts = filing.get_all_facts()
+    assert len(df) == len(facts), f"Expected {len(facts)} rows, got {len(df)}"
+
+    assert df["Id"].tolist() == [
+        fact.get_id() for fact in facts
+    ], f"Expected the ids of the facts in order, got {df['Id'].tolist()}"
+    assert df["Value"].tolist() == [
+        str(fact) for fact in facts
+    ], f"Expected the values of the facts in order, got {df['Value'].tolist()}"
+
+    for column in ["Concept [Axis]", "Period [Axis]", "Entity [Axis]", "Unit [Axis]"]:
+        assert isinstance(
+            df[column].dtype, pd.CategoricalDtype
+        ), f"Expected column {column} to be categorical, got {df[column].dtype}"
+
+    # all core facts are numeric, so the value column is numeric as well
+    core_df = filing.generate_core_fact_table_pandas_df(allow_mixed=True)
+    assert pd.api.types.is_numeric_dtype(
+        core_df["Value"]
+    ), f"Expected numeric values, got {core_df['Value'].dtype}"
+
+
+def test_filing_open_lazy():
+    path = "tests/end_to_end_tests/hand_made_report/ete_filing"
+    eager_filing = Filing.open(path)
+    lazy_filing = Filing.open(path, lazy=True)
+
+    assert not lazy_filing.is_parsed(
+        ParsingStage.REPORT_ELEMENTS
+    ), "Expected nothing to be parsed before the first access"
+
+    facts = lazy_filing.get_all_facts()
+    assert len(facts) == len(
+        eager_filing.get_all_facts()
+    ), f"Expected {len(eager_filing.get_all_facts())} facts, got {len(facts)}"
+    assert lazy_filing.is_parsed(
+        ParsingStage.REPORT_ELEMENTS
+    ), "Expected the facts to require the report elements"
+    for stage in NETWORK_STAGES:
+        assert not lazy_filing.is_parsed(
+            stage
+        ), f"Expected the facts not to require {stage}"
+
+    components = lazy_filing.get_all_components()
+    assert {component.get_URI() for component in components} == {
+        component.get_URI() for component in eager_filing.get_all_components()
+    }, "Expected the same components as the eagerly parsed filing"
+    assert not lazy_filing.is_parsed(
+        ParsingStage.REFERENCE_NETWORKS
+    ), "Expected the components not to require the reference networks"
+
+    assert len(lazy_filing.get_all_errors()) == len(
+        eager_filing.get_all_errors()
+    ), "Expected the same errors as the eagerly parsed filing"
+    assert all(
+        lazy_filing.is_parsed(stage) for stage in ParsingStage
+    ), "Expected the errors to require all stages"
+
+
+def test_failed_stage_is_not_run_again():
+    context = FilingContext()
+    calls: List[str] = []
+
+    def load_report_elements():
+        calls.append("report elements")
+        # the loader can require its own stage without running it again
+        context.require_stages(ParsingStage.REPORT_ELEMENTS)
+        raise ValueError("broken schema")
+
+    def load_facts():
+        calls.append("facts")
+
+    context.register_stage(ParsingStage.REPORT_ELEMENTS, load_report_elements, [])
+    context.register_stage(
+        ParsingStage.FACTS, load_facts, [ParsingStage.REPORT_ELEMENTS]
+    )
+
+    with pytest.raises(ValueError):
+        context.require_stages(ParsingStage.REPORT_ELEMENTS)
+    assert not context.is_stage_completed(
+        ParsingStage.REPORT_ELEMENTS
+    ), "Expected a failed stage not to be completed"
+    assert context.is_stage_failed(
+        ParsingStage.REPORT_ELEMENTS
+    ), "Expected the stage to be marked as failed"
+
+    # a rerun would add the partial results of the failed run a second time
+    with pytest.raises(RuntimeError) as error_info:
+        context.require_stages(ParsingStage.REPORT_ELEMENTS)
+    assert isinstance(
+        error_info.value.__cause__, ValueError
+    ), "Expected the error of the failed run as the cause"
+    with pytest.raises(RuntimeError):
+        context.require_stages(ParsingStage.FACTS)
+
+    assert calls == [
+        "report elements"
+    ], f"Expected the loaders not to run again, got {calls}"
+    assert not context.is_stage_failed(
+        ParsingStage.FACTS
+    ), "Expected the dependent stage not to be run"
+
+
 if __name__ == "__main__":
     test_filing_getters()
     test_filing_open()
@@ -0,0 +1,48 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from brel.brel_filing import Filing
+
+ETE_FOLDER = "tests/end_to_end_tests/hand_made_report/ete_filing"
+
+
+def count_facts(filing: Filing) -> int:
+    return len(filing.get_all_facts())
+
+
+def test_open_many():
+    paths = [ETE_FOLDER, "tests/does_not_exist", ETE_FOLDER]
+    results = Filing.open_many(paths, count_facts, workers=2, warmup_path=ETE_FOLDER)
+
+    assert [
+        result.get_path() for result in results
+    ] == paths, "Expected ordered results"
+    assert (
+        results[0].is_ok() and results[0].get_result() == 13
+    ), f"Expected 13 facts, got {results[0].get_error() or results[0].get_result()}"
+    assert results[2].is_ok() and results[2].get_result() == 13, "Expected 13 facts"
+    assert not results[1].is_ok(), "Expected the missing filing to fail"
+    assert isinstance(
+        results[1].get_error(), ValueError
+    ), f"Expected a ValueError, got {results[1].get_error()}"
+
+
+def test_iter_open_many_unordered():
+    paths = [ETE_FOLDER] * 3
+    results = list(
+        Filing.iter_open_many(
+            paths, count_facts, workers=2, ordered=False, max_pending=1
+        )
+    )
+
+    assert len(results) == 3, f"Expected 3 results, got {len(results)}"
+    assert all(
+        result.get_result() == 13 for result in results
+    ), "Expected 13 facts per filing"
@@ -0,0 +1,62 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import pytest
+
+from brel import QName
+from brel.brel_filing import Filing
+from brel.networks import PresentationNetworkNode
+from brel.reportelements import Abstract
+
+PARENT_CHILD_ARCROLE = "http://www.xbrl.org/2003/arcrole/parent-child"
+PRESENTATION_ARC = QName("http://www.xbrl.org/2003/linkbase", "link", "presentationArc")
+PRESENTATION_LINK = QName(
+    "http://www.xbrl.org/2003/linkbase", "link", "presentationLink"
+)
+
+
+def __create_presentation_node(order: float) -> PresentationNetworkNode:
+    abstract = Abstract(QName("http://foo", "foo", f"Abstract{order}"), None, [])
+    return PresentationNetworkNode(
+        abstract,
+        [],
+        PARENT_CHILD_ARCROLE,
+        PRESENTATION_ARC,
+        "http://foo/role/balance",
+        PRESENTATION_LINK,
+        None,
+        order,
+    )
+
+
+def test_add_children_sorts_once():
+    parent = __create_presentation_node(1)
+    parent._add_child(__create_presentation_node(2))
+    parent._add_children([__create_presentation_node(3), __create_presentation_node(0)])
+
+    orders = [child.get_order() for child in parent.get_children()]
+    assert orders == [0, 2, 3], f"Expected the children to be ordered, got {orders}"
+
+    with pytest.raises(TypeError):
+        parent._add_children([object()])  # type: ignore
+
+
+def test_parsed_network_children_are_ordered():
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+
+    for network in filing.get_all_physical_networks():
+        nodes = list(network.get_roots())
+        while nodes:
+            node = nodes.pop()
+            orders = [child.get_order() for child in node.get_children()]
+            assert orders == sorted(
+                orders
+            ), f"Expected the children of {node} to be ordered, got {orders}"
+            nodes.extend(node.get_children())
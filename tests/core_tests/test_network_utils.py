@@ -0,0 +1,93 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from brel import QName
+from brel.networks import PresentationNetwork, PresentationNetworkNode
+from brel.parsers.utils.network_utils import combine_networks
+from brel.reportelements import Abstract
+
+LINK_ROLE = "http://foo/role/balance"
+PRESENTATION_LINK = QName(
+    "http://www.xbrl.org/2003/linkbase", "link", "presentationLink"
+)
+PRESENTATION_ARC = QName("http://www.xbrl.org/2003/linkbase", "link", "presentationArc")
+
+
+def __create_node(
+    abstract: Abstract, children: list[PresentationNetworkNode], order: float = 1
+) -> PresentationNetworkNode:
+    return PresentationNetworkNode(
+        abstract,
+        children,
+        "http://www.xbrl.org/2003/arcrole/parent-child",
+        PRESENTATION_ARC,
+        LINK_ROLE,
+        PRESENTATION_LINK,
+        None,
+        order,
+    )
+
+
+def __create_network(roots: list[PresentationNetworkNode]) -> PresentationNetwork:
+    return PresentationNetwork(roots, LINK_ROLE, PRESENTATION_LINK, False)
+
+
+def test_combine_networks_orders_prerequisites():
+    abstracts = {
+        name: Abstract(QName("http://foo", "foo", name), None, [])
+        for name in ["Root", "Assets", "Cash", "Other"]
+    }
+
+    # the network with the assets as root has to be merged below the assets node of the root network
+    assets_network = __create_network(
+        [__create_node(abstracts["Assets"], [__create_node(abstracts["Cash"], [])])]
+    )
+    root_network = __create_network(
+        [__create_node(abstracts["Root"], [__create_node(abstracts["Assets"], [])])]
+    )
+    other_network = __create_network([__create_node(abstracts["Other"], [])])
+
+    combined = combine_networks([assets_network, other_network, root_network])
+
+    roots = {
+        root.get_report_element().get_name().local_name: root
+        for root in combined.get_roots()
+    }
+    assert sorted(roots.keys()) == [
+        "Other",
+        "Root",
+    ], f"Expected the assets network to be merged into the root network, got roots {list(roots.keys())}"
+
+    assets_node = roots["Root"].get_children()[0]
+    cash_names = [
+        child.get_report_element().get_name().local_name
+        for child in assets_node.get_children()
+    ]
+    assert cash_names == ["Cash"], f"Expected cash below assets, got {cash_names}"
+
+
+def test_combine_networks_merges_many_links():
+    root = Abstract(QName("http://foo", "foo", "Root"), None, [])
+    members = [
+        Abstract(QName("http://foo", "foo", f"Member{index}"), None, [])
+        for index in range(200)
+    ]
+
+    networks = [
+        __create_network([__create_node(root, [__create_node(member, [], index)])])
+        for index, member in enumerate(members)
+    ]
+    combined = combine_networks(networks)
+
+    assert len(combined.get_roots()) == 1, "Expected all links to share one root"
+    orders = [child.get_order() for child in combined.get_roots()[0].get_children()]
+    assert orders == list(
+        range(200)
+    ), "Expected the children of all links to be merged in order"
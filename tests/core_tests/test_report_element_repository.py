@@ -0,0 +1,103 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+from brel import QName
+from brel.data.namespace.in_memory_namespace_repository import (
+    InMemoryNamespaceRepository,
+)
+from brel.data.report_element.in_memory_report_element_repository import (
+    InMemoryReportElementRepository,
+)
+from brel.qnames.qname_search_params import QNameSearchParams
+from brel.reportelements import Concept, Member
+from brel.services.report_element.report_element_service import (
+    ReportElementService,
+)
+
+
+def create_concept(uri: str, prefix: str, local_name: str) -> Concept:
+    return Concept(
+        QName(uri, prefix, local_name),
+        f"{prefix}_{local_name}",
+        [],
+        "duration",
+        "credit",
+        True,
+        "xbrli:monetaryItemType",
+    )
+
+
+def test_report_element_repository_indexes():
+    repository = InMemoryReportElementRepository()
+    revenue = create_concept("https://example.com", "ex", "Revenue")
+    other_revenue = create_concept("https://other.com", "other", "Revenue")
+    revenues = create_concept("https://example.com", "ex", "Revenues")
+    member = Member(QName("https://example.com", "ex", "RevenueMember"), None, [])
+    for report_element in [revenue, other_revenue, revenues, member]:
+        repository.upsert(report_element)
+
+    assert repository.get_by_local_name("Revenue") == [
+        revenue,
+        other_revenue,
+    ], "Expected both elements named Revenue"
+    assert repository.get_by_prefix("other") == [
+        other_revenue
+    ], "Expected the element with the prefix other"
+    assert (
+        len(repository.get_by_uri("https://example.com")) == 3
+    ), "Expected three elements in the example namespace"
+    assert repository.get_all_typed(Member) == [member], "Expected the member bucket"
+    assert repository.get_by_local_name("Unknown") == [], "Expected no elements"
+
+    assert [
+        re.get_name().local_name for re in repository.get_by_local_name_start("Revenue")
+    ] == [
+        "Revenue",
+        "Revenue",
+        "RevenueMember",
+        "Revenues",
+    ], "Expected the elements whose local name starts with Revenue, sorted"
+
+    # replacing an element with a different type moves it to the other bucket
+    replacement = Member(QName("https://example.com", "ex", "Revenues"), None, [])
+    repository.upsert(replacement)
+    assert repository.get_all_typed(Member) == [
+        member,
+        replacement,
+    ], "Expected the replacement in the member bucket"
+    assert repository.get_all_typed(Concept) == [
+        revenue,
+        other_revenue,
+    ], "Expected the replaced concept to be removed"
+
+
+def test_report_element_service_get_fuzzy():
+    namespace_repository = InMemoryNamespaceRepository()
+    namespace_repository.upsert("ex", "https://example.com")
+    repository = InMemoryReportElementRepository()
+    revenue = create_concept("https://example.com", "ex", "Revenue")
+    other_revenue = create_concept("https://other.com", "other", "Revenue")
+    repository.upsert(revenue)
+    repository.upsert(other_revenue)
+    service = ReportElementService(namespace_repository, repository)
+
+    assert service.get_fuzzy(QNameSearchParams("Revenue", prefix="ex")) == [
+        revenue
+    ], "Expected the element with the prefix ex"
+    assert service.get_fuzzy(
+        QNameSearchParams("Revenue", uri="https://example.com")
+    ) == [revenue], "Expected the element in the example namespace"
+    assert service.get_fuzzy(QNameSearchParams("Revenue")) == [
+        revenue,
+        other_revenue,
+    ], "Expected all elements named Revenue"
+    assert (
+        service.get_fuzzy_typed(QNameSearchParams("Revenue"), Member) == []
+    ), "Expected no members named Revenue"
@@ -0,0 +1,137 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import pytest
+
+from brel import QName
+from brel.reportelements import Member
+from brel.resource.brel_label import BrelLabel
+from brel.services.translation.translation_service import TranslationService
+
+TRANSLATIONS_CSV = """namespace,localname,language,locale,value
+http://www.brel.com/translations/literal,value,en,US,Value
+http://www.brel.com/translations/literal,value,en,GB,Value (GB)
+http://www.brel.com/translations/literal,value,de,CH,Wert
+"""
+
+
+def __create_translation_service(tmp_path) -> TranslationService:
+    translations_path = tmp_path / "translations.csv"
+    translations_path.write_text(TRANSLATIONS_CSV, encoding="utf-8")
+
+    translation_service = TranslationService()
+    translation_service.load_from_csv(str(translations_path))
+    return translation_service
+
+
+def test_translations_by_language(tmp_path):
+    translation_service = __create_translation_service(tmp_path)
+
+    assert (
+        translation_service.get("literal:value", ["EN-gb"]) == "Value (GB)"
+    ), "Expected language tags to be compared case-insensitively"
+    assert (
+        translation_service.get("literal:value", ["fr-FR", "de-CH"]) == "Wert"
+    ), "Expected the next language to be used as a fallback"
+    with pytest.raises(KeyError):
+        translation_service.get("literal:value", ["de"])
+
+    # switching the locale matching has to invalidate the resolved translations
+    translation_service.set_match_locale(False)
+    assert (
+        translation_service.get("literal:value", ["de"]) == "Wert"
+    ), "Expected the locale to be ignored"
+    assert (
+        translation_service.get("literal:value", ["EN-gb"]) == "Value"
+    ), "Expected the first translation of the language to be used"
+
+    translation_service.set_match_locale(True)
+    assert (
+        translation_service.get("literal:value", ["EN-gb"]) == "Value (GB)"
+    ), "Expected the locale to be matched again"
+
+
+def test_labels_by_language(tmp_path):
+    translation_service = __create_translation_service(tmp_path)
+    first_labels = [
+        BrelLabel("Assets", "label", "en-US"),
+        BrelLabel("Aktiven", "label", "de-CH"),
+    ]
+    second_labels = [BrelLabel("Liabilities", "label", "en-US")]
+
+    assert (
+        translation_service.get_from_labels(first_labels, ["en-us"]) == "Assets"
+    ), "Expected the label of the language"
+    assert (
+        translation_service.get_from_labels(second_labels, ["en-us"]) == "Liabilities"
+    ), "Expected resolved labels not to be shared between label lists"
+    assert (
+        translation_service.get_from_labels(second_labels, ["de-CH", ""], "Default")
+        == "Default"
+    ), "Expected the default label for the empty language"
+    with pytest.raises(ValueError):
+        translation_service.get_from_labels(second_labels, ["de-CH"])
+
+    translation_service.set_match_locale(False)
+    assert (
+        translation_service.get_from_labels(first_labels, ["de"]) == "Aktiven"
+    ), "Expected the locale to be ignored"
+
+
+def test_labels_of_report_element(tmp_path):
+    translation_service = __create_translation_service(tmp_path)
+    member = Member(
+        QName("https://example.com", "ex", "FooMember"),
+        None,
+        [BrelLabel("Foo", "label", "en-US")],
+    )
+    other_member = Member(
+        QName("https://example.com", "ex", "BarMember"),
+        None,
+        [BrelLabel("Bar", "label", "en-US")],
+    )
+
+    assert (
+        translation_service.get_from_labels(
+            member.get_label_index(), ["de-CH", "EN-us"]
+        )
+        == "Foo"
+    ), "Expected the label of the next language"
+    assert (
+        translation_service.get_from_labels(
+            other_member.get_label_index(), ["de-CH", "EN-us"]
+        )
+        == "Bar"
+    ), "Expected resolved labels not to be shared between report elements"
+
+    # labels that are added later are indexed as well and are not hidden by a resolved label
+    member._add_label(BrelLabel("Fuu", "label", "de-CH"))
+    assert (
+        translation_service.get_from_labels(
+            member.get_label_index(), ["de-CH", "EN-us"]
+        )
+        == "Fuu"
+    ), "Expected the added label to be found"
+    assert [str(label) for label in member.get_labels()] == [
+        "Foo",
+        "Fuu",
+    ], "Expected the added label to be part of the labels"
+
+    label = translation_service.get_label_with_language(
+        member.get_label_index(), "de", BrelLabel("Default", "", "")
+    )
+    assert label is None, "Expected no label for the language without its locale"
+    translation_service.set_match_locale(False)
+    label = translation_service.get_label_with_language(
+        member.get_label_index(), "de", BrelLabel("Default", "", "")
+    )
+    assert (
+        label is not None and str(label) == "Fuu"
+    ), "Expected the locale to be ignored"
@@ -0,0 +1,95 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import socket
+
+import pytest
+from requests import Session
+
+from brel.data.errors.compact_error_repository import CompactErrorRepository
+from brel.data.factory import create_uri_rewrite_repository, create_xml_repository
+from brel.data.file.blob_file_repository import BlobFileRepository
+from brel.services.factory import create_xml_file_parser_resolver
+from brel.services.file.file_service import FileService
+from brel.services.file.host_rate_limiter import HostRateLimiter
+from brel.services.xml.xml_service import XMLService
+
+PART_COUNT = 40
+
+
+def __get_closed_port() -> int:
+    # the port is released again, so connections to it are refused
+    with socket.socket() as closed_socket:
+        closed_socket.bind(("127.0.0.1", 0))
+        return closed_socket.getsockname()[1]
+
+
+def __write_schema(path, imports: list[str]) -> None:
+    import_elements = "".join(
+        f'<xs:import namespace="http://foo/{index}" schemaLocation="{location}"/>'
+        for index, location in enumerate(imports)
+    )
+    path.write_text(
+        f'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">{import_elements}</xs:schema>',
+        encoding="utf-8",
+    )
+
+
+def test_concurrent_dts_discovery_with_failing_uri(tmp_path):
+    dts_path = tmp_path / "dts"
+    dts_path.mkdir()
+    port = __get_closed_port()
+
+    # the references of a file are loaded in sorted order, so the parts are added before the missing file fails
+    part_names = [f"concepts{index:02}.xsd" for index in range(PART_COUNT)]
+    missing_uri = f"http://127.0.0.1:{port}/missing.xsd"
+    for part_name in part_names:
+        __write_schema(dts_path / part_name, [])
+    __write_schema(dts_path / "root.xsd", part_names + [missing_uri])
+
+    file_repository = BlobFileRepository(str(tmp_path / "cache"), max_size=10**9)
+    error_repository = CompactErrorRepository()
+    file_service = FileService(
+        file_repository,
+        error_repository,
+        Session(),
+        HostRateLimiter({}),
+        max_retries=0,
+    )
+    xml_repository = create_xml_repository()
+    xml_service = XMLService(
+        file_service,
+        xml_repository,
+        create_uri_rewrite_repository(),
+        create_xml_file_parser_resolver(),
+        max_workers=8,
+    )
+
+    # the missing file is not in the cache after its download failed
+    with pytest.raises(FileNotFoundError):
+        xml_service.add_etree_recursive(str(dts_path / "root.xsd"))
+
+    errors = error_repository.get_all()
+    assert (
+        len(errors) == 1
+    ), f"Expected one error for the missing file, got {len(errors)}"
+    assert (
+        missing_uri in errors[0].get_message()
+    ), f"Expected the missing file in the error, got {errors[0].get_message()}"
+    assert errors[0].get_count() == 1, "Expected the missing file to be reported once"
+
+    for part_name in part_names:
+        part_path = str(dts_path / part_name)
+        assert file_repository.has_file(
+            part_path
+        ), f"Expected {part_name} to be cached by the workers"
+        assert xml_repository.has_etree(
+            part_path
+        ), f"Expected {part_name} to be added to the XML repository"
@@ -0,0 +1,85 @@
+"""
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import os
+import zipfile
+
+from brel import Filing
+from brel.contexts.factory import create_filing_context
+
+ETE_FILING_PATH = "tests/end_to_end_tests/hand_made_report/ete_filing"
+
+
+def test_filing_open_zip(tmp_path):
+    zip_path = str(tmp_path / "ete_filing.zip")
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        for file_name in os.listdir(ETE_FILING_PATH):
+            archive.write(
+                os.path.join(ETE_FILING_PATH, file_name), f"ete_filing/{file_name}"
+            )
+
+    zipped_filing = Filing.open(zip_path)
+    folder_filing = Filing.open(ETE_FILING_PATH)
+
+    assert len(zipped_filing.get_all_facts()) == len(
+        folder_filing.get_all_facts()
+    ), "Expected the zipped filing to have the same facts as the folder"
+    assert len(zipped_filing.get_all_report_elements()) == len(
+        folder_filing.get_all_report_elements()
+    ), "Expected the zipped filing to have the same report elements as the folder"
+    assert not os.path.exists(
+        tmp_path / "ete_filing"
+    ), "Expected the zip file not to be extracted"
+
+
+def test_taxonomy_package_catalog(tmp_path):
+    package_path = str(tmp_path / "taxonomy.zip")
+    with zipfile.ZipFile(package_path, "w") as archive:
+        archive.writestr(
+            "taxonomy/META-INF/catalog.xml",
+            """<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">
+                <rewriteURI uriStartString="http://example.com/taxonomy/" rewritePrefix="../example.com/taxonomy/"/>
+            </catalog>""",
+        )
+        archive.writestr(
+            "taxonomy/example.com/taxonomy/taxonomy.xsd",
+            """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="http://example.com/taxonomy">
+                <xs:include schemaLocation="types/types.xsd"/>
+            </xs:schema>""",
+        )
+        archive.writestr(
+            "taxonomy/example.com/taxonomy/types/types.xsd",
+            """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="http://example.com/taxonomy"/>""",
+        )
+
+    instance_path = str(tmp_path / "instance.xml")
+    with open(instance_path, "w") as instance_file:
+        instance_file.write(
+            """<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+                <link:schemaRef xlink:type="simple" xlink:href="http://example.com/taxonomy/taxonomy.xsd"/>
+            </xbrli:xbrl>"""
+        )
+
+    context = create_filing_context([instance_path], [package_path])
+    uris = context.get_xml_service().get_all_uris()
+
+    package_uri = package_path.replace("\\", "/")
+    assert (
+        f"{package_uri}/taxonomy/example.com/taxonomy/taxonomy.xsd" in uris
+    ), f"Expected the schema to be read from the package, got {uris}"
+    assert (
+        f"{package_uri}/taxonomy/example.com/taxonomy/types/types.xsd" in uris
+    ), f"Expected relative references to resolve inside the package, got {uris}"
+    assert not any(
+        uri.startswith("http") for uri in uris
+    ), "Expected nothing to be downloaded"
+    assert (
+        len(context.get_error_repository().get_all()) == 0
+    ), "Expected no errors while loading the DTS"
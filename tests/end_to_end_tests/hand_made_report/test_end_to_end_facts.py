@@ -76,6 +76,39 @@ def test_end_to_end_calculation():
     ), "Bad calculation network is aggregation consistent"
 
 
+def test_end_to_end_calculation_inconsistencies():
+    """
+    Tests that all inconsistencies of the end-to-end filing are reported
+    """
+    filing = Filing.open("tests/end_to_end_tests/hand_made_report/ete_filing")
+    components = filing.get_all_components()
+    calculation_networks = [
+        cast(CalculationNetwork, component.get_calculation_network())
+        for component in components
+        if component.get_calculation_network() is not None
+    ]
+    facts = filing.get_all_facts()
+
+    good_inconsistencies = calculation_networks[0].get_aggregation_inconsistencies(
+        facts
+    )
+    assert (
+        good_inconsistencies == []
+    ), f"Expected no inconsistencies, got {good_inconsistencies}"
+
+    bad_inconsistencies = calculation_networks[1].get_aggregation_inconsistencies(facts)
+    assert len(bad_inconsistencies) > 0, "Expected inconsistencies in the bad network"
+    for inconsistency in bad_inconsistencies:
+        assert (
+            inconsistency.get_reported_value() != inconsistency.get_computed_value()
+        ), f"Expected the values of {inconsistency} to differ"
+
+    all_inconsistencies = filing.get_calculation_inconsistencies()
+    assert len(all_inconsistencies) == len(
+        bad_inconsistencies
+    ), f"Expected {len(bad_inconsistencies)} inconsistencies, got {len(all_inconsistencies)}"
+
+
 if __name__ == "__main__":
     test_end_to_end_fact_f013()
     test_end_to_end_calculation()
@@ -0,0 +1,104 @@
+"""
+Benchmarks combine_networks on roles that are split over many extended links.
+Every link adds one section below a shared root, like the statement roles of large filings.
+The time per link should stay roughly constant as the number of links grows.
+
+Run with `python -m tests.report_tests.network_merge_benchmark` from the root of the repository.
+
+====================
+
+- author: Robin Schmidiger
+- version: 0.1
+- date: 18 October 2026
+
+====================
+"""
+
+import time
+
+from brel import QName
+from brel.networks import INetwork, PresentationNetwork, PresentationNetworkNode
+from brel.parsers.utils.network_utils import combine_networks
+from brel.reportelements import Abstract
+
+LINK_COUNTS = [100, 200, 400, 800, 1600]
+SECTION_SIZE = 20
+REPETITIONS = 3
+
+LINK_ROLE = "http://foo/role/statement"
+PRESENTATION_LINK = QName(
+    "http://www.xbrl.org/2003/linkbase", "link", "presentationLink"
+)
+PRESENTATION_ARC = QName("http://www.xbrl.org/2003/linkbase", "link", "presentationArc")
+
+
+def create_node(
+    abstract: Abstract, children: list[PresentationNetworkNode], order: float = 1
+) -> PresentationNetworkNode:
+    return PresentationNetworkNode(
+        abstract,
+        children,
+        "http://www.xbrl.org/2003/arcrole/parent-child",
+        PRESENTATION_ARC,
+        LINK_ROLE,
+        PRESENTATION_LINK,
+        None,
+        order,
+    )
+
+
+def create_networks(link_count: int) -> list[INetwork]:
+    """
+    Every link repeats the shared root and adds a section with its own line items.
+    """
+    root = Abstract(QName("http://foo", "foo", "StatementAbstract"), None, [])
+    networks: list[INetwork] = []
+    for link_index in range(link_count):
+        section = Abstract(
+            QName("http://foo", "foo", f"Section{link_index}Abstract"), None, []
+        )
+        line_items = [
+            create_node(
+                Abstract(
+                    QName("http://foo", "foo", f"Section{link_index}Item{item_index}"),
+                    None,
+                    [],
+                ),
+                [],
+                item_index,
+            )
+            for item_index in range(SECTION_SIZE)
+        ]
+        section_node = create_node(section, line_items, link_index)
+        networks.append(
+            PresentationNetwork(
+                [create_node(root, [section_node])], LINK_ROLE, PRESENTATION_LINK, False
+            )
+        )
+    return networks
+
+
+def benchmark(link_count: int) -> float:
+    """
+    :returns float: the fastest time of combining the networks in seconds.
+    """
+    times = []
+    for _ in range(REPETITIONS):
+        networks = create_networks(link_count)
+        start = time.perf_counter()
+        combine_networks(networks)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{'links':>8} {'total [ms]':>12} {'per link [us]':>15}")
+    for link_count in LINK_COUNTS:
+        elapsed = benchmark(link_count)
+        print(
+            f"{link_count:>8} {elapsed * 1000:>12.2f} {elapsed / link_count * 1e6:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
+from io import BytesIO
+
 from lxml import etree
 
-from brel.parsers.utils.lxml_utils import get_all_nsmaps, get_str_attribute
+from brel.parsers.utils.lxml_utils import (
+    clear_xpath_cache,
+    find_elements,
+    get_all_nsmaps,
+    get_str_attribute,
+    get_xpath_cache_info,
+    parse_xml_with_namespaces,
+)
 
 
 def test_get_str():
@@ -32,3 +41,51 @@ def test_get_all_nsmaps():
     assert any(
         "bar" in nsmap for nsmap in nsmaps
     ), "Expected 'bar' to be in one of the nsmaps"
+
+
+def test_parse_xml_with_namespaces():
+    xml_str = b"""<root xmlns='http://www.default.com' xmlns:foo='http://www.foo.com'>
+        <child xmlns:bar='http://www.bar.com'>
+            <grandchild xmlns:foo='http://www.foo.com'/>
+        </child>
+        <child xmlns:foo='http://www.other-foo.com'/>
+    </root>"""
+
+    etree, namespaces = parse_xml_with_namespaces(BytesIO(xml_str))
+
+    assert (
+        etree.getroot().tag == "{http://www.default.com}root"
+    ), "Expected the root to be parsed"
+    assert namespaces == [
+        ("foo", "http://www.foo.com"),
+        ("bar", "http://www.bar.com"),
+        ("foo", "http://www.other-foo.com"),
+    ], f"Expected the distinct prefixed declarations in document order, got {namespaces}"
+
+
+def test_find_elements_xpath_cache():
+    element = etree.fromstring(
+        "<root xmlns:foo='http://www.foo.com'><foo:child/><foo:child/></root>"
+    )
+    clear_xpath_cache()
+
+    for _ in range(3):
+        children = find_elements(element, ".//foo:child")
+        assert len(children) == 2, f"Expected 2 children, got {len(children)}"
+
+    cache_info = get_xpath_cache_info()
+    assert cache_info["misses"] == 1, "Expected the query to be compiled once"
+    assert cache_info["hits"] == 2, "Expected the compiled query to be reused"
+    assert cache_info["size"] == 1, "Expected one cached query"
+
+    precompiled = etree.XPath(".//foo:child", namespaces={"foo": "http://www.foo.com"})
+    assert (
+        len(find_elements(element, precompiled)) == 2
+    ), "Expected the precompiled query to find 2 children"
+    assert (
+        get_xpath_cache_info()["size"] == 1
+    ), "Expected precompiled queries to bypass the cache"
+
+    assert (
+        find_elements(element, ".//bar:child") == []
+    ), "Expected an undefined prefix to return no elements"
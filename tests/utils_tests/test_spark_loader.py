@@ -0,0 +1,90 @@
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pyspark import sql
+
+from brel import Filing
+from brel.brel_fact_table import create_fact_table_arrow_table, create_fact_table_df
+from brel.services.translation.translation_service import TranslationService
+from brel.utils.spark_loader import FACT_ROW_SCHEMA, iter_fact_rows
+
+ETE_FILING = "tests/end_to_end_tests/hand_made_report/ete_filing"
+
+
+def test_iter_fact_rows():
+    rows = list(iter_fact_rows([ETE_FILING]))
+    facts = Filing.open(ETE_FILING).get_all_facts()
+
+    assert len(rows) == len(facts), f"Expected {len(facts)} rows, got {len(rows)}"
+    assert all(
+        len(row) == len(FACT_ROW_SCHEMA.fields) for row in rows
+    ), "Expected every row to match the schema"
+
+    rows_by_id = {row[1]: row for row in rows}
+    balance = rows_by_id["f-001"]
+    assert balance[0] == ETE_FILING, f"Expected the filing path, got {balance[0]}"
+    assert balance[2] == "ete:balance", f"Expected ete:balance, got {balance[2]}"
+    assert balance[5] == "USD", f"Expected USD, got {balance[5]}"
+    assert balance[7] == 1000.0, f"Expected 1000.0, got {balance[7]}"
+    assert balance[8] == {}, f"Expected no dimensions, got {balance[8]}"
+
+    # f-013 reports against a string concept with a dimension
+    dimensional = rows_by_id["f-013"]
+    assert dimensional[7] is None, f"Expected no numeric value, got {dimensional[7]}"
+    assert dimensional[8] == {
+        "ete:additional_explicit_dimension": "ete:foo_member"
+    }, f"Expected one dimension, got {dimensional[8]}"
+
+
+def test_fact_table_arrow_table():
+    facts = Filing.open(ETE_FILING).get_all_core_facts()
+    df = create_fact_table_df(facts, [[]], TranslationService(), False)
+    table = create_fact_table_arrow_table(facts, [[]], TranslationService(), False)
+
+    assert table.column_names == list(
+        df.columns
+    ), f"Expected the columns {list(df.columns)}, got {table.column_names}"
+    assert table.num_rows == len(df), f"Expected {len(df)} rows, got {table.num_rows}"
+    assert (
+        table.schema.field("value").type == pa.float64()
+    ), f"Expected a double value column, got {table.schema.field('value').type}"
+    assert (
+        table.schema.field("concept").type == pa.string()
+    ), f"Expected a string concept column, got {table.schema.field('concept').type}"
+
+    values = sorted(
+        value for value in table.column("value").to_pylist() if value is not None
+    )
+    pandas_values = sorted(value for value in df["value"] if pd.notna(value))
+    assert values == pandas_values, f"Expected the values {pandas_values}, got {values}"
+
+
+def test_fact_table_spark_df():
+    if shutil.which("java") is None:
+        pytest.skip("Spark needs a Java runtime")
+
+    spark = sql.SparkSession.builder.master("local[1]").getOrCreate()
+    arrow_enabled = spark.conf.get("spark.sql.execution.arrow.pyspark.enabled", None)
+
+    filing = Filing.open(ETE_FILING)
+    df = filing.generate_core_fact_table_pandas_df(allow_mixed=True)
+    spark_df, _ = filing.generate_core_fact_table_spark_df(allow_mixed=True)
+
+    assert spark_df.columns == list(
+        df.columns
+    ), f"Expected the columns {list(df.columns)}, got {spark_df.columns}"
+    assert spark_df.count() == len(df), f"Expected {len(df)} rows"
+    assert (
+        spark.conf.get("spark.sql.execution.arrow.pyspark.enabled", None)
+        == arrow_enabled
+    ), "Expected the Spark configuration to be unchanged"
+
+    spark_values = sorted(
+        (row["Value"] for row in spark_df.collect() if row["Value"] is not None)
+    )
+    pandas_values = sorted(value for value in df["Value"] if pd.notna(value))
+    assert (
+        spark_values == pandas_values
+    ), f"Expected the values {pandas_values}, got {spark_values}"